@@ -416,12 +416,25 @@ class CustomerStatsAdmin(ModelAdmin):
         return False
 
     def get_queryset(self, request):
+        from apps.orders.models import OrderStatus
+
+        # Read from the replica when configured (see apps.core.db_router)
         qs = super().get_queryset(request)
         # Exclude staff users - only show customers
         qs = qs.filter(is_staff=False)
         # Annotate with aggregated data
         qs = qs.annotate(
             _orders_count=Count('orders', distinct=True),
+            _done_orders=Count(
+                'orders',
+                filter=Q(orders__status=OrderStatus.DONE),
+                distinct=True,
+            ),
+            _cancelled_orders=Count(
+                'orders',
+                filter=Q(orders__status=OrderStatus.CANCELLED),
+                distinct=True,
+            ),
             _total_spent=Sum('orders__total'),
             _last_activity=Max('analytics_events__created_at'),
             _product_views=Count(
@@ -509,10 +522,9 @@ class CustomerStatsAdmin(ModelAdmin):
     def show_orders_summary(self, obj):
         orders_count = getattr(obj, '_orders_count', 0)
         if orders_count > 0:
-            # Get order statuses breakdown
-            from apps.orders.models import OrderStatus
-            done_count = obj.orders.filter(status=OrderStatus.DONE).count()
-            cancelled_count = obj.orders.filter(status=OrderStatus.CANCELLED).count()
+            # Разбивка по статусам посчитана в get_queryset (без запросов на строку)
+            done_count = obj._done_orders
+            cancelled_count = obj._cancelled_orders
             active_count = orders_count - done_count - cancelled_count
 
             parts = []
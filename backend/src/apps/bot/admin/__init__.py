@@ -1,7 +1,7 @@
 from django.contrib import admin
 from unfold.admin import ModelAdmin, TabularInline
 
-from apps.bot.models import Broadcast, BroadcastLog, BotAdmin
+from apps.bot.models import AudienceSegmentMember, Broadcast, BroadcastLog, BotAdmin, TaskOutbox
 
 
 class BroadcastLogInline(TabularInline):
@@ -78,6 +78,28 @@ class BroadcastLogAdmin(ModelAdmin):
     readonly_fields = ['broadcast', 'user', 'telegram_id', 'status', 'error_message', 'sent_at', 'created_at']
 
 
+@admin.register(AudienceSegmentMember)
+class AudienceSegmentMemberAdmin(ModelAdmin):
+    list_display = ['segment', 'user', 'telegram_id', 'created_at']
+    list_filter = ['segment']
+    search_fields = ['telegram_id', 'user__telegram_username']
+    list_select_related = ['user']
+    readonly_fields = ['segment', 'user', 'telegram_id', 'created_at']
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(TaskOutbox)
+class TaskOutboxAdmin(ModelAdmin):
+    list_display = ['id', 'task_name', 'created_at']
+    list_filter = ['task_name']
+    readonly_fields = ['task_name', 'kwargs', 'created_at']
+
+    def has_add_permission(self, request):
+        return False
+
+
 @admin.register(BotAdmin)
 class BotAdminAdmin(ModelAdmin):
     list_display = ['username', 'telegram_id', 'first_name', 'is_active', 'created_at']
@@ -5,3 +5,6 @@ class BotConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.bot'
     verbose_name = 'Telegram Bot'
+
+    def ready(self):
+        import apps.bot.signals  # noqa: F401
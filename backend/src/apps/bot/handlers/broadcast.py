@@ -5,11 +5,8 @@ Uses database for conversation state (webhook-compatible).
 """
 import logging
 import re
-from datetime import timedelta
-
-from asgiref.sync import sync_to_async
-from django.db.models import Count, Q
-from django.utils import timezone
+from django.db.models import Q
+from django.db.models.functions import Lower
 
 from telegram import ReplyKeyboardMarkup, ReplyKeyboardRemove, Update
 from telegram.ext import CommandHandler, ContextTypes, MessageHandler, filters
@@ -96,50 +93,49 @@ def get_audience_queryset(audience_type: str):
     """
     Get queryset of users for a given audience type.
 
-    Returns QuerySet of User objects with telegram_id.
+    Returns QuerySet of User objects with telegram_id. Predefined segments
+    are read from the precomputed AudienceSegmentMember table
+    (rules: apps.bot.services.segments.segment_rule_queryset).
     """
-    from apps.orders.models import OrderStatus
+    from apps.bot.services.segments import STORED_SEGMENTS
 
     base = User.objects.filter(telegram_id__isnull=False)
 
     if audience_type == BroadcastAudience.ALL:
         return base
 
-    elif audience_type == BroadcastAudience.CUSTOMERS:
-        # Users with at least one confirmed or done order
-        return base.filter(
-            orders__status__in=[OrderStatus.CONFIRMED, OrderStatus.DONE]
-        ).distinct()
+    if audience_type in STORED_SEGMENTS:
+        return base.filter(audience_segments__segment=audience_type)
 
-    elif audience_type == BroadcastAudience.VIP:
-        # Users with 2+ done orders
-        return base.annotate(
-            done_orders=Count('orders', filter=Q(orders__status=OrderStatus.DONE))
-        ).filter(done_orders__gte=2)
+    return base.none()
 
-    elif audience_type == BroadcastAudience.NEW:
-        # Registered in last 7 days
-        week_ago = timezone.now() - timedelta(days=7)
-        return base.filter(date_joined__gte=week_ago)
 
-    elif audience_type == BroadcastAudience.INACTIVE:
-        # Last login more than 30 days ago
-        month_ago = timezone.now() - timedelta(days=30)
-        return base.filter(last_login__lt=month_ago)
+def get_users_by_usernames(usernames: list[str]):
+    """
+    Get queryset of users with telegram_id matching any of the usernames.
 
-    return base.none()
+    Usernames are lowercased once and matched with a single IN query:
+    telegram_username is stored lowercase (plain index), username is
+    compared via lower() (functional index users_user_username_lower_idx).
+    """
+    names = {u.lstrip('@').lower() for u in usernames if u}
+    if not names:
+        return User.objects.none()
+
+    return (
+        User.objects
+        .annotate(username_lower=Lower('username'))
+        .filter(
+            Q(telegram_username__in=names) | Q(username_lower__in=names),
+            telegram_id__isnull=False,
+        )
+    )
 
 
-@sync_to_async
-def _get_audience_counts() -> dict[str, int]:
-    """Get counts for each audience type."""
-    return {
-        'all': get_audience_queryset(BroadcastAudience.ALL).count(),
-        'customers': get_audience_queryset(BroadcastAudience.CUSTOMERS).count(),
-        'vip': get_audience_queryset(BroadcastAudience.VIP).count(),
-        'new': get_audience_queryset(BroadcastAudience.NEW).count(),
-        'inactive': get_audience_queryset(BroadcastAudience.INACTIVE).count(),
-    }
+async def _get_audience_counts() -> dict[str, int]:
+    """Get counts for each audience type (cached, see services.audience)."""
+    from apps.bot.services.audience import aget_audience_counts
+    return await aget_audience_counts()
 
 
 async def _get_audience_keyboard() -> ReplyKeyboardMarkup:
@@ -174,33 +170,29 @@ def _parse_audience_choice(text: str) -> str | None:
     return None
 
 
-@sync_to_async
-def _find_users_by_usernames(usernames: list[str]) -> tuple[list[dict], list[str]]:
+async def _find_users_by_usernames(usernames: list[str]) -> tuple[list[dict], list[str]]:
     """
     Find users by their telegram usernames.
     Returns (found_users, not_found_usernames).
+
+    One query for the whole list; the found/not-found split is done in memory.
     """
-    from django.db.models import Q
+    rows = get_users_by_usernames(usernames).values(
+        'id', 'telegram_id', 'telegram_username', 'username',
+    )
 
     found = []
-    not_found = []
-
-    for username in usernames:
-        # Search in both telegram_username and username fields
-        user = User.objects.filter(
-            Q(telegram_username__iexact=username) | Q(username__iexact=username),
-            telegram_id__isnull=False,
-        ).first()
-
-        if user:
-            found.append({
-                'id': user.id,
-                'telegram_id': user.telegram_id,
-                'username': user.telegram_username or user.username,
-            })
-        else:
-            not_found.append(username)
-
+    matched = set()
+    async for row in rows:
+        found.append({
+            'id': row['id'],
+            'telegram_id': row['telegram_id'],
+            'username': row['telegram_username'] or row['username'],
+        })
+        matched.add((row['telegram_username'] or '').lower())
+        matched.add(row['username'].lower())
+
+    not_found = [u for u in usernames if u.lower() not in matched]
     return found, not_found
 
 
@@ -324,8 +316,7 @@ async def _handle_choose_audience(update: Update, user_id: int, data: dict) -> N
     )
 
 
-@sync_to_async
-def _get_recipients_for_audience(audience_type: str) -> list[dict]:
+async def _get_recipients_for_audience(audience_type: str) -> list[dict]:
     """Get recipients list for a predefined audience type."""
     queryset = get_audience_queryset(audience_type)
     users = queryset.values('id', 'telegram_id', 'telegram_username', 'username')
@@ -336,7 +327,7 @@ def _get_recipients_for_audience(audience_type: str) -> list[dict]:
             'telegram_id': u['telegram_id'],
             'username': u['telegram_username'] or u['username'] or '',
         }
-        for u in users
+        async for u in users
     ]
 
 
@@ -580,7 +571,7 @@ async def _handle_confirm(update: Update, user_id: int, data: dict) -> None:
     recipients_usernames = data.get('recipients_usernames', [])
     audience_type = data.get('audience_type', BroadcastAudience.CUSTOM)
 
-    broadcast = await sync_to_async(Broadcast.objects.create)(
+    broadcast = await Broadcast.objects.acreate(
         audience_type=audience_type,
         recipients_usernames=recipients_usernames,
         content_type=data['content_type'],
@@ -640,14 +631,11 @@ def get_broadcast_handler():
                 return True
 
             # Handle messages from users in broadcast conversation
+            # (cache-only lookup: this runs inside the event loop). A wizard
+            # whose cache entry was evicted is not matched; /broadcast restarts it
             if update.effective_user:
-                # Check if user has active broadcast state
-                from apps.bot.models import ConversationState
-                state = ConversationState.objects.filter(
-                    user_id=update.effective_user.id,
-                    state__startswith='broadcast_'
-                ).first()
-                return state is not None
+                state = ConversationState.peek_state(update.effective_user.id)
+                return bool(state and state.startswith('broadcast_'))
 
             return False
 
@@ -3,7 +3,6 @@ Start command handler.
 """
 import logging
 
-from asgiref.sync import sync_to_async
 from django.conf import settings
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update, WebAppInfo
 from telegram.ext import ContextTypes
@@ -13,10 +12,9 @@ from apps.users.models import User
 logger = logging.getLogger(__name__)
 
 
-@sync_to_async
-def _get_or_create_user(telegram_id: int, username: str | None, first_name: str | None) -> tuple[User, bool]:
+async def _get_or_create_user(telegram_id: int, username: str | None, first_name: str | None) -> tuple[User, bool]:
     """Get or create user by telegram_id and update username."""
-    user, created = User.objects.get_or_create(
+    user, created = await User.objects.aget_or_create(
         telegram_id=telegram_id,
         defaults={
             'username': f'tg_{telegram_id}',
@@ -28,17 +26,17 @@ def _get_or_create_user(telegram_id: int, username: str | None, first_name: str
 
     # Update username / reactivate if needed
     if not created:
-        update_fields = []
+        changes = {}
         if username:
             username_lower = username.lower()
             if user.telegram_username != username_lower:
-                user.telegram_username = username_lower
-                update_fields.append('telegram_username')
+                changes['telegram_username'] = username_lower
         if not user.is_active:
-            user.is_active = True
-            update_fields.append('is_active')
-        if update_fields:
-            user.save(update_fields=update_fields)
+            changes['is_active'] = True
+        if changes:
+            await User.objects.filter(pk=user.pk).aupdate(**changes)
+            for field, value in changes.items():
+                setattr(user, field, value)
 
     return user, created
 
@@ -0,0 +1,98 @@
+"""
+Django management command to benchmark bot webhook throughput.
+
+POSTs synthetic Telegram updates concurrently to WebhookView of a running
+server and prints updates/s and latency percentiles. Each update is a plain
+text message from a distinct synthetic user, so the handlers do the
+conversation state lookup and send nothing back to Telegram.
+
+Run the server under uvicorn (SERVER_MODE=asgi) with a valid
+TELEGRAM_BOT_TOKEN: the webhook initializes the bot (getMe) on every
+update. To compare with the sync_to_async thread-hop implementation,
+start the server from the commit before the async handlers and run the
+same command against both:
+
+    python manage.py bench_bot_handlers --base-url http://localhost:8000 --updates 5000 --concurrency 100
+"""
+import asyncio
+import statistics
+import time
+
+import httpx
+from django.core.management.base import BaseCommand, CommandError
+
+WEBHOOK_PATH = '/api/bot/webhook/'
+# Synthetic ids far from real Telegram ids
+BASE_USER_ID = 9_000_000_000
+
+
+def make_update(n: int, users: int, text: str) -> dict:
+    """Telegram update with a private text message from one of `users` synthetic users."""
+    user_id = BASE_USER_ID + n % users
+    return {
+        'update_id': n,
+        'message': {
+            'message_id': n,
+            'date': int(time.time()),
+            'chat': {'id': user_id, 'type': 'private'},
+            'from': {'id': user_id, 'is_bot': False, 'first_name': 'Bench'},
+            'text': text,
+        },
+    }
+
+
+class Command(BaseCommand):
+    """Benchmark concurrent webhook updates against a running server."""
+
+    help = 'Benchmark bot webhook throughput: updates/s and latency (p50/p95/p99) under concurrent POSTs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://localhost:8000', help='Server address')
+        parser.add_argument('--updates', type=int, default=2000, help='Updates per run')
+        parser.add_argument('--concurrency', type=int, default=50, help='Updates in flight')
+        parser.add_argument('--users', type=int, default=500, help='Distinct telegram ids')
+        parser.add_argument('--text', default='hello', help='Message text of each update')
+
+    def handle(self, *args, **options):
+        latencies, errors, elapsed = asyncio.run(self._run(options))
+
+        if not latencies:
+            raise CommandError('No update was processed (is TELEGRAM_BOT_TOKEN set on the server?)')
+
+        quantiles = statistics.quantiles(latencies, n=100)
+        self.stdout.write(f"Updates: {options['updates']}, concurrency: {options['concurrency']}")
+        self.stdout.write(f"Errors: {errors}")
+        self.stdout.write(f"Updates/s: {len(latencies) / elapsed:.0f}")
+        self.stdout.write(
+            f"Latency, ms: p50={quantiles[49]:.1f} p95={quantiles[94]:.1f} "
+            f"p99={quantiles[98]:.1f} max={max(latencies):.1f}"
+        )
+
+    async def _run(self, options) -> tuple[list[float], int, float]:
+        latencies = []
+        errors = 0
+        semaphore = asyncio.Semaphore(options['concurrency'])
+        limits = httpx.Limits(max_connections=options['concurrency'])
+
+        async with httpx.AsyncClient(base_url=options['base_url'], limits=limits, timeout=30) as client:
+
+            async def post(n: int) -> None:
+                nonlocal errors
+                update = make_update(n, options['users'], options['text'])
+                async with semaphore:
+                    started = time.perf_counter()
+                    try:
+                        response = await client.post(WEBHOOK_PATH, json=update)
+                    except httpx.HTTPError:
+                        errors += 1
+                        return
+                    if response.status_code != 200:
+                        errors += 1
+                        return
+                    latencies.append((time.perf_counter() - started) * 1000)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(post(n) for n in range(options['updates'])))
+            elapsed = time.perf_counter() - started
+
+        return latencies, errors, elapsed
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.10 on 2026-10-19 04:55
+
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+from django.utils import timezone
+
+
+def populate_segments(apps, schema_editor):
+    """Initial fill of segment membership (same rules as services.segments)."""
+    User = apps.get_model('users', 'User')
+    AudienceSegmentMember = apps.get_model('bot', 'AudienceSegmentMember')
+
+    now = timezone.now()
+    base = User.objects.filter(telegram_id__isnull=False)
+    rules = {
+        'customers': base.filter(orders__status__in=['confirmed', 'done']).distinct(),
+        'vip': base.annotate(
+            done_orders=Count('orders', filter=Q(orders__status='done'))
+        ).filter(done_orders__gte=2),
+        'new': base.filter(date_joined__gte=now - timedelta(days=7)),
+        'inactive': base.filter(last_login__lt=now - timedelta(days=30)),
+    }
+
+    for segment, queryset in rules.items():
+        AudienceSegmentMember.objects.bulk_create(
+            [
+                AudienceSegmentMember(segment=segment, user_id=user_id, telegram_id=telegram_id)
+                for user_id, telegram_id in queryset.values_list('id', 'telegram_id')
+            ],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bot', '0008_alter_broadcast_recipients_usernames'),
+        ('orders', '0003_add_order_uid'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AudienceSegmentMember',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('segment', models.CharField(choices=[('all', 'Всем'), ('customers', 'Покупателям'), ('vip', 'Постоянным клиентам'), ('new', 'Новым (7 дней)'), ('inactive', 'Неактивным (30+ дней)'), ('custom', 'По списку')], max_length=20, verbose_name='Сегмент')),
+                ('telegram_id', models.BigIntegerField(verbose_name='Telegram ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Добавлен')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='audience_segments', to=settings.AUTH_USER_MODEL, verbose_name='Пользователь')),
+            ],
+            options={
+                'verbose_name': 'Участник сегмента',
+                'verbose_name_plural': 'Участники сегментов',
+                'indexes': [models.Index(fields=['segment', 'telegram_id'], name='bot_segment_tg_idx')],
+                'constraints': [models.UniqueConstraint(fields=('segment', 'user'), name='bot_segment_member_unique')],
+            },
+        ),
+        migrations.RunPython(populate_segments, migrations.RunPython.noop),
+    ]
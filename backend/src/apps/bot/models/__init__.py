@@ -8,6 +8,8 @@ from apps.bot.models.broadcast import (
 )
 from apps.bot.models.admin import BotAdmin
 from apps.bot.models.conversation import ConversationState
+from apps.bot.models.segment import AudienceSegmentMember
+from apps.bot.models.outbox import TaskOutbox
 
 __all__ = [
     'Broadcast',
@@ -18,4 +20,6 @@ __all__ = [
     'BroadcastLogStatus',
     'BotAdmin',
     'ConversationState',
+    'AudienceSegmentMember',
+    'TaskOutbox',
 ]
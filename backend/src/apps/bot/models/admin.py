@@ -1,9 +1,25 @@
 """
 Bot admin model for managing Telegram bot administrators.
 """
-from django.db import models
+import threading
+import time
+
 from django.conf import settings
-from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import models, router
+
+ADMINS_VERSION_KEY = 'bot:admins:version'
+ADMINS_SNAPSHOT_KEY = 'bot:admins:v{version}'
+
+# Per-process copy of the active admins snapshot: (version, checked_at, snapshot)
+_local_snapshot = None
+_local_lock = threading.Lock()
+
+
+def _normalize_username(username: str) -> str:
+    """Lowercase username with leading @."""
+    username = username.lower()
+    return username if username.startswith('@') else f'@{username}'
 
 
 class BotAdmin(models.Model):
@@ -70,6 +86,141 @@ class BotAdmin(models.Model):
             self.username = f'@{self.username}'
         super().save(*args, **kwargs)
 
+    @classmethod
+    def active_admins(cls) -> dict:
+        """
+        Snapshot of active admins, normally without DB queries.
+
+        Returns dict with 'list' (field dicts), 'by_telegram_id' and
+        'by_username' (lowercase, with @). Cached in process for
+        BOT_ADMIN_CACHE_LOCAL_TTL seconds and in Redis under a version
+        number that is bumped after every committed BotAdmin save/delete.
+
+        queryset.update() and bulk operations send no signals: call
+        invalidate_cache() after them.
+        """
+        snapshot, version = cls._cached_snapshot()
+        if snapshot is None:
+            snapshot = cls._store_snapshot(version, list(cls._snapshot_queryset()))
+        return snapshot
+
+    @classmethod
+    async def aactive_admins(cls) -> dict:
+        """Snapshot of active admins (async cache API, async ORM on cache miss)."""
+        snapshot, version = await cls._acached_snapshot()
+        if snapshot is None:
+            rows = [row async for row in cls._snapshot_queryset()]
+            snapshot = cls._index(rows)
+            await cache.aset(
+                ADMINS_SNAPSHOT_KEY.format(version=version),
+                snapshot,
+                timeout=settings.BOT_ADMIN_CACHE_TTL,
+            )
+            cls._remember_local(version, snapshot)
+        return snapshot
+
+    @staticmethod
+    def _fresh_local():
+        """Process copy of the snapshot if it is younger than BOT_ADMIN_CACHE_LOCAL_TTL."""
+        local = _local_snapshot
+        if local and time.monotonic() - local[1] < settings.BOT_ADMIN_CACHE_LOCAL_TTL:
+            return local
+        return None
+
+    @staticmethod
+    def _remember_local(version: int, snapshot: dict | None) -> tuple[dict | None, int]:
+        """Keep a loaded snapshot in process memory."""
+        global _local_snapshot
+
+        if snapshot is not None:
+            with _local_lock:
+                _local_snapshot = (version, time.monotonic(), snapshot)
+        return snapshot, version
+
+    @classmethod
+    def _cached_snapshot(cls) -> tuple[dict | None, int]:
+        """
+        Snapshot from process memory or Redis.
+
+        Returns (snapshot, version); snapshot is None if it must be loaded.
+        """
+        if local := cls._fresh_local():
+            return local[2], local[0]
+
+        # Initial version is time-based so that a flushed cache never
+        # matches a version remembered by a running process
+        version = cache.get_or_set(ADMINS_VERSION_KEY, time.time_ns, timeout=None)
+        local = _local_snapshot
+        if local and local[0] == version:
+            return cls._remember_local(version, local[2])
+        return cls._remember_local(version, cache.get(ADMINS_SNAPSHOT_KEY.format(version=version)))
+
+    @classmethod
+    async def _acached_snapshot(cls) -> tuple[dict | None, int]:
+        """Async _cached_snapshot() (async cache API)."""
+        if local := cls._fresh_local():
+            return local[2], local[0]
+
+        version = await cache.aget_or_set(ADMINS_VERSION_KEY, time.time_ns, timeout=None)
+        local = _local_snapshot
+        if local and local[0] == version:
+            return cls._remember_local(version, local[2])
+        return cls._remember_local(version, await cache.aget(ADMINS_SNAPSHOT_KEY.format(version=version)))
+
+    @classmethod
+    def _snapshot_queryset(cls):
+        # All concrete fields: admins from the snapshot are complete instances
+        return cls.objects.filter(is_active=True).values(*[field.attname for field in cls._meta.concrete_fields])
+
+    @staticmethod
+    def _index(admins: list[dict]) -> dict:
+        """Snapshot of loaded admins with lookup indexes."""
+        return {
+            'list': admins,
+            'by_telegram_id': {a['telegram_id']: a for a in admins if a['telegram_id']},
+            'by_username': {_normalize_username(a['username']): a for a in admins},
+        }
+
+    @classmethod
+    def _store_snapshot(cls, version: int, admins: list[dict]) -> dict:
+        """Index loaded admins and cache them under the given version."""
+        snapshot = cls._index(admins)
+        cache.set(
+            ADMINS_SNAPSHOT_KEY.format(version=version),
+            snapshot,
+            timeout=settings.BOT_ADMIN_CACHE_TTL,
+        )
+        cls._remember_local(version, snapshot)
+        return snapshot
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """
+        Drop cached snapshots.
+
+        Called after commit of BotAdmin save/delete (apps.bot.signals):
+        bumped earlier, the new version could be filled from rows read
+        before the commit. queryset.update() skips signals — call it
+        explicitly after bulk changes.
+        """
+        global _local_snapshot
+
+        try:
+            cache.incr(ADMINS_VERSION_KEY)
+        except ValueError:
+            cache.set(ADMINS_VERSION_KEY, time.time_ns(), timeout=None)
+        with _local_lock:
+            _local_snapshot = None
+
+    @classmethod
+    def notification_chat_ids(cls) -> list[tuple[int, str]]:
+        """(telegram_id, username) of active admins that can receive messages."""
+        return [
+            (a['telegram_id'], a['username'])
+            for a in cls.active_admins()['list']
+            if a['telegram_id']
+        ]
+
     @classmethod
     def is_admin(cls, telegram_id: int = None, username: str = None) -> bool:
         """
@@ -77,41 +228,47 @@ class BotAdmin(models.Model):
 
         Checks by telegram_id first, then by username.
         """
-        if telegram_id:
-            if cls.objects.filter(telegram_id=telegram_id, is_active=True).exists():
-                return True
+        snapshot = cls.active_admins()
+
+        if telegram_id and telegram_id in snapshot['by_telegram_id']:
+            return True
 
         if username:
-            # Normalize username
-            if not username.startswith('@'):
-                username = f'@{username}'
-            return cls.objects.filter(username__iexact=username, is_active=True).exists()
+            return _normalize_username(username) in snapshot['by_username']
 
         return False
 
+    @classmethod
+    def _find(cls, snapshot: dict, telegram_id: int, username: str = None) -> 'BotAdmin | None':
+        """Find admin in snapshot by telegram_id, then by username."""
+        row = None
+
+        # Try by telegram_id first
+        if telegram_id:
+            row = snapshot['by_telegram_id'].get(telegram_id)
+
+        # Try by username if not found
+        if not row and username:
+            row = snapshot['by_username'].get(_normalize_username(username))
+
+        if not row:
+            return None
+        return cls.from_db(router.db_for_read(cls), list(row), list(row.values()))
+
     @classmethod
     def get_and_update(cls, telegram_id: int, username: str = None) -> 'BotAdmin | None':
         """
         Get admin and update telegram_id if needed (sync version).
 
         Called when admin uses a command - fills telegram_id if it was empty.
+        Lookups use the cached snapshot; only filling telegram_id writes to DB.
         """
-        admin = None
-
-        # Try by telegram_id first
-        if telegram_id:
-            admin = cls.objects.filter(telegram_id=telegram_id, is_active=True).first()
-
-        # Try by username if not found
-        if not admin and username:
-            if not username.startswith('@'):
-                username = f'@{username}'
-            admin = cls.objects.filter(username__iexact=username, is_active=True).first()
+        admin = cls._find(cls.active_admins(), telegram_id, username)
 
-            # Update telegram_id if found by username
-            if admin and not admin.telegram_id:
-                admin.telegram_id = telegram_id
-                admin.save(update_fields=['telegram_id'])
+        # Update telegram_id if found by username
+        if admin and not admin.telegram_id and telegram_id:
+            admin.telegram_id = telegram_id
+            admin.save(update_fields=['telegram_id'])
 
         return admin
 
@@ -122,4 +279,11 @@ class BotAdmin(models.Model):
 
         Called when admin uses a command - fills telegram_id if it was empty.
         """
-        return await sync_to_async(cls.get_and_update)(telegram_id, username)
+        admin = cls._find(await cls.aactive_admins(), telegram_id, username)
+
+        # Update telegram_id if found by username
+        if admin and not admin.telegram_id and telegram_id:
+            admin.telegram_id = telegram_id
+            await admin.asave(update_fields=['telegram_id'])
+
+        return admin
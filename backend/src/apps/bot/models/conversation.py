@@ -1,8 +1,23 @@
 """
 Conversation state model for storing bot conversation states in DB.
+
+Reads and writes go through the cache (Redis); the table is a durable
+copy updated in batches (write-behind, see flush_dirty()).
+
+Async helpers use the async cache API and the async ORM (only on a cache
+miss), so bot handlers never block the event loop on Redis or Postgres.
 """
+from django.conf import settings
+from django.core.cache import cache
 from django.db import models
-from asgiref.sync import sync_to_async
+from django.utils import timezone
+
+from apps.core.services import CacheQueue
+
+CONVERSATION_CACHE_PREFIX = 'bot:conversation'
+
+# telegram_ids whose cached state has not been written to the DB yet
+dirty_queue = CacheQueue(f'{CONVERSATION_CACHE_PREFIX}:dirty')
 
 
 class ConversationState(models.Model):
@@ -10,6 +25,9 @@ class ConversationState(models.Model):
     Store conversation state for users.
 
     Used instead of in-memory ConversationHandler state for webhook mode.
+
+    Users without a state are cached too (negative caching), so ordinary
+    users never touch Postgres here.
     """
 
     telegram_id = models.BigIntegerField(
@@ -39,49 +57,155 @@ class ConversationState(models.Model):
     def __str__(self):
         return f"{self.telegram_id}: {self.state}"
 
+    @staticmethod
+    def _cache_key(telegram_id: int) -> str:
+        return f'{CONVERSATION_CACHE_PREFIX}:{telegram_id}'
+
+    @classmethod
+    def _write(cls, telegram_id: int, state: str, data: dict) -> None:
+        """Store state in cache and schedule DB write."""
+        cache.set(
+            cls._cache_key(telegram_id),
+            (state, data),
+            timeout=settings.CONVERSATION_STATE_CACHE_TTL,
+        )
+        dirty_queue.push(telegram_id)
+
+    @classmethod
+    async def _awrite(cls, telegram_id: int, state: str, data: dict) -> None:
+        """Store state in cache and schedule DB write (async cache API)."""
+        await cache.aset(
+            cls._cache_key(telegram_id),
+            (state, data),
+            timeout=settings.CONVERSATION_STATE_CACHE_TTL,
+        )
+        await dirty_queue.apush(telegram_id)
+
+    @classmethod
+    def _remember(cls, telegram_id: int, row) -> tuple[str, dict]:
+        """Cache state loaded from DB (row is None if there is no state)."""
+        state, data = row if row else ('', {})
+        cache.set(
+            cls._cache_key(telegram_id),
+            (state, data),
+            timeout=settings.CONVERSATION_STATE_CACHE_TTL,
+        )
+        return state, data
+
+    @classmethod
+    async def _aremember(cls, telegram_id: int, row) -> tuple[str, dict]:
+        """Cache state loaded from DB (async cache API)."""
+        state, data = row if row else ('', {})
+        await cache.aset(
+            cls._cache_key(telegram_id),
+            (state, data),
+            timeout=settings.CONVERSATION_STATE_CACHE_TTL,
+        )
+        return state, data
+
     @classmethod
     def get_state(cls, telegram_id: int) -> tuple[str, dict]:
         """Get current state and data for user (sync)."""
-        obj, _ = cls.objects.get_or_create(telegram_id=telegram_id)
-        return obj.state, obj.data
+        cached = cache.get(cls._cache_key(telegram_id))
+        if cached is not None:
+            state, data = cached
+            return state, data
+
+        row = cls.objects.filter(telegram_id=telegram_id).values_list('state', 'data').first()
+        return cls._remember(telegram_id, row)
 
     @classmethod
     async def aget_state(cls, telegram_id: int) -> tuple[str, dict]:
         """Get current state and data for user (async)."""
-        return await sync_to_async(cls.get_state)(telegram_id)
+        cached = await cache.aget(cls._cache_key(telegram_id))
+        if cached is not None:
+            state, data = cached
+            return state, data
+
+        row = await cls.objects.filter(telegram_id=telegram_id).values_list('state', 'data').afirst()
+        return await cls._aremember(telegram_id, row)
+
+    @classmethod
+    def peek_state(cls, telegram_id: int) -> str | None:
+        """
+        Get cached state without DB fallback.
+
+        For sync code running inside the event loop (handler checks):
+        one blocking Redis GET, no DB query. Returns None if the state
+        is not cached.
+        """
+        cached = cache.get(cls._cache_key(telegram_id))
+        return cached[0] if cached is not None else None
 
     @classmethod
     def set_state(cls, telegram_id: int, state: str, data: dict = None) -> None:
         """Set state and optionally update data (sync)."""
-        obj, _ = cls.objects.get_or_create(telegram_id=telegram_id)
-        obj.state = state
-        if data is not None:
-            obj.data = data
-        obj.save()
+        if data is None:
+            _, data = cls.get_state(telegram_id)
+        cls._write(telegram_id, state, data)
 
     @classmethod
     async def aset_state(cls, telegram_id: int, state: str, data: dict = None) -> None:
         """Set state and optionally update data (async)."""
-        await sync_to_async(cls.set_state)(telegram_id, state, data)
+        if data is None:
+            _, data = await cls.aget_state(telegram_id)
+        await cls._awrite(telegram_id, state, data)
 
     @classmethod
     def update_data(cls, telegram_id: int, **kwargs) -> None:
         """Update data fields (sync)."""
-        obj, _ = cls.objects.get_or_create(telegram_id=telegram_id)
-        obj.data.update(kwargs)
-        obj.save()
+        state, data = cls.get_state(telegram_id)
+        cls._write(telegram_id, state, {**data, **kwargs})
 
     @classmethod
     async def aupdate_data(cls, telegram_id: int, **kwargs) -> None:
         """Update data fields (async)."""
-        await sync_to_async(cls.update_data)(telegram_id, **kwargs)
+        state, data = await cls.aget_state(telegram_id)
+        await cls._awrite(telegram_id, state, {**data, **kwargs})
 
     @classmethod
     def clear(cls, telegram_id: int) -> None:
         """Clear state and data (sync)."""
-        cls.objects.filter(telegram_id=telegram_id).update(state='', data={})
+        cls._write(telegram_id, '', {})
 
     @classmethod
     async def aclear(cls, telegram_id: int) -> None:
         """Clear state and data (async)."""
-        await sync_to_async(cls.clear)(telegram_id)
+        await cls._awrite(telegram_id, '', {})
+
+    @classmethod
+    def flush_dirty(cls) -> int:
+        """
+        Write changed states from cache to the DB in one upsert.
+
+        Returns:
+            Number of users written
+        """
+        if not dirty_queue.lock():
+            return 0
+
+        try:
+            telegram_ids, pointer = dirty_queue.read()
+            telegram_ids = set(telegram_ids)
+            if not telegram_ids:
+                dirty_queue.ack(pointer)
+                return 0
+
+            cached = cache.get_many([cls._cache_key(tg_id) for tg_id in telegram_ids])
+            now = timezone.now()
+            rows = [
+                cls(telegram_id=tg_id, state=cached[key][0], data=cached[key][1], updated_at=now)
+                for tg_id in telegram_ids
+                if (key := cls._cache_key(tg_id)) in cached
+            ]
+
+            cls.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=['telegram_id'],
+                update_fields=['state', 'data', 'updated_at'],
+            )
+            dirty_queue.ack(pointer)
+            return len(rows)
+        finally:
+            dirty_queue.unlock()
@@ -0,0 +1,35 @@
+"""
+Outbox of Celery tasks to publish after the transaction commits.
+"""
+from django.db import models
+
+
+class TaskOutbox(models.Model):
+    """
+    Pending Celery task written in the same transaction as the data it is about.
+
+    Rows are published to the broker and deleted by the relay task
+    (apps.bot.tasks.outbox.relay_task_outbox).
+    """
+
+    task_name = models.CharField(
+        max_length=100,
+        verbose_name='Задача',
+    )
+    kwargs = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name='Аргументы',
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Создана',
+    )
+
+    class Meta:
+        verbose_name = 'Задача в очереди отправки'
+        verbose_name_plural = 'Очередь отправки задач'
+        ordering = ['id']
+
+    def __str__(self):
+        return f"{self.task_name} #{self.pk}"
@@ -0,0 +1,53 @@
+"""
+Precomputed audience segment membership.
+"""
+from django.conf import settings
+from django.db import models
+
+from apps.bot.models.broadcast import BroadcastAudience
+
+
+class AudienceSegmentMember(models.Model):
+    """
+    User membership in a predefined broadcast audience.
+
+    Maintained by apps.bot.services.segments: incrementally on order
+    status changes and user registration, and fully every night
+    (time-based segments).
+    ALL and CUSTOM are not stored.
+    """
+
+    segment = models.CharField(
+        max_length=20,
+        choices=BroadcastAudience.choices,
+        verbose_name='Сегмент',
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='audience_segments',
+        verbose_name='Пользователь',
+    )
+    telegram_id = models.BigIntegerField(
+        verbose_name='Telegram ID',
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Добавлен',
+    )
+
+    class Meta:
+        verbose_name = 'Участник сегмента'
+        verbose_name_plural = 'Участники сегментов'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['segment', 'user'],
+                name='bot_segment_member_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['segment', 'telegram_id'], name='bot_segment_tg_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.segment}: {self.telegram_id}"
@@ -0,0 +1,130 @@
+"""
+Coalesced admin notifications about new orders.
+
+When ADMIN_ORDER_DIGEST_WINDOW > 0, new orders arriving within the window
+after the previous one are buffered in cache (Redis) instead of being sent
+one by one. A periodic Celery task flushes the buffer as one message per
+admin. The first order after a quiet period is still sent immediately.
+"""
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.bot.services.notifications import (
+    build_admin_order_message,
+    format_price,
+    send_admin_message,
+)
+from apps.core.services import CacheQueue
+
+logger = logging.getLogger(__name__)
+
+DIGEST_KEY_PREFIX = 'bot:admin_digest'
+RECENT_KEY = f'{DIGEST_KEY_PREFIX}:recent'
+
+# Pointer keeps its original key name: flushed orders are not re-read after upgrade
+digest_queue = CacheQueue(DIGEST_KEY_PREFIX, pointer_name='flushed')
+
+# Orders listed in a digest message (Telegram message limit is 4096 chars)
+DIGEST_MAX_ORDERS = 30
+
+
+def is_digest_enabled() -> bool:
+    """Digest mode is on when a window is configured."""
+    return settings.ADMIN_ORDER_DIGEST_WINDOW > 0
+
+
+def should_buffer() -> bool:
+    """
+    Decide whether a new order goes to the digest.
+
+    Returns False for the first order after a quiet window (it is sent
+    right away) and True while orders keep arriving within the window.
+    """
+    if not is_digest_enabled():
+        return False
+    # cache.add succeeds only if no order was seen during the window
+    return not cache.add(RECENT_KEY, 1, timeout=settings.ADMIN_ORDER_DIGEST_WINDOW)
+
+
+def buffer_admin_order(payload: dict) -> int:
+    """
+    Put new order notification into the digest buffer.
+
+    Args:
+        payload: Keyword arguments of send_admin_order_notification
+
+    Returns:
+        Sequence number of the buffered entry
+    """
+    return digest_queue.push(payload)
+
+
+def build_digest_message(payloads: list[dict]) -> str:
+    """Build one consolidated message for several orders."""
+    total = sum(p['total'] for p in payloads)
+    lines = [
+        f"🆕 Новые заказы: {len(payloads)}",
+        "",
+    ]
+
+    for payload in payloads[:DIGEST_MAX_ORDERS]:
+        if payload.get('customer_username'):
+            contact = f"@{payload['customer_username']}"
+        else:
+            contact = payload.get('customer_phone') or "—"
+        lines.append(
+            f"• #{payload['order_uid']} — {payload['customer_name']} ({contact}) — "
+            f"{format_price(payload['total'])}"
+        )
+
+    if len(payloads) > DIGEST_MAX_ORDERS:
+        lines.append(f"… и ещё {len(payloads) - DIGEST_MAX_ORDERS}")
+
+    lines += [
+        "",
+        f"💰 Всего: {format_price(total)}",
+        "Подробности — в админ-панели.",
+    ]
+    return "\n".join(lines)
+
+
+def flush_admin_digest() -> int:
+    """
+    Send buffered orders to admins.
+
+    A single buffered order is sent in the regular per-order format.
+    Orders are removed from the buffer only after at least one admin
+    received the message.
+
+    Returns:
+        Number of orders flushed (0 if nothing was delivered)
+    """
+    if not digest_queue.lock():
+        logger.info("Admin digest flush already running")
+        return 0
+
+    try:
+        payloads, pointer = digest_queue.read()
+        if not payloads:
+            digest_queue.ack(pointer)
+            return 0
+
+        if len(payloads) == 1:
+            message = build_admin_order_message(**payloads[0])
+            label = f"order #{payloads[0]['order_uid']}"
+        else:
+            message = build_digest_message(payloads)
+            label = f"digest of {len(payloads)} orders"
+
+        # Buffer is kept until at least one admin got the message:
+        # the next flush retries (no bot token, no admins, Telegram down)
+        if not send_admin_message(message, label=label):
+            logger.warning("Admin digest not delivered, kept for retry: orders=%d", len(payloads))
+            return 0
+
+        digest_queue.ack(pointer)
+        return len(payloads)
+    finally:
+        digest_queue.unlock()
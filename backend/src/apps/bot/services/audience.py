@@ -0,0 +1,154 @@
+"""
+Audience segment sizes for the broadcast wizard.
+
+All segment counts are computed in one aggregated query and cached,
+so /broadcast replies without touching the orders table on every call.
+"""
+import logging
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Exists, OuterRef, Q
+
+from apps.bot.models import AudienceSegmentMember
+from apps.core.db_router import get_reporting_db
+from apps.users.models import User
+
+logger = logging.getLogger(__name__)
+
+AUDIENCE_COUNTS_CACHE_KEY = 'bot:audience_counts'
+AUDIENCE_COUNTS_REFRESH_LOCK_KEY = 'bot:audience_counts:refreshing'
+
+
+def _audience_aggregates() -> dict:
+    """Aggregate expressions: one conditional Count per audience."""
+    from apps.bot.services.segments import STORED_SEGMENTS
+
+    def member_of(segment):
+        return Exists(
+            AudienceSegmentMember.objects.filter(user=OuterRef('pk'), segment=segment)
+        )
+
+    return {
+        'all': Count('id'),
+        **{
+            str(segment): Count('id', filter=Q(member_of(segment)))
+            for segment in STORED_SEGMENTS
+        },
+    }
+
+
+def compute_audience_counts() -> dict[str, int]:
+    """
+    Count users of every predefined audience in a single query.
+
+    Segment membership is read from AudienceSegmentMember (indexed by
+    segment, user), so this stays consistent with get_audience_queryset().
+    Runs on the read replica when one is configured.
+    """
+    return (
+        User.objects.using(get_reporting_db())
+        .filter(telegram_id__isnull=False)
+        .aggregate(**_audience_aggregates())
+    )
+
+
+def _store_counts(counts: dict[str, int]) -> dict[str, int]:
+    cache.set(
+        AUDIENCE_COUNTS_CACHE_KEY,
+        {'counts': counts, 'computed_at': time.time()},
+        timeout=settings.BROADCAST_AUDIENCE_COUNTS_MAX_AGE,
+    )
+    return counts
+
+
+async def _astore_counts(counts: dict[str, int]) -> dict[str, int]:
+    await cache.aset(
+        AUDIENCE_COUNTS_CACHE_KEY,
+        {'counts': counts, 'computed_at': time.time()},
+        timeout=settings.BROADCAST_AUDIENCE_COUNTS_MAX_AGE,
+    )
+    return counts
+
+
+def refresh_audience_counts() -> dict[str, int]:
+    """Recompute counts and store them in cache."""
+    return _store_counts(compute_audience_counts())
+
+
+def get_audience_counts() -> dict[str, int]:
+    """
+    Get cached audience counts (stale-while-revalidate).
+
+    Fresh entry is returned as is. A stale entry is returned immediately
+    and a background refresh is scheduled (at most one at a time).
+    Only a cold cache computes the counts inline.
+    """
+    entry = cache.get(AUDIENCE_COUNTS_CACHE_KEY)
+    if entry is None:
+        return refresh_audience_counts()
+
+    age = time.time() - entry['computed_at']
+    if age > settings.BROADCAST_AUDIENCE_COUNTS_TTL:
+        _schedule_refresh()
+
+    return entry['counts']
+
+
+async def aget_audience_counts() -> dict[str, int]:
+    """
+    Async get_audience_counts(): async cache API, cold cache is computed
+    via the async ORM, the refresh task is published off the event loop.
+    """
+    entry = await cache.aget(AUDIENCE_COUNTS_CACHE_KEY)
+    if entry is None:
+        counts = await (
+            User.objects.using(get_reporting_db())
+            .filter(telegram_id__isnull=False)
+            .aaggregate(**_audience_aggregates())
+        )
+        return await _astore_counts(counts)
+
+    age = time.time() - entry['computed_at']
+    if age > settings.BROADCAST_AUDIENCE_COUNTS_TTL:
+        await _aschedule_refresh()
+
+    return entry['counts']
+
+
+def _schedule_refresh() -> None:
+    """Enqueue refresh task unless one is already in flight."""
+    if not cache.add(
+        AUDIENCE_COUNTS_REFRESH_LOCK_KEY,
+        1,
+        timeout=settings.BROADCAST_AUDIENCE_COUNTS_TTL,
+    ):
+        return
+
+    from apps.bot.tasks import refresh_audience_counts_task
+
+    try:
+        refresh_audience_counts_task.delay()
+    except Exception as e:
+        cache.delete(AUDIENCE_COUNTS_REFRESH_LOCK_KEY)
+        logger.warning("Failed to schedule audience counts refresh: %s", e)
+
+
+async def _aschedule_refresh() -> None:
+    """Async _schedule_refresh(): broker publish runs in a worker thread."""
+    if not await cache.aadd(
+        AUDIENCE_COUNTS_REFRESH_LOCK_KEY,
+        1,
+        timeout=settings.BROADCAST_AUDIENCE_COUNTS_TTL,
+    ):
+        return
+
+    from apps.bot.tasks import refresh_audience_counts_task
+
+    try:
+        await sync_to_async(refresh_audience_counts_task.delay)()
+    except Exception as e:
+        await cache.adelete(AUDIENCE_COUNTS_REFRESH_LOCK_KEY)
+        logger.warning("Failed to schedule audience counts refresh: %s", e)
@@ -2,9 +2,11 @@
 Telegram notification service for orders.
 """
 import logging
-import requests
+
 from django.conf import settings
 
+from apps.bot.services.telegram_client import get_telegram_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -76,28 +78,12 @@ def send_order_notification(
     message = "\n".join(lines)
 
     # Send via Telegram API
-    try:
-        response = requests.post(
-            f"https://api.telegram.org/bot{bot_token}/sendMessage",
-            json={
-                "chat_id": telegram_id,
-                "text": message,
-            },
-            timeout=30,
-        )
-
-        if response.status_code == 200:
-            logger.info(f"Order notification sent for order #{order_uid} to {telegram_id}")
-            return True
-
-        logger.error(
-            f"Failed to send order notification: {response.status_code} - {response.text}"
-        )
-        return False
+    if get_telegram_client().send_message(telegram_id, message):
+        logger.info(f"Order notification sent for order #{order_uid} to {telegram_id}")
+        return True
 
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to send order notification: {e}")
-        return False
+    logger.error(f"Failed to send order notification for order #{order_uid} to {telegram_id}")
+    return False
 
 
 STATUS_EMOJI = {
@@ -140,6 +126,68 @@ def send_order_status_notification(
         logger.error("TELEGRAM_BOT_TOKEN not configured")
         return False
 
+    message = build_order_status_message(
+        order_uid=order_uid,
+        new_status=new_status,
+        status_display=status_display,
+        customer_phone=customer_phone,
+        customer_username=customer_username,
+        order_date=order_date,
+        items=items,
+    )
+
+    if get_telegram_client().send_message(telegram_id, message):
+        logger.info(f"Status notification sent for order #{order_uid} to {telegram_id}")
+        return True
+
+    logger.error(f"Failed to send status notification for order #{order_uid} to {telegram_id}")
+    return False
+
+
+def send_order_status_notifications(notifications: list[dict]) -> list[bool]:
+    """
+    Send many order status notifications concurrently.
+
+    Args:
+        notifications: List of dicts with send_order_status_notification arguments
+
+    Returns:
+        Send results in the same order as notifications
+    """
+    bot_token = settings.TELEGRAM_BOT_TOKEN
+    if not bot_token:
+        logger.error("TELEGRAM_BOT_TOKEN not configured")
+        return [False] * len(notifications)
+
+    messages = []
+    for notification in notifications:
+        kwargs = dict(notification)
+        telegram_id = kwargs.pop('telegram_id')
+        messages.append((telegram_id, build_order_status_message(**kwargs)))
+
+    results = get_telegram_client().send_bulk(messages)
+
+    for notification, sent in zip(notifications, results, strict=True):
+        if not sent:
+            logger.error(
+                f"Failed to send status notification for order #{notification['order_uid']} "
+                f"to {notification['telegram_id']}"
+            )
+
+    logger.info(f"Status notifications sent: {sum(results)}/{len(notifications)}")
+    return results
+
+
+def build_order_status_message(
+    order_uid: str,
+    new_status: str,
+    status_display: str,
+    customer_phone: str | None = None,
+    customer_username: str | None = None,
+    order_date: str | None = None,
+    items: list[dict] | None = None,
+) -> str:
+    """Build order status message (arguments as in send_order_status_notification)."""
     emoji = STATUS_EMOJI.get(new_status, '📦')
 
     # Build message
@@ -166,30 +214,7 @@ def send_order_status_notification(
         for item in items:
             lines.append(f"• {item['title']} x{item['qty']} — {format_price(item['line_total'])}")
 
-    message = "\n".join(lines)
-
-    try:
-        response = requests.post(
-            f"https://api.telegram.org/bot{bot_token}/sendMessage",
-            json={
-                "chat_id": telegram_id,
-                "text": message,
-            },
-            timeout=30,
-        )
-
-        if response.status_code == 200:
-            logger.info(f"Status notification sent for order #{order_uid} to {telegram_id}")
-            return True
-
-        logger.error(
-            f"Failed to send status notification: {response.status_code} - {response.text}"
-        )
-        return False
-
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to send status notification: {e}")
-        return False
+    return "\n".join(lines)
 
 
 def send_admin_order_notification(
@@ -222,19 +247,34 @@ def send_admin_order_notification(
     Returns:
         Number of admins notified successfully
     """
-    from apps.bot.models import BotAdmin
-
-    bot_token = settings.TELEGRAM_BOT_TOKEN
-    if not bot_token:
-        logger.error("TELEGRAM_BOT_TOKEN not configured")
-        return 0
+    message = build_admin_order_message(
+        order_uid=order_uid,
+        items=items,
+        total=total,
+        delivery_fee=delivery_fee,
+        delivery_address=delivery_address,
+        customer_name=customer_name,
+        customer_username=customer_username,
+        customer_phone=customer_phone,
+        delivery_date=delivery_date,
+        delivery_time=delivery_time,
+    )
+    return send_admin_message(message, label=f"order #{order_uid}")
 
-    # Get active admins with telegram_id
-    admins = BotAdmin.objects.filter(is_active=True, telegram_id__isnull=False)
-    if not admins.exists():
-        logger.info("No active admins with telegram_id to notify")
-        return 0
 
+def build_admin_order_message(
+    order_uid: str,
+    items: list[dict],
+    total: int,
+    delivery_fee: int,
+    delivery_address: str,
+    customer_name: str,
+    customer_username: str | None = None,
+    customer_phone: str | None = None,
+    delivery_date: str | None = None,
+    delivery_time: str | None = None,
+) -> str:
+    """Build new order message for admins (arguments as in send_admin_order_notification)."""
     # Build items list
     items_text = "\n".join(
         f"• {item['title']} x{item['qty']} — {format_price(item['line_total'])}"
@@ -274,31 +314,45 @@ def send_admin_order_notification(
             date_line += f", {delivery_time}"
         lines.append(date_line)
 
-    message = "\n".join(lines)
+    return "\n".join(lines)
 
-    # Send to each admin
-    sent_count = 0
-    for admin in admins:
-        try:
-            response = requests.post(
-                f"https://api.telegram.org/bot{bot_token}/sendMessage",
-                json={
-                    "chat_id": admin.telegram_id,
-                    "text": message,
-                },
-                timeout=30,
-            )
 
-            if response.status_code == 200:
-                sent_count += 1
-                logger.info(f"Admin notification sent for order #{order_uid} to {admin.username}")
-            else:
-                logger.error(
-                    f"Failed to send admin notification to {admin.username}: "
-                    f"{response.status_code} - {response.text}"
-                )
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to send admin notification to {admin.username}: {e}")
-
-    logger.info(f"Admin notifications sent for order #{order_uid}: {sent_count}/{admins.count()}")
+def send_admin_message(message: str, label: str) -> int:
+    """
+    Send a message to all active admins with telegram_id.
+
+    Args:
+        message: Message text
+        label: What is being sent, for logs (e.g. 'order #123456')
+
+    Returns:
+        Number of admins notified successfully
+    """
+    from apps.bot.models import BotAdmin
+
+    bot_token = settings.TELEGRAM_BOT_TOKEN
+    if not bot_token:
+        logger.error("TELEGRAM_BOT_TOKEN not configured")
+        return 0
+
+    # Active admins with telegram_id (cached snapshot, no DB query)
+    admins = BotAdmin.notification_chat_ids()
+    if not admins:
+        logger.info("No active admins with telegram_id to notify")
+        return 0
+
+    # Send to all admins concurrently over the pooled connection
+    results = get_telegram_client().send_bulk(
+        [(telegram_id, message) for telegram_id, _ in admins]
+    )
+
+    sent_count = 0
+    for (_, username), sent in zip(admins, results, strict=True):
+        if sent:
+            sent_count += 1
+            logger.info(f"Admin notification sent for {label} to {username}")
+        else:
+            logger.error(f"Failed to send admin notification for {label} to {username}")
+
+    logger.info(f"Admin notifications sent for {label}: {sent_count}/{len(admins)}")
     return sent_count
@@ -0,0 +1,55 @@
+"""
+Transactional outbox for Celery tasks.
+
+enqueue_task() only inserts a row, so it joins the caller's transaction:
+the task is published if and only if the transaction commits, and the
+request does not wait for Redis or the broker. The relay task, run by
+Celery beat every TASK_OUTBOX_RELAY_INTERVAL seconds, is the only
+publisher: it sends pending rows in batches.
+"""
+import logging
+
+from celery import current_app
+from django.db import transaction
+
+from apps.bot.models import TaskOutbox
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_task(task, **kwargs) -> TaskOutbox:
+    """
+    Schedule Celery task via the outbox.
+
+    Args:
+        task: Celery task object (its registered name is stored)
+        **kwargs: JSON-serializable task keyword arguments
+    """
+    return TaskOutbox.objects.create(task_name=task.name, kwargs=kwargs)
+
+
+def relay_outbox(batch_size: int = 100) -> int:
+    """
+    Publish one batch of pending tasks to the broker and delete them.
+
+    Rows are locked with SKIP LOCKED, so concurrent relays never publish
+    the same row. If publishing fails the batch is rolled back and retried
+    on the next run (at-least-once delivery).
+
+    Returns:
+        Number of published tasks
+    """
+    with transaction.atomic():
+        rows = list(
+            TaskOutbox.objects.select_for_update(skip_locked=True)
+            .order_by('id')[:batch_size]
+        )
+        if not rows:
+            return 0
+
+        for row in rows:
+            current_app.send_task(row.task_name, kwargs=row.kwargs)
+
+        TaskOutbox.objects.filter(pk__in=[row.pk for row in rows]).delete()
+
+    return len(rows)
@@ -0,0 +1,160 @@
+"""
+Audience segment membership maintenance.
+
+Segment rules live here; AudienceSegmentMember stores the result so that
+broadcast targeting and counting are plain indexed scans.
+"""
+import logging
+import time
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from apps.bot.models import AudienceSegmentMember, BroadcastAudience
+from apps.users.models import User
+
+logger = logging.getLogger(__name__)
+
+# Segments that depend on orders (refreshed on order status change)
+ORDER_SEGMENTS = (BroadcastAudience.CUSTOMERS, BroadcastAudience.VIP)
+# Segments that depend on time (refreshed nightly; NEW also on registration)
+TIME_SEGMENTS = (BroadcastAudience.NEW, BroadcastAudience.INACTIVE)
+STORED_SEGMENTS = ORDER_SEGMENTS + TIME_SEGMENTS
+NEW_USER_DAYS = 7
+
+
+def segment_rule_queryset(segment: str, users=None):
+    """
+    Live definition of a segment: users with telegram_id matching the rule.
+
+    Args:
+        segment: BroadcastAudience value from STORED_SEGMENTS
+        users: Optional base queryset to narrow (e.g. a single user)
+    """
+    from apps.orders.models import OrderStatus
+
+    base = users if users is not None else User.objects.all()
+    base = base.filter(telegram_id__isnull=False)
+
+    if segment == BroadcastAudience.CUSTOMERS:
+        # Users with at least one confirmed or done order
+        return base.filter(
+            orders__status__in=[OrderStatus.CONFIRMED, OrderStatus.DONE]
+        ).distinct()
+
+    if segment == BroadcastAudience.VIP:
+        # Users with 2+ done orders
+        return base.annotate(
+            done_orders=Count('orders', filter=Q(orders__status=OrderStatus.DONE))
+        ).filter(done_orders__gte=2)
+
+    if segment == BroadcastAudience.NEW:
+        # Registered in last NEW_USER_DAYS days
+        return base.filter(date_joined__gte=timezone.now() - timedelta(days=NEW_USER_DAYS))
+
+    if segment == BroadcastAudience.INACTIVE:
+        # Last login more than 30 days ago
+        return base.filter(last_login__lt=timezone.now() - timedelta(days=30))
+
+    return base.none()
+
+
+def _sync_members(segment: str, expected: set[tuple[int, int]], users=None) -> tuple[int, int]:
+    """
+    Bring stored rows of a segment in line with expected (user_id, telegram_id) pairs.
+
+    Returns (added, removed).
+    """
+    stored_qs = AudienceSegmentMember.objects.filter(segment=segment)
+    if users is not None:
+        stored_qs = stored_qs.filter(user__in=users)
+
+    stored = {
+        (user_id, telegram_id): pk
+        for pk, user_id, telegram_id in stored_qs.values_list('pk', 'user_id', 'telegram_id')
+    }
+
+    to_delete = [pk for pair, pk in stored.items() if pair not in expected]
+    to_add = [pair for pair in expected if pair not in stored]
+
+    if to_delete:
+        AudienceSegmentMember.objects.filter(pk__in=to_delete).delete()
+    if to_add:
+        AudienceSegmentMember.objects.bulk_create(
+            [
+                AudienceSegmentMember(segment=segment, user_id=user_id, telegram_id=telegram_id)
+                for user_id, telegram_id in to_add
+            ],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
+    return len(to_add), len(to_delete)
+
+
+def refresh_segments(segments=STORED_SEGMENTS) -> dict:
+    """
+    Fully recompute given segments.
+
+    Returns per-segment stats: added, removed, total and duration_ms.
+    """
+    stats = {}
+    for segment in segments:
+        started = time.monotonic()
+        expected = set(segment_rule_queryset(segment).values_list('id', 'telegram_id'))
+
+        with transaction.atomic():
+            added, removed = _sync_members(segment, expected)
+
+        stats[segment] = {
+            'added': added,
+            'removed': removed,
+            'total': len(expected),
+            'duration_ms': round((time.monotonic() - started) * 1000, 1),
+        }
+    return stats
+
+
+def refresh_users_segments(user_ids: list[int], segments=STORED_SEGMENTS) -> dict:
+    """
+    Recompute segment membership of the given users.
+
+    Returns {segment: set of member user ids}.
+    """
+    users_qs = User.objects.filter(pk__in=user_ids)
+    result = {}
+
+    with transaction.atomic():
+        for segment in segments:
+            expected = set(segment_rule_queryset(segment, users_qs).values_list('id', 'telegram_id'))
+            _sync_members(segment, expected, users=users_qs)
+            result[segment] = {user_id for user_id, _ in expected}
+
+    return result
+
+
+def refresh_user_segments(user_id: int, segments=STORED_SEGMENTS) -> dict:
+    """
+    Recompute segment membership of a single user.
+
+    Returns {segment: is_member}.
+    """
+    members = refresh_users_segments([user_id], segments)
+    return {segment: user_id in user_ids for segment, user_ids in members.items()}
+
+
+def sync_new_user(user) -> bool:
+    """
+    Put a recently registered user into the NEW segment right away.
+
+    Without it a user joins "new users" broadcasts only after the nightly
+    refresh. Older users are skipped without queries; the nightly refresh
+    removes members once they stop being new.
+
+    Returns whether the user is a member of NEW.
+    """
+    if user.telegram_id is None or user.date_joined < timezone.now() - timedelta(days=NEW_USER_DAYS):
+        return False
+    return refresh_user_segments(user.pk, segments=(BroadcastAudience.NEW,))[BroadcastAudience.NEW]
@@ -0,0 +1,131 @@
+"""
+Pooled synchronous Telegram Bot API client for Celery workers.
+
+One keep-alive requests.Session per process: repeated calls reuse the
+TCP+TLS connection to api.telegram.org instead of a new handshake per
+message. Fan-out to many chats is sent concurrently.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+TELEGRAM_API_URL = 'https://api.telegram.org'
+
+
+class TelegramClient:
+    """
+    Thin Bot API client over a pooled requests.Session.
+
+    Thread-safe: the connection pool holds up to pool_size connections,
+    send_bulk() uses the same number of worker threads.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+        pool_size: int = 10,
+    ):
+        self.token = token
+        self.base_url = f"{TELEGRAM_API_URL}/bot{token}"
+        self.timeout = (connect_timeout, read_timeout)
+        self.pool_size = pool_size
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def call(self, method: str, payload: dict) -> requests.Response:
+        """
+        Call Bot API method.
+
+        Raises requests.exceptions.RequestException on network errors.
+        """
+        return self.session.post(
+            f"{self.base_url}/{method}",
+            json=payload,
+            timeout=self.timeout,
+        )
+
+    def send_message(self, chat_id: int, text: str, **extra) -> bool:
+        """
+        Send text message.
+
+        Returns:
+            True if sent successfully, False otherwise (errors are logged)
+        """
+        try:
+            response = self.call('sendMessage', {'chat_id': chat_id, 'text': text, **extra})
+        except requests.exceptions.RequestException as e:
+            logger.error("Telegram sendMessage failed: chat_id=%s error=%s", chat_id, e)
+            return False
+
+        if response.status_code == 200:
+            return True
+
+        logger.error(
+            "Telegram sendMessage failed: chat_id=%s status=%s body=%s",
+            chat_id,
+            response.status_code,
+            response.text,
+        )
+        return False
+
+    def send_bulk(self, messages: list[tuple[int, str]]) -> list[bool]:
+        """
+        Send messages concurrently.
+
+        Args:
+            messages: List of (chat_id, text)
+
+        Returns:
+            Send results in the same order as messages
+        """
+        if not messages:
+            return []
+        if len(messages) == 1:
+            return [self.send_message(*messages[0])]
+
+        executor = self._get_executor()
+        futures = [executor.submit(self.send_message, chat_id, text) for chat_id, text in messages]
+        return [future.result() for future in futures]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create worker pool (after Celery prefork, in the child process)."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.pool_size,
+                    thread_name_prefix='telegram-client',
+                )
+            return self._executor
+
+
+_client: TelegramClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_telegram_client() -> TelegramClient:
+    """Get per-process TelegramClient for the configured bot token."""
+    global _client
+
+    token = settings.TELEGRAM_BOT_TOKEN
+    with _client_lock:
+        if _client is None or _client.token != token:
+            _client = TelegramClient(
+                token=token,
+                connect_timeout=settings.TELEGRAM_API_CONNECT_TIMEOUT,
+                read_timeout=settings.TELEGRAM_API_READ_TIMEOUT,
+                pool_size=settings.TELEGRAM_API_POOL_SIZE,
+            )
+        return _client
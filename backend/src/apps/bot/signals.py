@@ -0,0 +1,27 @@
+"""
+Django signals of the bot app.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.bot.models import BotAdmin
+from apps.users.models import User
+
+
+@receiver(post_save, sender=BotAdmin)
+@receiver(post_delete, sender=BotAdmin)
+def invalidate_bot_admins_cache(sender, **kwargs):
+    """Any change of admins invalidates the cached snapshot once committed."""
+    transaction.on_commit(BotAdmin.invalidate_cache)
+
+
+@receiver(post_save, sender=User)
+def add_new_user_to_segment(sender, instance, update_fields=None, **kwargs):
+    """Registered users join the NEW audience segment without waiting for the nightly refresh."""
+    if update_fields is not None and 'telegram_id' not in update_fields:
+        return
+
+    from apps.bot.services.segments import sync_new_user
+
+    sync_new_user(instance)
@@ -1,14 +1,32 @@
 """Bot Celery tasks."""
+from apps.bot.tasks.audience import (
+    refresh_audience_counts_task,
+    refresh_audience_segments_task,
+    refresh_user_segments_task,
+    refresh_users_segments_task,
+)
 from apps.bot.tasks.broadcast import send_broadcast_task
+from apps.bot.tasks.conversation import flush_conversation_states_task
+from apps.bot.tasks.outbox import relay_task_outbox_task
 from apps.bot.tasks.notifications import (
+    flush_admin_order_digest_task,
     send_order_notification_task,
     send_admin_order_notification_task,
     send_order_status_notification_task,
+    send_order_status_notifications_task,
 )
 
 __all__ = [
+    'refresh_audience_counts_task',
+    'refresh_audience_segments_task',
+    'refresh_user_segments_task',
+    'refresh_users_segments_task',
     'send_broadcast_task',
     'send_order_notification_task',
     'send_admin_order_notification_task',
     'send_order_status_notification_task',
+    'send_order_status_notifications_task',
+    'flush_admin_order_digest_task',
+    'relay_task_outbox_task',
+    'flush_conversation_states_task',
 ]
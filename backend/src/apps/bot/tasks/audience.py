@@ -0,0 +1,117 @@
+"""
+Celery tasks for broadcast audiences.
+"""
+import logging
+import time
+
+from celery import shared_task
+from django.core.cache import cache
+
+from apps.bot.services.audience import (
+    AUDIENCE_COUNTS_REFRESH_LOCK_KEY,
+    refresh_audience_counts,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name='bot.refresh_audience_counts')
+def refresh_audience_counts_task() -> dict:
+    """
+    Recompute cached audience counts for the /broadcast wizard.
+    """
+    try:
+        counts = refresh_audience_counts()
+    finally:
+        cache.delete(AUDIENCE_COUNTS_REFRESH_LOCK_KEY)
+
+    logger.info("Audience counts refreshed: %s", counts)
+    return counts
+
+
+@shared_task(
+    name='bot.refresh_audience_segments',
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_kwargs={'max_retries': 3},
+)
+def refresh_audience_segments_task(self, segments: list[str] | None = None) -> dict:
+    """
+    Fully recompute audience segment membership.
+
+    Runs nightly for time-based segments (NEW, INACTIVE); order-based
+    segments are recomputed too to repair any missed incremental update.
+
+    Returns:
+        Per-segment stats (added, removed, total, duration_ms) and total duration
+    """
+    from apps.bot.services.segments import STORED_SEGMENTS, refresh_segments
+
+    started = time.monotonic()
+    stats = refresh_segments(segments or STORED_SEGMENTS)
+    duration_ms = round((time.monotonic() - started) * 1000, 1)
+
+    for segment, segment_stats in stats.items():
+        logger.info(
+            "Audience segment refreshed: segment=%s total=%d added=%d removed=%d duration_ms=%s",
+            segment,
+            segment_stats['total'],
+            segment_stats['added'],
+            segment_stats['removed'],
+            segment_stats['duration_ms'],
+        )
+    logger.info("Audience segments refresh finished: duration_ms=%s", duration_ms)
+
+    return {'segments': stats, 'duration_ms': duration_ms}
+
+
+@shared_task(
+    name='bot.refresh_user_segments',
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_kwargs={'max_retries': 3},
+)
+def refresh_user_segments_task(user_id: int) -> dict:
+    """
+    Recompute audience segment membership of one user (after order status change).
+    """
+    from apps.bot.services.segments import refresh_user_segments
+
+    started = time.monotonic()
+    membership = refresh_user_segments(user_id)
+    duration_ms = round((time.monotonic() - started) * 1000, 1)
+
+    logger.info(
+        "User segments refreshed: user=%s membership=%s duration_ms=%s",
+        user_id,
+        membership,
+        duration_ms,
+    )
+    return {'user_id': user_id, 'membership': membership, 'duration_ms': duration_ms}
+
+
+@shared_task(
+    name='bot.refresh_users_segments',
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_kwargs={'max_retries': 3},
+)
+def refresh_users_segments_task(user_ids: list[int]) -> dict:
+    """
+    Recompute audience segment membership of many users (after bulk status change).
+    """
+    from apps.bot.services.segments import refresh_users_segments
+
+    started = time.monotonic()
+    members = refresh_users_segments(user_ids)
+    duration_ms = round((time.monotonic() - started) * 1000, 1)
+
+    counts = {segment: len(ids) for segment, ids in members.items()}
+    logger.info(
+        "Users segments refreshed: users=%d members=%s duration_ms=%s",
+        len(user_ids),
+        counts,
+        duration_ms,
+    )
+    return {'users': len(user_ids), 'members': counts, 'duration_ms': duration_ms}
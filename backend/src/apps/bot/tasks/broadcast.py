@@ -6,7 +6,6 @@ import time
 
 import requests
 from celery import shared_task
-from django.conf import settings
 from django.utils import timezone
 
 from apps.bot.models import (
@@ -17,8 +16,8 @@ from apps.bot.models import (
     BroadcastStatus,
     BroadcastContentType,
 )
-from apps.bot.handlers.broadcast import get_audience_queryset
-from apps.users.models import User
+from apps.bot.services.telegram_client import TelegramClient, get_telegram_client
+from apps.bot.handlers.broadcast import get_audience_queryset, get_users_by_usernames
 
 
 logger = logging.getLogger(__name__)
@@ -52,8 +51,6 @@ def send_broadcast_task(self, broadcast_id: int) -> dict:
     broadcast.save(update_fields=['status', 'started_at'])
 
     # Get users based on audience type
-    from django.db.models import Q
-
     audience_type = broadcast.audience_type
 
     if audience_type and audience_type != BroadcastAudience.CUSTOM:
@@ -63,19 +60,11 @@ def send_broadcast_task(self, broadcast_id: int) -> dict:
             .values_list('id', 'telegram_id', 'username')
         )
     else:
-        # CUSTOM: Get users by usernames (search in both telegram_username and username fields)
-        usernames = broadcast.recipients_usernames or []
-        # Build OR query for each username
-        if usernames:
-            q = Q()
-            for uname in usernames:
-                q |= Q(telegram_username__iexact=uname) | Q(username__iexact=uname)
-            users = list(
-                User.objects.filter(q, telegram_id__isnull=False)
-                .values_list('id', 'telegram_id', 'username')
-            )
-        else:
-            users = []
+        # CUSTOM: one IN query over telegram_username / lower(username)
+        users = list(
+            get_users_by_usernames(broadcast.recipients_usernames or [])
+            .values_list('id', 'telegram_id', 'username')
+        )
 
     total_recipients = len(users)
     broadcast.total_recipients = total_recipients
@@ -124,8 +113,7 @@ def send_broadcast_task(self, broadcast_id: int) -> dict:
 
 def _send_broadcast_sync(broadcast: Broadcast) -> dict:
     """Send broadcast messages synchronously."""
-    bot_token = settings.TELEGRAM_BOT_TOKEN
-    base_url = f"https://api.telegram.org/bot{bot_token}"
+    client = get_telegram_client()
 
     stats = {'sent': 0, 'failed': 0, 'blocked': 0}
 
@@ -137,7 +125,7 @@ def _send_broadcast_sync(broadcast: Broadcast) -> dict:
 
     count = 0
     for log in logs.iterator():
-        result = _send_message(base_url, log.telegram_id, broadcast)
+        result = _send_message(client, log.telegram_id, broadcast)
 
         if result == 'success':
             log.status = BroadcastLogStatus.SENT
@@ -162,7 +150,7 @@ def _send_broadcast_sync(broadcast: Broadcast) -> dict:
     return stats
 
 
-def _send_message(base_url: str, chat_id: int, broadcast: Broadcast) -> str:
+def _send_message(client: TelegramClient, chat_id: int, broadcast: Broadcast) -> str:
     """
     Send a single message to Telegram.
 
@@ -172,53 +160,24 @@ def _send_message(base_url: str, chat_id: int, broadcast: Broadcast) -> str:
     text = broadcast.text or None
     file_id = broadcast.file_id or None
 
-    try:
-        if content_type == BroadcastContentType.TEXT:
-            response = requests.post(
-                f"{base_url}/sendMessage",
-                json={'chat_id': chat_id, 'text': text},
-                timeout=30,
-            )
-
-        elif content_type == BroadcastContentType.PHOTO:
-            data = {'chat_id': chat_id, 'photo': file_id}
-            if text:
-                data['caption'] = text
-            response = requests.post(
-                f"{base_url}/sendPhoto",
-                json=data,
-                timeout=30,
-            )
-
-        elif content_type == BroadcastContentType.VIDEO:
-            data = {'chat_id': chat_id, 'video': file_id}
-            if text:
-                data['caption'] = text
-            response = requests.post(
-                f"{base_url}/sendVideo",
-                json=data,
-                timeout=30,
-            )
-
-        elif content_type == BroadcastContentType.DOCUMENT:
-            data = {'chat_id': chat_id, 'document': file_id}
-            if text:
-                data['caption'] = text
-            response = requests.post(
-                f"{base_url}/sendDocument",
-                json=data,
-                timeout=30,
-            )
-
-        elif content_type == BroadcastContentType.VOICE:
-            response = requests.post(
-                f"{base_url}/sendVoice",
-                json={'chat_id': chat_id, 'voice': file_id},
-                timeout=30,
-            )
+    if content_type == BroadcastContentType.TEXT:
+        method, data = 'sendMessage', {'chat_id': chat_id, 'text': text}
+    elif content_type == BroadcastContentType.PHOTO:
+        method, data = 'sendPhoto', {'chat_id': chat_id, 'photo': file_id}
+    elif content_type == BroadcastContentType.VIDEO:
+        method, data = 'sendVideo', {'chat_id': chat_id, 'video': file_id}
+    elif content_type == BroadcastContentType.DOCUMENT:
+        method, data = 'sendDocument', {'chat_id': chat_id, 'document': file_id}
+    elif content_type == BroadcastContentType.VOICE:
+        method, data = 'sendVoice', {'chat_id': chat_id, 'voice': file_id}
+    else:
+        return f"Unknown content type: {content_type}"
 
-        else:
-            return f"Unknown content type: {content_type}"
+    if text and content_type not in (BroadcastContentType.TEXT, BroadcastContentType.VOICE):
+        data['caption'] = text
+
+    try:
+        response = client.call(method, data)
 
         # Check response
         if response.status_code == 200:
@@ -0,0 +1,21 @@
+"""
+Celery tasks for bot conversation state.
+"""
+import logging
+
+from celery import shared_task
+
+from apps.bot.models import ConversationState
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name='bot.flush_conversation_states')
+def flush_conversation_states_task() -> int:
+    """
+    Celery beat task: persist conversation states changed in cache.
+    """
+    written = ConversationState.flush_dirty()
+    if written:
+        logger.info("Conversation states flushed: written=%d", written)
+    return written
@@ -2,12 +2,20 @@
 Celery tasks for order notifications.
 """
 import logging
+
 from celery import shared_task
 
+from apps.bot.services.admin_digest import (
+    buffer_admin_order,
+    flush_admin_digest,
+    is_digest_enabled,
+    should_buffer,
+)
 from apps.bot.services.notifications import (
-    send_order_notification,
     send_admin_order_notification,
+    send_order_notification,
     send_order_status_notification,
+    send_order_status_notifications,
 )
 
 logger = logging.getLogger(__name__)
@@ -69,45 +77,59 @@ def send_admin_order_notification_task(
 ) -> int:
     """
     Celery task to send order notification to admins.
+
+    In digest mode orders arriving in a burst are buffered and sent
+    by flush_admin_order_digest_task.
     """
-    result = send_admin_order_notification(
-        order_uid=order_uid,
-        items=items,
-        total=total,
-        delivery_fee=delivery_fee,
-        delivery_address=delivery_address,
-        customer_name=customer_name,
-        customer_username=customer_username,
-        customer_phone=customer_phone,
-        delivery_date=delivery_date,
-        delivery_time=delivery_time,
-    )
+    payload = {
+        'order_uid': order_uid,
+        'items': items,
+        'total': total,
+        'delivery_fee': delivery_fee,
+        'delivery_address': delivery_address,
+        'customer_name': customer_name,
+        'customer_username': customer_username,
+        'customer_phone': customer_phone,
+        'delivery_date': delivery_date,
+        'delivery_time': delivery_time,
+    }
+
+    if should_buffer():
+        seq = buffer_admin_order(payload)
+        logger.info("Admin order notification buffered for digest: order=%s seq=%s", order_uid, seq)
+        return 0
+
+    result = send_admin_order_notification(**payload)
 
     logger.info("Admin order notification task completed: order=%s admins_notified=%s", order_uid, result)
     return result
 
 
-@shared_task(
-    name='bot.send_order_status_notification',
-    max_retries=3,
-    default_retry_delay=30,
-)
-def send_order_status_notification_task(order_id: int) -> bool:
+@shared_task(name='bot.flush_admin_order_digest')
+def flush_admin_order_digest_task() -> int:
     """
-    Celery task to send order status change notification.
+    Celery beat task: send buffered new orders to admins as one message.
     """
-    from apps.orders.models import Order
+    if not is_digest_enabled():
+        return 0
+
+    flushed = flush_admin_digest()
+    if flushed:
+        logger.info("Admin order digest sent: orders=%d", flushed)
+    return flushed
 
-    try:
-        order = Order.objects.select_related('user').prefetch_related('items').get(pk=order_id)
-    except Order.DoesNotExist:
-        logger.error("Order not found: order_id=%s", order_id)
-        return False
 
+def _status_notification_kwargs(order) -> dict | None:
+    """
+    Build send_order_status_notification arguments for an order.
+
+    Expects order with select_related('user') and prefetch_related('items').
+    Returns None if the customer has no telegram_id.
+    """
     telegram_id = getattr(order.user, 'telegram_id', None)
     if not telegram_id:
         logger.warning("Cannot send status notification: user has no telegram_id, order=%s", order.uid)
-        return False
+        return None
 
     # Build items list
     items = [
@@ -125,16 +147,41 @@ def send_order_status_notification_task(order_id: int) -> bool:
     # Get telegram username if available
     telegram_username = getattr(order.user, 'telegram_username', None) or None
 
-    result = send_order_status_notification(
-        telegram_id=telegram_id,
-        order_uid=order.uid,
-        new_status=order.status,
-        status_display=order.get_status_display(),
-        customer_phone=order.customer_phone,
-        customer_username=telegram_username,
-        order_date=order_date,
-        items=items,
-    )
+    return {
+        'telegram_id': telegram_id,
+        'order_uid': order.uid,
+        'new_status': order.status,
+        'status_display': order.get_status_display(),
+        'customer_phone': order.customer_phone,
+        'customer_username': telegram_username,
+        'order_date': order_date,
+        'items': items,
+    }
+
+
+@shared_task(
+    name='bot.send_order_status_notification',
+    max_retries=3,
+    default_retry_delay=30,
+)
+def send_order_status_notification_task(order_id: int) -> bool:
+    """
+    Celery task to send order status change notification.
+    """
+    from apps.orders.models import Order
+
+    try:
+        order = Order.objects.select_related('user').prefetch_related('items').get(pk=order_id)
+    except Order.DoesNotExist:
+        logger.error("Order not found: order_id=%s", order_id)
+        return False
+
+    kwargs = _status_notification_kwargs(order)
+    if kwargs is None:
+        return False
+
+    result = send_order_status_notification(**kwargs)
+    telegram_id = kwargs['telegram_id']
 
     if result:
         logger.info("Status notification sent: order=%s status=%s tg_id=%s", order.uid, order.status, telegram_id)
@@ -142,3 +189,43 @@ def send_order_status_notification_task(order_id: int) -> bool:
         logger.warning("Status notification failed: order=%s status=%s tg_id=%s", order.uid, order.status, telegram_id)
 
     return result
+
+
+@shared_task(
+    name='bot.send_order_status_notifications',
+    bind=True,
+    max_retries=3,
+    default_retry_delay=30,
+)
+def send_order_status_notifications_task(self, order_ids: list[int]) -> int:
+    """
+    Celery task to notify customers of many orders at once (bulk status change).
+
+    Orders are loaded in one query, messages are sent concurrently
+    through the pooled Telegram client. Failed sends are retried
+    for the failed orders only.
+    """
+    from apps.orders.models import Order
+
+    orders = Order.objects.filter(pk__in=order_ids).select_related('user').prefetch_related('items')
+    pending = [
+        (order.pk, kwargs) for order in orders
+        if (kwargs := _status_notification_kwargs(order)) is not None
+    ]
+
+    if not pending:
+        return 0
+
+    results = send_order_status_notifications([kwargs for _, kwargs in pending])
+    sent = sum(results)
+    failed_ids = [order_id for (order_id, _), ok in zip(pending, results, strict=True) if not ok]
+    logger.info(
+        "Bulk status notifications completed: orders=%d sent=%d failed=%d",
+        len(order_ids), sent, len(failed_ids),
+    )
+
+    if failed_ids and self.request.retries < self.max_retries:
+        raise self.retry(kwargs={'order_ids': failed_ids})
+    if failed_ids:
+        logger.error("Bulk status notifications gave up: order_ids=%s", failed_ids)
+    return sent
@@ -0,0 +1,30 @@
+"""
+Celery tasks for the task outbox.
+"""
+import logging
+
+from celery import shared_task
+
+from apps.bot.services.outbox import relay_outbox
+
+logger = logging.getLogger(__name__)
+
+# Upper bound of tasks published per run, so one run fits the beat interval
+MAX_BATCHES_PER_RUN = 10
+
+
+@shared_task(name='bot.relay_task_outbox')
+def relay_task_outbox_task(batch_size: int = 100) -> int:
+    """
+    Celery beat task: publish committed outbox rows to the broker.
+    """
+    published = 0
+    for _ in range(MAX_BATCHES_PER_RUN):
+        count = relay_outbox(batch_size=batch_size)
+        published += count
+        if count < batch_size:
+            break
+
+    if published:
+        logger.info("Task outbox relayed: published=%d", published)
+    return published
@@ -1,16 +1,27 @@
 """
 Tests for admin order notifications.
 """
+from unittest.mock import MagicMock, patch
+
 import pytest
-from unittest.mock import patch, MagicMock
-from django.conf import settings
 
-from apps.bot.models import BotAdmin
-from apps.bot.services.notifications import send_admin_order_notification, format_price
+from apps.bot.models import BotAdmin, TaskOutbox
+from apps.bot.services.notifications import format_price, send_admin_order_notification
 from apps.bot.tasks.notifications import send_admin_order_notification_task
 from apps.users.models import User
 
 
+def _outbox_kwargs(task_name):
+    """Kwargs of the single outbox row for a task."""
+    return TaskOutbox.objects.get(task_name=task_name).kwargs
+
+
+@pytest.fixture(autouse=True)
+def bot_token(settings):
+    """Configure bot token for notification services."""
+    settings.TELEGRAM_BOT_TOKEN = 'test-token'
+
+
 @pytest.fixture
 def user(db):
     """Create a test user."""
@@ -102,7 +113,7 @@ class TestFormatPrice:
 class TestSendAdminOrderNotification:
     """Tests for send_admin_order_notification service."""
 
-    @patch('apps.bot.services.notifications.requests.post')
+    @patch('apps.bot.services.telegram_client.requests.Session.post')
     def test_sends_to_all_active_admins_with_telegram_id(
         self, mock_post, admin1, admin2, inactive_admin, admin_without_telegram_id, order_items
     ):
@@ -112,7 +123,7 @@ class TestSendAdminOrderNotification:
         mock_post.return_value = mock_response
 
         result = send_admin_order_notification(
-            order_id=123,
+            order_uid='123',
             items=order_items,
             total=515000,
             delivery_fee=30000,
@@ -133,7 +144,7 @@ class TestSendAdminOrderNotification:
         ]
         assert set(called_chat_ids) == {111111111, 222222222}
 
-    @patch('apps.bot.services.notifications.requests.post')
+    @patch('apps.bot.services.telegram_client.requests.Session.post')
     def test_message_contains_order_info(self, mock_post, admin1, order_items):
         """Should include order info in message."""
         mock_response = MagicMock()
@@ -141,7 +152,7 @@ class TestSendAdminOrderNotification:
         mock_post.return_value = mock_response
 
         send_admin_order_notification(
-            order_id=456,
+            order_uid='456',
             items=order_items,
             total=515000,
             delivery_fee=30000,
@@ -174,7 +185,7 @@ class TestSendAdminOrderNotification:
         assert '📍 ул. Ленина, д. 5' in message
         assert '📅 01.02.2026, 10:00-14:00' in message
 
-    @patch('apps.bot.services.notifications.requests.post')
+    @patch('apps.bot.services.telegram_client.requests.Session.post')
     def test_shows_phone_when_no_username(self, mock_post, admin1, order_items):
         """Should show phone number when customer has no username."""
         mock_response = MagicMock()
@@ -182,7 +193,7 @@ class TestSendAdminOrderNotification:
         mock_post.return_value = mock_response
 
         send_admin_order_notification(
-            order_id=789,
+            order_uid='789',
             items=order_items,
             total=515000,
             delivery_fee=0,
@@ -196,7 +207,7 @@ class TestSendAdminOrderNotification:
         assert '📱 +79991112233' in message
         assert '@' not in message.split('📱')[1].split('\n')[0]
 
-    @patch('apps.bot.services.notifications.requests.post')
+    @patch('apps.bot.services.telegram_client.requests.Session.post')
     def test_shows_dash_when_no_contact(self, mock_post, admin1, order_items):
         """Should show dash when no username and no phone."""
         mock_response = MagicMock()
@@ -204,7 +215,7 @@ class TestSendAdminOrderNotification:
         mock_post.return_value = mock_response
 
         send_admin_order_notification(
-            order_id=111,
+            order_uid='111',
             items=order_items,
             total=515000,
             delivery_fee=0,
@@ -217,7 +228,7 @@ class TestSendAdminOrderNotification:
         message = mock_post.call_args[1]['json']['text']
         assert '📱 —' in message
 
-    @patch('apps.bot.services.notifications.requests.post')
+    @patch('apps.bot.services.telegram_client.requests.Session.post')
     def test_hides_delivery_fee_when_zero(self, mock_post, admin1, order_items):
         """Should not show delivery fee line when it's zero."""
         mock_response = MagicMock()
@@ -225,7 +236,7 @@ class TestSendAdminOrderNotification:
         mock_post.return_value = mock_response
 
         send_admin_order_notification(
-            order_id=222,
+            order_uid='222',
             items=order_items,
             total=515000,
             delivery_fee=0,
@@ -238,11 +249,11 @@ class TestSendAdminOrderNotification:
         assert '🚚' not in message
 
     @pytest.mark.django_db
-    @patch('apps.bot.services.notifications.requests.post')
+    @patch('apps.bot.services.telegram_client.requests.Session.post')
     def test_returns_zero_when_no_admins(self, mock_post, order_items):
         """Should return 0 when no active admins with telegram_id."""
         result = send_admin_order_notification(
-            order_id=333,
+            order_uid='333',
             items=order_items,
             total=100000,
             delivery_fee=0,
@@ -253,7 +264,7 @@ class TestSendAdminOrderNotification:
         assert result == 0
         mock_post.assert_not_called()
 
-    @patch('apps.bot.services.notifications.requests.post')
+    @patch('apps.bot.services.telegram_client.requests.Session.post')
     def test_handles_partial_failures(self, mock_post, admin1, admin2, order_items):
         """Should count only successful sends."""
         success_response = MagicMock()
@@ -266,7 +277,7 @@ class TestSendAdminOrderNotification:
         mock_post.side_effect = [success_response, fail_response]
 
         result = send_admin_order_notification(
-            order_id=444,
+            order_uid='444',
             items=order_items,
             total=100000,
             delivery_fee=0,
@@ -276,14 +287,14 @@ class TestSendAdminOrderNotification:
 
         assert result == 1
 
-    @patch('apps.bot.services.notifications.requests.post')
+    @patch('apps.bot.services.telegram_client.requests.Session.post')
     def test_handles_request_exception(self, mock_post, admin1, order_items):
         """Should handle request exceptions gracefully."""
         import requests
         mock_post.side_effect = requests.exceptions.Timeout()
 
         result = send_admin_order_notification(
-            order_id=555,
+            order_uid='555',
             items=order_items,
             total=100000,
             delivery_fee=0,
@@ -299,7 +310,7 @@ class TestSendAdminOrderNotification:
         mock_settings.TELEGRAM_BOT_TOKEN = None
 
         result = send_admin_order_notification(
-            order_id=666,
+            order_uid='666',
             items=order_items,
             total=100000,
             delivery_fee=0,
@@ -319,7 +330,7 @@ class TestSendAdminOrderNotificationTask:
         mock_service.return_value = 2
 
         result = send_admin_order_notification_task(
-            order_id=123,
+            order_uid='123',
             items=order_items,
             total=515000,
             delivery_fee=30000,
@@ -333,7 +344,7 @@ class TestSendAdminOrderNotificationTask:
 
         assert result == 2
         mock_service.assert_called_once_with(
-            order_id=123,
+            order_uid='123',
             items=order_items,
             total=515000,
             delivery_fee=30000,
@@ -351,7 +362,7 @@ class TestSendAdminOrderNotificationTask:
         mock_service.return_value = 1
 
         result = send_admin_order_notification_task(
-            order_id=456,
+            order_uid='456',
             items=order_items,
             total=100000,
             delivery_fee=0,
@@ -370,14 +381,10 @@ class TestSendAdminOrderNotificationTask:
 class TestOrderSerializerIntegration:
     """Integration tests for order creation with admin notifications."""
 
-    @patch('apps.bot.tasks.notifications.send_admin_order_notification_task.delay')
-    @patch('apps.bot.tasks.notifications.send_order_notification_task.delay')
-    def test_order_creation_triggers_admin_notification(
-        self, mock_client_task, mock_admin_task, user
-    ):
+    def test_order_creation_triggers_admin_notification(self, user):
         """Creating an order should trigger admin notification task."""
         from apps.orders.serializers.order import OrderCreateSerializer
-        from apps.products.models import Product, Category
+        from apps.products.models import Category, Product
 
         # Create test product
         category = Category.objects.create(title='Test Category', slug='test')
@@ -403,11 +410,10 @@ class TestOrderSerializerIntegration:
         assert serializer.is_valid(), serializer.errors
         order = serializer.save()
 
-        # Verify admin notification was triggered
-        mock_admin_task.assert_called_once()
-        call_kwargs = mock_admin_task.call_args[1]
+        # Verify admin notification was queued in the outbox
+        call_kwargs = _outbox_kwargs('bot.send_admin_order_notification')
 
-        assert call_kwargs['order_id'] == order.id
+        assert call_kwargs['order_uid'] == order.uid
         assert call_kwargs['customer_name'] == 'Test Customer'
         assert call_kwargs['customer_username'] == 'testusername'
         assert call_kwargs['customer_phone'] == '+79991234567'
@@ -415,14 +421,10 @@ class TestOrderSerializerIntegration:
         assert len(call_kwargs['items']) == 1
         assert call_kwargs['items'][0]['title'] == 'Test Product'
 
-    @patch('apps.bot.tasks.notifications.send_admin_order_notification_task.delay')
-    @patch('apps.bot.tasks.notifications.send_order_notification_task.delay')
-    def test_order_creation_sends_empty_username_as_none(
-        self, mock_client_task, mock_admin_task, user_without_username
-    ):
+    def test_order_creation_sends_empty_username_as_none(self, user_without_username):
         """Should pass None for username when user has empty username."""
         from apps.orders.serializers.order import OrderCreateSerializer
-        from apps.products.models import Product, Category
+        from apps.products.models import Category, Product
 
         category = Category.objects.create(title='Test Category 2', slug='test2')
         product = Product.objects.create(
@@ -447,17 +449,13 @@ class TestOrderSerializerIntegration:
         serializer.save()
 
         # Username should be None (empty string converted to None)
-        call_kwargs = mock_admin_task.call_args[1]
+        call_kwargs = _outbox_kwargs('bot.send_admin_order_notification')
         assert call_kwargs['customer_username'] is None
 
-    @patch('apps.bot.tasks.notifications.send_admin_order_notification_task.delay')
-    @patch('apps.bot.tasks.notifications.send_order_notification_task.delay')
-    def test_order_creation_without_client_telegram_id(
-        self, mock_client_task, mock_admin_task, db
-    ):
+    def test_order_creation_without_client_telegram_id(self, db):
         """Admin notification should work even if client has no telegram_id."""
         from apps.orders.serializers.order import OrderCreateSerializer
-        from apps.products.models import Product, Category
+        from apps.products.models import Category, Product
 
         # User without telegram_id
         user = User.objects.create_user(
@@ -489,8 +487,114 @@ class TestOrderSerializerIntegration:
         assert serializer.is_valid(), serializer.errors
         serializer.save()
 
-        # Client notification should NOT be called (no telegram_id)
-        mock_client_task.assert_not_called()
+        # Client notification should NOT be queued (no telegram_id)
+        assert not TaskOutbox.objects.filter(task_name='bot.send_order_notification').exists()
+
+        # Admin notification should still be queued
+        assert TaskOutbox.objects.filter(task_name='bot.send_admin_order_notification').count() == 1
+
+    @patch('apps.bot.services.outbox.current_app.send_task')
+    def test_outbox_relay_publishes_and_deletes(self, mock_send_task, user):
+        """Relay publishes queued tasks in order and removes them."""
+        from apps.bot.services.outbox import enqueue_task
+        from apps.bot.tasks import relay_task_outbox_task, send_order_status_notification_task
+
+        enqueue_task(send_order_status_notification_task, order_id=1)
+        enqueue_task(send_order_status_notification_task, order_id=2)
+
+        assert relay_task_outbox_task() == 2
+        assert [c.kwargs['kwargs'] for c in mock_send_task.call_args_list] == [
+            {'order_id': 1},
+            {'order_id': 2},
+        ]
+        assert not TaskOutbox.objects.exists()
+
+    @patch('apps.bot.services.outbox.current_app.send_task')
+    def test_enqueue_skips_broker(self, mock_send_task, user, django_capture_on_commit_callbacks):
+        """Enqueueing only inserts a row: nothing runs after commit, the relay publishes."""
+        from apps.bot.services.outbox import enqueue_task
+        from apps.bot.tasks import send_order_status_notification_task
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            enqueue_task(send_order_status_notification_task, order_id=1)
+
+        assert callbacks == []
+        mock_send_task.assert_not_called()
+        assert TaskOutbox.objects.count() == 1
+
+
+class TestAdminOrderDigest:
+    """Tests for coalesced admin notifications."""
+
+    @pytest.fixture(autouse=True)
+    def digest_window(self, settings):
+        settings.ADMIN_ORDER_DIGEST_WINDOW = 30
+
+    def _payload(self, uid, order_items):
+        return {
+            'order_uid': uid,
+            'items': order_items,
+            'total': 515000,
+            'delivery_fee': 0,
+            'delivery_address': 'Адрес',
+            'customer_name': 'Клиент',
+            'customer_username': 'user',
+        }
+
+    @patch('apps.bot.services.telegram_client.requests.Session.post')
+    def test_first_order_sent_immediately_then_buffered(self, mock_post, admin1, order_items):
+        """Quiet period: first order goes out; burst orders are buffered."""
+        mock_post.return_value = MagicMock(status_code=200)
+
+        assert send_admin_order_notification_task(**self._payload('100001', order_items)) == 1
+        assert send_admin_order_notification_task(**self._payload('100002', order_items)) == 0
+        assert send_admin_order_notification_task(**self._payload('100003', order_items)) == 0
+        assert mock_post.call_count == 1
+
+    @patch('apps.bot.services.telegram_client.requests.Session.post')
+    def test_flush_sends_one_message_per_admin(self, mock_post, admin1, admin2, order_items):
+        """Buffered orders are sent as one digest to each admin."""
+        from apps.bot.services.admin_digest import buffer_admin_order
+        from apps.bot.tasks.notifications import flush_admin_order_digest_task
+
+        mock_post.return_value = MagicMock(status_code=200)
+        buffer_admin_order(self._payload('100001', order_items))
+        buffer_admin_order(self._payload('100002', order_items))
+
+        assert flush_admin_order_digest_task() == 2
+        assert mock_post.call_count == 2
+
+        message = mock_post.call_args[1]['json']['text']
+        assert '🆕 Новые заказы: 2' in message
+        assert '#100001' in message and '#100002' in message
+        assert '💰 Всего: 10 300 ₽' in message
+
+        # Buffer is empty after flush
+        assert flush_admin_order_digest_task() == 0
+        assert mock_post.call_count == 2
+
+    @patch('apps.bot.services.telegram_client.requests.Session.post')
+    def test_undelivered_digest_is_kept(self, mock_post, admin1, order_items):
+        """Buffer survives a flush that reached no admin."""
+        from apps.bot.services.admin_digest import buffer_admin_order, flush_admin_digest
+
+        buffer_admin_order(self._payload('100001', order_items))
+        buffer_admin_order(self._payload('100002', order_items))
+
+        mock_post.return_value = MagicMock(status_code=500)
+        assert flush_admin_digest() == 0
+
+        mock_post.return_value = MagicMock(status_code=200)
+        assert flush_admin_digest() == 2
+        assert '#100001' in mock_post.call_args[1]['json']['text']
+
+    @patch('apps.bot.services.telegram_client.requests.Session.post')
+    def test_single_buffered_order_uses_regular_format(self, mock_post, admin1, order_items):
+        """A digest with one order looks like a normal notification."""
+        from apps.bot.services.admin_digest import buffer_admin_order, flush_admin_digest
+
+        mock_post.return_value = MagicMock(status_code=200)
+        buffer_admin_order(self._payload('100001', order_items))
 
-        # Admin notification should still be called
-        mock_admin_task.assert_called_once()
+        assert flush_admin_digest() == 1
+        assert '🆕 Новый заказ #100001' in mock_post.call_args[1]['json']['text']
@@ -0,0 +1,69 @@
+"""
+Tests for cached BotAdmin lookups.
+"""
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.bot.models import BotAdmin
+
+
+@pytest.mark.django_db
+class TestBotAdminCache:
+    """Admin checks are served from the cached snapshot."""
+
+    def test_lookups_without_queries(self):
+        """Only the first lookup loads admins from DB."""
+        BotAdmin.objects.create(username='@Boss', telegram_id=100)
+        BotAdmin.objects.create(username='@inactive', telegram_id=200, is_active=False)
+        BotAdmin.active_admins()
+
+        with CaptureQueriesContext(connection) as ctx:
+            assert BotAdmin.is_admin(telegram_id=100)
+            assert BotAdmin.is_admin(username='boss')
+            assert not BotAdmin.is_admin(telegram_id=200)
+            assert BotAdmin.get_and_update(100, 'boss').username == '@Boss'
+            assert BotAdmin.notification_chat_ids() == [(100, '@Boss')]
+
+        assert len(ctx.captured_queries) == 0
+
+    def test_save_and_delete_invalidate(self, django_capture_on_commit_callbacks):
+        """Committed changes to admins are visible right away."""
+        with django_capture_on_commit_callbacks(execute=True):
+            admin = BotAdmin.objects.create(username='@boss', telegram_id=100)
+        assert BotAdmin.is_admin(telegram_id=100)
+
+        admin.is_active = False
+        with django_capture_on_commit_callbacks(execute=True):
+            admin.save()
+        assert not BotAdmin.is_admin(telegram_id=100)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            other = BotAdmin.objects.create(username='@other', telegram_id=300)
+        assert BotAdmin.is_admin(telegram_id=300)
+        with django_capture_on_commit_callbacks(execute=True):
+            other.delete()
+        assert not BotAdmin.is_admin(telegram_id=300)
+
+    def test_invalidated_only_after_commit(self, django_capture_on_commit_callbacks):
+        """Version is not bumped before the saving transaction commits."""
+        BotAdmin.active_admins()
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            BotAdmin.objects.create(username='@boss', telegram_id=100)
+            assert not BotAdmin.is_admin(telegram_id=100)
+
+        assert callbacks == [BotAdmin.invalidate_cache]
+
+    def test_get_and_update_fills_telegram_id(self, django_capture_on_commit_callbacks):
+        """Admin added by username gets telegram_id on first command."""
+        with django_capture_on_commit_callbacks(execute=True):
+            BotAdmin.objects.create(username='@boss', note='Владелец')
+
+        with django_capture_on_commit_callbacks(execute=True):
+            admin = BotAdmin.get_and_update(555, 'Boss')
+
+        # Complete instance from the snapshot, not a partial one
+        assert admin.note == 'Владелец' and admin.is_active and admin.created_at
+        assert BotAdmin.objects.get(username='@boss').telegram_id == 555
+        assert BotAdmin.notification_chat_ids() == [(555, '@boss')]
@@ -0,0 +1,157 @@
+"""
+Tests for broadcast audience resolution.
+"""
+from datetime import timedelta
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.bot.handlers.broadcast import _find_users_by_usernames, get_audience_queryset, get_users_by_usernames
+from apps.bot.models import AudienceSegmentMember
+from apps.bot.services.audience import compute_audience_counts, get_audience_counts
+from apps.bot.services.segments import refresh_segments, refresh_user_segments
+from apps.orders.models import Order, OrderStatus
+from apps.users.models import User
+
+
+@pytest.fixture
+def users(db):
+    """Create users matched by telegram_username and by username."""
+    return [
+        User.objects.create_user(
+            username='tg_1', telegram_id=1, telegram_username='alice',
+        ),
+        User.objects.create_user(
+            username='Bob', telegram_id=2, telegram_username='',
+        ),
+        User.objects.create_user(
+            username='tg_3', telegram_id=None, telegram_username='carol',
+        ),
+    ]
+
+
+@pytest.mark.django_db
+class TestGetUsersByUsernames:
+    """Tests for get_users_by_usernames."""
+
+    def test_matches_both_fields_case_insensitive(self, users):
+        """Usernames match telegram_username and username regardless of case."""
+        result = get_users_by_usernames(['ALICE', '@bob'])
+
+        assert set(result.values_list('telegram_id', flat=True)) == {1, 2}
+
+    def test_skips_users_without_telegram_id(self, users):
+        """Users without telegram_id are not recipients."""
+        assert not get_users_by_usernames(['carol']).exists()
+
+    def test_empty_list(self, users):
+        """Empty list returns empty queryset without a query."""
+        with CaptureQueriesContext(connection) as ctx:
+            assert list(get_users_by_usernames([])) == []
+        assert len(ctx.captured_queries) == 0
+
+    def test_single_query_for_large_list(self, users):
+        """Thousands of usernames are resolved with one query."""
+        usernames = [f'user{i}' for i in range(3000)] + ['alice']
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = list(get_users_by_usernames(usernames))
+
+        assert len(ctx.captured_queries) == 1
+        assert [u.telegram_id for u in result] == [1]
+
+
+@pytest.mark.django_db
+def test_find_users_partitions_in_memory(users):
+    """Found / not found split is computed from one result set."""
+    found, not_found = async_to_sync(_find_users_by_usernames)(['alice', 'bob', 'carol', 'dave'])
+
+    assert sorted(u['telegram_id'] for u in found) == [1, 2]
+    assert not_found == ['carol', 'dave']
+
+
+@pytest.mark.django_db
+class TestAudienceCounts:
+    """Tests for cached audience counts."""
+
+    @pytest.fixture
+    def orders(self, users):
+        alice = users[0]
+        for status in (OrderStatus.DONE, OrderStatus.DONE, OrderStatus.NEW):
+            Order.objects.create(user=alice, status=status)
+        refresh_segments()
+
+    def test_counts_in_one_query(self, orders):
+        """All segment sizes come from a single aggregate query."""
+        with CaptureQueriesContext(connection) as ctx:
+            counts = compute_audience_counts()
+
+        assert len(ctx.captured_queries) == 1
+        assert counts == {'all': 2, 'customers': 1, 'vip': 1, 'new': 2, 'inactive': 0}
+
+    def test_counts_match_querysets(self, orders):
+        """Aggregated counts agree with get_audience_queryset()."""
+        counts = compute_audience_counts()
+
+        for key in counts:
+            assert counts[key] == get_audience_queryset(key).count()
+
+    def test_cached_counts_served_without_queries(self, orders):
+        """Second call is answered from cache."""
+        first = get_audience_counts()
+        with CaptureQueriesContext(connection) as ctx:
+            second = get_audience_counts()
+
+        assert second == first
+        assert len(ctx.captured_queries) == 0
+
+
+@pytest.mark.django_db
+class TestAudienceSegments:
+    """Tests for precomputed segment membership."""
+
+    def test_full_refresh_is_idempotent(self, users):
+        """Second full refresh adds and removes nothing."""
+        first = refresh_segments()
+        second = refresh_segments()
+
+        # NEW was filled on registration already
+        assert first['new'] == {**first['new'], 'added': 0, 'removed': 0, 'total': 2}
+        assert all(s['added'] == 0 and s['removed'] == 0 for s in second.values())
+
+    def test_registration_joins_new_segment(self, users):
+        """New users are members of NEW right after registration; old ones are not."""
+        assert set(
+            AudienceSegmentMember.objects.filter(segment='new').values_list('telegram_id', flat=True)
+        ) == {1, 2}
+
+        old = User(username='old', telegram_id=4, date_joined=timezone.now() - timedelta(days=30))
+        old.save()
+        carol = users[2]
+        carol.telegram_id = 3
+        carol.save(update_fields=['telegram_id'])
+
+        assert set(
+            AudienceSegmentMember.objects.filter(segment='new').values_list('telegram_id', flat=True)
+        ) == {1, 2, 3}
+
+    def test_user_refresh_follows_orders(self, users):
+        """Incremental refresh moves a user in and out of order-based segments."""
+        alice = users[0]
+        orders = [Order.objects.create(user=alice, status=OrderStatus.DONE) for _ in range(2)]
+
+        membership = refresh_user_segments(alice.pk)
+
+        assert membership['customers'] and membership['vip']
+        assert set(
+            AudienceSegmentMember.objects.filter(user=alice).values_list('segment', flat=True)
+        ) == {'customers', 'vip', 'new'}
+
+        Order.objects.filter(pk=orders[0].pk).update(status=OrderStatus.CANCELLED)
+        membership = refresh_user_segments(alice.pk)
+
+        assert membership['customers'] and not membership['vip']
+        assert not AudienceSegmentMember.objects.filter(user=alice, segment='vip').exists()
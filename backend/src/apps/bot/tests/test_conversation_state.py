@@ -0,0 +1,112 @@
+"""
+Tests for cached conversation state.
+"""
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.bot.models import ConversationState
+
+
+@pytest.mark.django_db
+class TestConversationState:
+    """Tests for ConversationState cache with DB write-behind."""
+
+    def test_user_without_state_hits_db_once(self):
+        """Missing state is cached (negative caching)."""
+        with CaptureQueriesContext(connection) as ctx:
+            assert ConversationState.get_state(1) == ('', {})
+            assert ConversationState.get_state(1) == ('', {})
+
+        assert len(ctx.captured_queries) == 1
+        assert not ConversationState.objects.exists()
+
+    def test_set_and_update_without_queries(self):
+        """Wizard steps are served from cache."""
+        ConversationState.get_state(1)
+
+        with CaptureQueriesContext(connection) as ctx:
+            ConversationState.set_state(1, 'broadcast_choose_audience', {'a': 1})
+            ConversationState.update_data(1, b=2)
+            state = ConversationState.get_state(1)
+
+        assert len(ctx.captured_queries) == 0
+        assert state == ('broadcast_choose_audience', {'a': 1, 'b': 2})
+        assert ConversationState.peek_state(1) == 'broadcast_choose_audience'
+
+    def test_flush_writes_latest_state(self):
+        """Flush upserts the latest cached state of every changed user."""
+        ConversationState.set_state(1, 'broadcast_confirm', {'x': 1})
+        ConversationState.set_state(2, 'broadcast_choose_type', {})
+        ConversationState.clear(2)
+
+        assert ConversationState.flush_dirty() == 2
+        assert dict(ConversationState.objects.values_list('telegram_id', 'state')) == {
+            1: 'broadcast_confirm',
+            2: '',
+        }
+
+        ConversationState.set_state(1, 'broadcast_choose_audience')
+        assert ConversationState.flush_dirty() == 1
+        assert ConversationState.objects.get(telegram_id=1).data == {'x': 1}
+        assert ConversationState.flush_dirty() == 0
+
+    def test_state_restored_from_db_after_cache_loss(self):
+        """DB copy is used when the cache entry is gone."""
+        from django.core.cache import cache
+
+        ConversationState.set_state(1, 'broadcast_confirm', {'x': 1})
+        ConversationState.flush_dirty()
+        cache.delete(ConversationState._cache_key(1))
+
+        assert ConversationState.peek_state(1) is None
+        assert ConversationState.get_state(1) == ('broadcast_confirm', {'x': 1})
+
+    def test_async_helpers(self):
+        """Async helpers share the cache with sync ones and hit DB only on a miss."""
+        from asgiref.sync import async_to_sync
+
+        ConversationState.objects.create(telegram_id=1, state='broadcast_confirm', data={'x': 1})
+
+        with CaptureQueriesContext(connection) as ctx:
+            assert async_to_sync(ConversationState.aget_state)(1) == ('broadcast_confirm', {'x': 1})
+            async_to_sync(ConversationState.aupdate_data)(1, y=2)
+            assert async_to_sync(ConversationState.aget_state)(1) == (
+                'broadcast_confirm', {'x': 1, 'y': 2},
+            )
+            async_to_sync(ConversationState.aclear)(1)
+
+        assert len(ctx.captured_queries) == 1
+        assert ConversationState.get_state(1) == ('', {})
+
+    def test_broadcast_handler_matches_cached_wizard(self):
+        """Only /broadcast and cached broadcast_* states match; a cache miss does not."""
+        from unittest.mock import MagicMock
+
+        from django.core.cache import cache
+
+        from apps.bot.handlers.broadcast import get_broadcast_handler
+
+        handler = get_broadcast_handler()
+        update = MagicMock()
+        update.message.text = 'Всем'
+        update.effective_user.id = 1
+
+        ConversationState.set_state(1, 'broadcast_choose_audience')
+        assert handler.check_update(update)
+
+        # Not cached: no DB lookup from the event loop, the message is not routed
+        ConversationState.flush_dirty()
+        cache.delete(ConversationState._cache_key(1))
+        with CaptureQueriesContext(connection) as ctx:
+            assert not handler.check_update(update)
+        assert len(ctx.captured_queries) == 0
+
+        update.message.text = '/broadcast'
+        assert handler.check_update(update)
+
+        # Known users without a wizard are filtered out from cache
+        ConversationState.get_state(2)
+        update.message.text = 'Всем'
+        update.effective_user.id = 2
+        assert not handler.check_update(update)
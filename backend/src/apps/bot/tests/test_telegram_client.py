@@ -0,0 +1,48 @@
+"""
+Tests for pooled Telegram client.
+"""
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from apps.bot.services.telegram_client import TelegramClient, get_telegram_client
+
+
+def _response(status_code):
+    response = MagicMock()
+    response.status_code = status_code
+    return response
+
+
+class TestTelegramClient:
+    """Tests for TelegramClient."""
+
+    def test_client_is_reused(self, settings):
+        """Same process and token share one session."""
+        settings.TELEGRAM_BOT_TOKEN = 'token-a'
+        assert get_telegram_client() is get_telegram_client()
+
+        settings.TELEGRAM_BOT_TOKEN = 'token-b'
+        assert get_telegram_client().token == 'token-b'
+
+    @patch('apps.bot.services.telegram_client.requests.Session.post')
+    def test_uses_connect_read_timeouts(self, mock_post):
+        """Requests go out with (connect, read) timeouts."""
+        mock_post.return_value = _response(200)
+        client = TelegramClient('token', connect_timeout=2, read_timeout=5)
+
+        assert client.send_message(1, 'hi') is True
+        assert mock_post.call_args[1]['timeout'] == (2, 5)
+
+    @patch('apps.bot.services.telegram_client.requests.Session.post')
+    def test_send_bulk_keeps_order(self, mock_post):
+        """Results follow input order; errors become False."""
+        def post(url, json, timeout):
+            if json['chat_id'] == 2:
+                raise requests.exceptions.ConnectTimeout()
+            return _response(200 if json['chat_id'] != 3 else 403)
+
+        mock_post.side_effect = post
+        client = TelegramClient('token')
+
+        assert client.send_bulk([(1, 'a'), (2, 'b'), (3, 'c'), (4, 'd')]) == [True, False, False, True]
@@ -1,7 +1,17 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.core'
     verbose_name = 'Core'
+
+    def ready(self):
+        from health_check.plugins import plugin_dir
+
+        from apps.core.health import DatabasePoolHealthCheck
+
+        for alias, config in settings.DATABASES.items():
+            if config.get('OPTIONS', {}).get('pool'):
+                plugin_dir.register(DatabasePoolHealthCheck, alias=alias)
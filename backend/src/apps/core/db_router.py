@@ -0,0 +1,52 @@
+"""
+Роутинг чтений отчётов и аналитики на реплику.
+
+Реплика (алиас 'replica') необязательна: без DB_REPLICA_HOST всё идёт
+в основную БД. Записи, миграции, заказы, товары и остатки — всегда на
+основной БД (read-your-writes для оформления заказа).
+"""
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_ALIAS = 'replica'
+
+# Модели, чтения которых допустимо отдавать с реплики (отставание в секунды не критично)
+REPORTING_MODELS = {
+    'analytics.analyticsevent',
+    'analytics.dailystats',
+    'analytics.customerstats',
+}
+
+# Приложения, чтения которых всегда идут на основную БД
+PRIMARY_APPS = {'orders', 'products', 'cart', 'payments'}
+
+
+def replica_configured() -> bool:
+    return REPLICA_ALIAS in connections.settings
+
+
+def get_reporting_db() -> str:
+    """Алиас БД для тяжёлых чтений отчётов: реплика, если настроена."""
+    return REPLICA_ALIAS if replica_configured() else DEFAULT_DB_ALIAS
+
+
+class ReplicaRouter:
+    """Отчётные модели читаются с реплики, остальное — по умолчанию."""
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label in PRIMARY_APPS:
+            return DEFAULT_DB_ALIAS
+        if model._meta.label_lower in REPORTING_MODELS:
+            return get_reporting_db()
+        return None
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Реплика — копия основной БД, связи между ними допустимы
+        if {obj1._state.db, obj2._state.db} <= {DEFAULT_DB_ALIAS, REPLICA_ALIAS}:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db != REPLICA_ALIAS
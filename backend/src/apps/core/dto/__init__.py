@@ -1,6 +1,9 @@
 """Core DTOs."""
-from apps.core.dto.base import PaginatedDTO
+from apps.core.dto.base import PaginatedDTO, format_datetime, format_iso, format_price
 
 __all__ = [
     'PaginatedDTO',
+    'format_datetime',
+    'format_iso',
+    'format_price',
 ]
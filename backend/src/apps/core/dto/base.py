@@ -1,7 +1,10 @@
 """Base DTO classes."""
 from dataclasses import dataclass
+from datetime import date, datetime, time
 from typing import Any
 
+from rest_framework import serializers
+
 
 @dataclass(frozen=True)
 class PaginatedDTO:
@@ -11,3 +14,23 @@ class PaginatedDTO:
     page: int
     page_size: int
     total_pages: int
+
+
+# === Форматирование для to_dict() (как у DRF-сериализаторов) ===
+
+_datetime_field = serializers.DateTimeField()
+
+
+def format_price(kopeks: int) -> str:
+    """Цена для отображения: 1 500 ₽ (неразрывные пробелы, чтобы ₽ не переносился)."""
+    return f"{kopeks // 100:,}".replace(',', '\xa0') + '\xa0₽'
+
+
+def format_datetime(value: datetime | None) -> str | None:
+    """Дата-время в текущей таймзоне, как DateTimeField DRF."""
+    return _datetime_field.to_representation(value) if value else None
+
+
+def format_iso(value: date | time | None) -> str | None:
+    """Дата или время в ISO 8601, как DateField/TimeField DRF."""
+    return value.isoformat() if value else None
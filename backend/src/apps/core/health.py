@@ -0,0 +1,39 @@
+"""Health checks for django-health-check."""
+from django.conf import settings
+from django.db import connections
+from health_check.backends import BaseHealthCheckBackend
+from health_check.exceptions import ServiceWarning
+
+
+class DatabasePoolHealthCheck(BaseHealthCheckBackend):
+    """
+    Насыщение пула соединений psycopg (DB_POOL=true).
+
+    Статистика относится к процессу, который обслуживает запрос health check.
+    Предупреждение не роняет весь /health/: пул может быть занят под нагрузкой.
+    """
+
+    critical_service = False
+
+    def __init__(self, alias: str = 'default'):
+        super().__init__()
+        self.alias = alias
+
+    def check_status(self):
+        pool = connections[self.alias].pool
+        if pool is None:
+            return
+
+        stats = pool.get_stats()
+        in_use = stats['pool_size'] - stats['pool_available']
+        waiting = stats.get('requests_waiting', 0)
+
+        if waiting:
+            raise ServiceWarning(
+                f"{waiting} requests waiting for a connection ({in_use}/{stats['pool_max']} in use)"
+            )
+        if in_use >= stats['pool_max'] * settings.DB_POOL_SATURATION_WARNING:
+            raise ServiceWarning(f"pool almost exhausted: {in_use}/{stats['pool_max']} in use")
+
+    def identifier(self):
+        return f'{self.__class__.__name__}[{self.alias}]'
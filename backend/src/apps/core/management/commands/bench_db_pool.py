@@ -0,0 +1,87 @@
+"""
+Django management command для замера соединений с БД под всплеском нагрузки.
+
+Эмулирует запросы Django в потоках: на каждый «запрос» — несколько коротких
+запросов к БД и close_old_connections() в конце, как после request_finished.
+Печатает p50/p99 и максимум соединений к базе (по pg_stat_activity).
+Сравните запуск без пула и с пулом:
+
+    DB_POOL=false DB_CONN_MAX_AGE=0 python manage.py bench_db_pool --threads 50
+    DB_POOL=true python manage.py bench_db_pool --threads 50
+"""
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import psycopg
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection, connections
+
+
+def _count_connections(stop: threading.Event, peak: list[int]) -> None:
+    """Sample the number of backends of our database (own connection outside the pool)."""
+    db = settings.DATABASES['default']
+    with psycopg.connect(
+        dbname=db['NAME'],
+        user=db['USER'],
+        password=db['PASSWORD'],
+        host=db['HOST'],
+        port=db['PORT'],
+        autocommit=True,
+    ) as conn:
+        while not stop.is_set():
+            count = conn.execute(
+                "SELECT count(*) FROM pg_stat_activity WHERE datname = current_database()"
+            ).fetchone()[0]
+            # Minus this sampling connection
+            peak[0] = max(peak[0], count - 1)
+            time.sleep(0.02)
+
+
+class Command(BaseCommand):
+    help = 'Всплеск коротких запросов к БД: задержки и число соединений (с пулом и без)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=50, help='Одновременных «запросов»')
+        parser.add_argument('--requests', type=int, default=2000, help='Всего «запросов»')
+        parser.add_argument('--queries', type=int, default=3, help='Запросов к БД на один «запрос»')
+
+    def handle(self, *args, **options):
+        pool_options = settings.DATABASES['default']['OPTIONS'].get('pool')
+        self.stdout.write(
+            f"Пул: {pool_options or 'нет'}, "
+            f"CONN_MAX_AGE={settings.DATABASES['default']['CONN_MAX_AGE']}"
+        )
+
+        stop = threading.Event()
+        peak = [0]
+        sampler = threading.Thread(target=_count_connections, args=(stop, peak), daemon=True)
+        sampler.start()
+
+        def request(_) -> float:
+            started = time.perf_counter()
+            close_old_connections()
+            with connection.cursor() as cursor:
+                for _ in range(options['queries']):
+                    cursor.execute('SELECT 1')
+            close_old_connections()
+            return (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['threads']) as executor:
+            latencies = list(executor.map(request, range(options['requests'])))
+            # Закрыть соединения рабочих потоков
+            list(executor.map(lambda _: connections.close_all(), range(options['threads'])))
+        elapsed = time.perf_counter() - started
+
+        stop.set()
+        sampler.join()
+
+        quantiles = statistics.quantiles(latencies, n=100)
+        self.stdout.write(f"RPS: {len(latencies) / elapsed:.0f}")
+        self.stdout.write(
+            f"Задержка, мс: p50={quantiles[49]:.1f} p99={quantiles[98]:.1f} max={max(latencies):.1f}"
+        )
+        self.stdout.write(f"Соединений к БД (максимум): {peak[0]}")
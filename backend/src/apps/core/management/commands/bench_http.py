@@ -0,0 +1,102 @@
+"""
+Django management command для нагрузочного замера HTTP API.
+
+Шлёт смешанную нагрузку (несколько путей по кругу) на запущенный сервер
+и печатает RPS и перцентили задержки. Для сравнения WSGI и ASGI запустите
+сервер в каждом режиме (SERVER_MODE=wsgi / asgi) и прогоните одну и ту же
+команду:
+
+    python manage.py bench_http --base-url http://localhost:8000 --requests 5000 --concurrency 100
+    python manage.py bench_http --path /api/v1/products/?page=2 --path /api/v1/categories/
+"""
+import asyncio
+import statistics
+import time
+
+import httpx
+from django.core.management.base import BaseCommand, CommandError
+
+DEFAULT_PATHS = [
+    '/api/v1/products/',
+    '/api/v1/products/?page=2',
+    '/api/v1/products/?ordering=price',
+    '/api/v1/products/categories/',
+    '/api/v1/pages/about/',
+]
+
+
+class Command(BaseCommand):
+    help = 'Нагрузочный замер API: RPS и задержки (p50/p95/p99) под смешанной нагрузкой'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://localhost:8000', help='Адрес сервера')
+        parser.add_argument(
+            '--path',
+            action='append',
+            dest='paths',
+            help='Путь запроса (можно несколько раз); по умолчанию каталог, категории и страница',
+        )
+        parser.add_argument('--requests', type=int, default=2000, help='Всего запросов')
+        parser.add_argument('--concurrency', type=int, default=50, help='Одновременных запросов')
+        parser.add_argument(
+            '--header',
+            action='append',
+            default=[],
+            help='Заголовок "Name: value" (например, X-Telegram-Init-Data)',
+        )
+
+    def handle(self, *args, **options):
+        headers = {}
+        for header in options['header']:
+            name, sep, value = header.partition(':')
+            if not sep:
+                raise CommandError(f'Неверный заголовок: {header}')
+            headers[name.strip()] = value.strip()
+
+        paths = options['paths'] or DEFAULT_PATHS
+        latencies, errors, elapsed = asyncio.run(self._run(paths, headers, options))
+
+        if not latencies:
+            raise CommandError('Ни один запрос не выполнен успешно')
+
+        quantiles = statistics.quantiles(latencies, n=100)
+        self.stdout.write(f"Запросов: {options['requests']}, параллельно: {options['concurrency']}")
+        self.stdout.write(f"Ошибок: {errors}")
+        self.stdout.write(f"RPS: {len(latencies) / elapsed:.0f}")
+        self.stdout.write(
+            f"Задержка, мс: p50={quantiles[49]:.1f} p95={quantiles[94]:.1f} "
+            f"p99={quantiles[98]:.1f} max={max(latencies):.1f}"
+        )
+
+    async def _run(self, paths, headers, options) -> tuple[list[float], int, float]:
+        latencies = []
+        errors = 0
+        semaphore = asyncio.Semaphore(options['concurrency'])
+        limits = httpx.Limits(max_connections=options['concurrency'])
+
+        async with httpx.AsyncClient(
+            base_url=options['base_url'],
+            headers=headers,
+            limits=limits,
+            timeout=30,
+        ) as client:
+
+            async def request(n: int) -> None:
+                nonlocal errors
+                async with semaphore:
+                    started = time.perf_counter()
+                    try:
+                        response = await client.get(paths[n % len(paths)])
+                    except httpx.HTTPError:
+                        errors += 1
+                        return
+                    if response.status_code >= 500:
+                        errors += 1
+                        return
+                    latencies.append((time.perf_counter() - started) * 1000)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(request(n) for n in range(options['requests'])))
+            elapsed = time.perf_counter() - started
+
+        return latencies, errors, elapsed
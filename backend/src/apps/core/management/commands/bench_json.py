@@ -0,0 +1,87 @@
+"""
+Django management command для замера сериализации JSON-ответов.
+
+Сравнивает DRF JSONRenderer (stdlib json) и ORJSONRenderer на типовых
+ответах: страница каталога (20 товаров) и длинная история избранного.
+
+    python manage.py bench_json --history 5000 --repeat 200
+"""
+import timeit
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.renderers import ORJSONRenderer
+
+
+def _product(n: int) -> dict:
+    """Товар в формате ProductListSerializer."""
+    price = 150000 + n * 1000
+    return {
+        'id': n,
+        'title': f'Букет «Весенний» №{n}',
+        'slug': f'bouquet-{n}',
+        'price': price,
+        'price_display': f"{price // 100:,}".replace(',', '\xa0') + '\xa0₽',
+        'old_price': price + 50000 if n % 3 == 0 else None,
+        'old_price_display': None,
+        'has_discount': n % 3 == 0,
+        'is_available': True,
+        'main_image': f'https://cdn.example.com/products/{n}/main.webp',
+        'category_slug': 'bouquets',
+    }
+
+
+def _catalog_page() -> dict:
+    return {
+        'count': 240,
+        'next': 'https://api.example.com/api/v1/products/?page=3',
+        'previous': 'https://api.example.com/api/v1/products/?page=1',
+        'results': [_product(n) for n in range(20)],
+    }
+
+
+def _favorites_history(size: int) -> list[dict]:
+    """История в формате FavoriteActionSerializer."""
+    now = timezone.now()
+    return [
+        {
+            'id': n,
+            'product': _product(n % 200),
+            'action': 'add' if n % 2 == 0 else 'remove',
+            'action_display': 'Добавлено' if n % 2 == 0 else 'Удалено',
+            'created_at': (now - timedelta(minutes=n)).isoformat(),
+        }
+        for n in range(size)
+    ]
+
+
+class Command(BaseCommand):
+    help = 'Замер сериализации JSON: DRF JSONRenderer против ORJSONRenderer'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--history', type=int, default=2000, help='Записей в истории избранного')
+        parser.add_argument('--repeat', type=int, default=200, help='Повторов на замер')
+
+    def handle(self, *args, **options):
+        payloads = {
+            'catalog page (20 items)': _catalog_page(),
+            f"favorites history ({options['history']} items)": _favorites_history(options['history']),
+        }
+        renderers = {
+            'JSONRenderer': JSONRenderer(),
+            'ORJSONRenderer': ORJSONRenderer(),
+        }
+
+        for name, payload in payloads.items():
+            self.stdout.write(name)
+            timings = {}
+            for label, renderer in renderers.items():
+                total = timeit.timeit(lambda r=renderer, p=payload: r.render(p), number=options['repeat'])
+                timings[label] = total / options['repeat'] * 1000
+                self.stdout.write(f"  {label:>15}: {timings[label]:.3f} ms")
+            self.stdout.write(
+                f"  {'speedup':>15}: {timings['JSONRenderer'] / timings['ORJSONRenderer']:.1f}x"
+            )
@@ -0,0 +1,123 @@
+"""
+Django management command для замера сериализации ответов API.
+
+Сравнивает ModelSerializer и DTO (строки values() -> DTO -> to_dict())
+на страницах каталога и заказов. Только CPU: модели и строки создаются
+в памяти, без запросов к БД.
+
+    python manage.py bench_serializers --items 20 --repeat 500
+"""
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.orders.dao import order_dao
+from apps.orders.models import Order, OrderStatus, PaymentMethod
+from apps.orders.serializers import OrderListSerializer
+from apps.products.dao import product_dao
+from apps.products.models import Category, Product, ProductImage
+from apps.products.serializers import ProductListSerializer
+
+
+def _product_instances(size: int) -> list[Product]:
+    """Товары с категорией и «предзагруженными» фото, как после prefetch_related."""
+    category = Category(id=1, title='Розы', slug='roses')
+    products = []
+    for n in range(size):
+        product = Product(
+            id=n,
+            title=f'Букет «Весенний» №{n}',
+            slug=f'bouquet-{n}',
+            price=150000 + n * 1000,
+            old_price=200000 if n % 3 == 0 else None,
+            qty_available=n % 5,
+            category=category,
+        )
+        images = ProductImage.objects.all()
+        images._result_cache = [ProductImage(id=n, product_id=n, image=f'products/{n}.webp', is_main=True)]
+        images._prefetch_done = True
+        product._prefetched_objects_cache = {'images': images}
+        products.append(product)
+    return products
+
+
+def _product_rows(size: int) -> tuple[list[dict], dict[int, str]]:
+    rows = [
+        {
+            'id': n,
+            'title': f'Букет «Весенний» №{n}',
+            'slug': f'bouquet-{n}',
+            'price': 150000 + n * 1000,
+            'old_price': 200000 if n % 3 == 0 else None,
+            'is_active': True,
+            'is_unlimited': False,
+            'qty_available': n % 5,
+            'category__slug': 'roses',
+        }
+        for n in range(size)
+    ]
+    return rows, {n: f'products/{n}.webp' for n in range(size)}
+
+
+def _order_rows(size: int) -> list[dict]:
+    now = timezone.now()
+    return [
+        {
+            'id': n,
+            'uid': str(100000 + n),
+            'status': OrderStatus.DELIVERING,
+            'payment_method': PaymentMethod.LINK_AFTER_ORDER,
+            'total': 350000 + n * 100,
+            'items_count': 3,
+            'customer_name': 'Покупатель',
+            'created_at': now,
+        }
+        for n in range(size)
+    ]
+
+
+def _order_instances(rows: list[dict]) -> list[Order]:
+    orders = []
+    for row in rows:
+        order = Order(**{key: value for key, value in row.items() if key != 'items_count'})
+        order.items_count = row['items_count']
+        orders.append(order)
+    return orders
+
+
+class Command(BaseCommand):
+    help = 'Замер сериализации: ModelSerializer против DTO (values() + to_dict())'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=20, help='Элементов на странице')
+        parser.add_argument('--repeat', type=int, default=500, help='Повторов на замер')
+
+    def handle(self, *args, **options):
+        size = options['items']
+        products = _product_instances(size)
+        product_rows, main_images = _product_rows(size)
+        order_rows = _order_rows(size)
+        orders = _order_instances(order_rows)
+
+        cases = {
+            'product list': {
+                'ModelSerializer': lambda: ProductListSerializer(products, many=True).data,
+                'DTO': lambda: [
+                    product.to_dict() for product in product_dao.build_list(product_rows, main_images)
+                ],
+            },
+            'order list': {
+                'ModelSerializer': lambda: OrderListSerializer(orders, many=True).data,
+                'DTO': lambda: [order.to_dict() for order in order_dao.build_list(order_rows)],
+            },
+        }
+
+        for name, runners in cases.items():
+            self.stdout.write(f'{name} ({size} items)')
+            timings = {}
+            for label, runner in runners.items():
+                total = timeit.timeit(runner, number=options['repeat'])
+                timings[label] = total / options['repeat'] / size * 1_000_000
+                self.stdout.write(f"  {label:>15}: {timings[label]:.1f} µs/item")
+            self.stdout.write(f"  {'speedup':>15}: {timings['ModelSerializer'] / timings['DTO']:.1f}x")
@@ -1,4 +1,5 @@
 """Core middleware package."""
+from .static_files import StaticFilesMiddleware
 from .telegram_only import TelegramOnlyMiddleware
 
-__all__ = ['TelegramOnlyMiddleware']
+__all__ = ['StaticFilesMiddleware', 'TelegramOnlyMiddleware']
@@ -18,6 +18,7 @@ Middleware для ограничения доступа только из Telegr
 import logging
 from typing import Callable, Optional
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.conf import settings
 from django.http import HttpRequest, JsonResponse
 
@@ -47,8 +48,15 @@ class TelegramOnlyMiddleware:
         '/tinymce/',
     ]
 
+    # Работает и под WSGI, и под ASGI (без перехода в поток на каждый запрос)
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response: Callable):
         self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
         self.enabled = getattr(settings, 'ENFORCE_TELEGRAM_ONLY', False)
 
         if self.enabled:
@@ -57,19 +65,32 @@ class TelegramOnlyMiddleware:
             logger.info("🔓 Telegram-only mode disabled. Access from any browser allowed.")
 
     def __call__(self, request: HttpRequest):
+        if self.is_async:
+            return self.__acall__(request)
+
+        if not self._is_allowed(request):
+            return self._create_error_response(request)
+
+        return self.get_response(request)
+
+    async def __acall__(self, request: HttpRequest):
+        if not self._is_allowed(request):
+            return self._create_error_response(request)
+
+        return await self.get_response(request)
+
+    def _is_allowed(self, request: HttpRequest) -> bool:
+        """Проверить, можно ли пропустить запрос дальше (без обращений к БД)."""
         # Пропускаем если защита выключена
         if not self.enabled:
-            return self.get_response(request)
+            return True
 
         # Пропускаем исключённые пути
         if self._is_excluded_path(request.path):
-            return self.get_response(request)
+            return True
 
         # Проверяем наличие и валидность Telegram initData
-        if not self._validate_telegram_request(request):
-            return self._create_error_response(request)
-
-        return self.get_response(request)
+        return self._validate_telegram_request(request)
 
     def _is_excluded_path(self, path: str) -> bool:
         """Проверить, является ли путь исключением."""
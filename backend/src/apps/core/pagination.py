@@ -0,0 +1,182 @@
+"""Keyset (cursor) pagination."""
+import base64
+import binascii
+import json
+from datetime import date, time
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured, ValidationError
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def _encode_value(value):
+    # Даты с микросекундами: DjangoJSONEncoder обрезает их до миллисекунд
+    if isinstance(value, date | time):
+        return value.isoformat()
+    raise TypeError(f'Unsupported cursor value: {value!r}')
+
+
+class KeysetPagination(BasePagination):
+    """
+    Пагинация по ключу сортировки, без COUNT(*) и OFFSET.
+
+    Курсор — значения полей сортировки последнего элемента страницы;
+    следующая страница выбирается условием «после курсора»
+    (см. after_cursor()), поэтому при индексе на поля сортировки цена
+    страницы не зависит от глубины прокрутки.
+
+    Сортировка берётся из queryset (в т.ч. после OrderingFilter)
+    и дополняется id, чтобы ключ был уникальным. Поддерживаются поля
+    самой модели и аннотации. Элементы страницы — модели или строки
+    values() с полями сортировки.
+
+    Ответ: {"next": url | null, "results": [...]}.
+    """
+
+    cursor_query_param = 'cursor'
+    page_size = None
+    invalid_cursor_message = 'Invalid cursor'
+
+    def get_page_size(self) -> int:
+        return self.page_size or api_settings.PAGE_SIZE
+
+    def get_ordering(self, queryset) -> list[str]:
+        """Поля сортировки queryset с id на конце."""
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+        if not all(isinstance(name, str) for name in ordering):
+            raise ImproperlyConfigured('KeysetPagination supports only field-name ordering')
+
+        ordering = [{'pk': 'id', '-pk': '-id'}.get(name, name) for name in ordering]
+        if 'id' not in {name.lstrip('-') for name in ordering}:
+            ordering.append('id')
+        return ordering
+
+    def decode_cursor(self, request, queryset, ordering: list[str]) -> list | None:
+        encoded = request.GET.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            if not isinstance(values, list) or len(values) != len(ordering):
+                raise ValueError
+            return [
+                self._field(queryset, name.lstrip('-')).to_python(value)
+                for name, value in zip(ordering, values, strict=True)
+            ]
+        except (binascii.Error, ValueError, TypeError, FieldDoesNotExist, ValidationError) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+
+    def _field(self, queryset, name: str):
+        """Поле модели или output_field аннотации (например, search_rank)."""
+        annotation = queryset.query.annotations.get(name)
+        if annotation is not None:
+            return annotation.output_field
+        return queryset.model._meta.get_field(name)
+
+    def encode_cursor(self, item, ordering: list[str]) -> str:
+        values = [self._value(item, name.lstrip('-')) for name in ordering]
+        data = json.dumps(values, default=_encode_value, separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    def _value(self, item, name: str):
+        if isinstance(item, dict):
+            return item[name]
+        return getattr(item, name)
+
+    def after_cursor(self, queryset, ordering: list[str], values: list) -> list:
+        """
+        Querysets «строго после курсора» в порядке сортировки.
+
+        Условие (a > x) OR (a = x AND b < y) OR (a = x AND b = y AND id > z)
+        разбито на ветки, начиная с последнего поля: каждая ветка — диапазон
+        индекса с равенством на префикс, поэтому даже в большой группе
+        одинаковых a (например, sort_order по умолчанию) сканирование
+        начинается с позиции курсора, а не с начала группы.
+        """
+        branches = []
+        for index in reversed(range(len(ordering))):
+            name = ordering[index]
+            lookup = 'lt' if name.startswith('-') else 'gt'
+            equal = {key.lstrip('-'): value for key, value in zip(ordering[:index], values[:index], strict=True)}
+            branches.append(queryset.filter(**equal, **{f"{name.lstrip('-')}__{lookup}": values[index]}))
+        return branches
+
+    def get_page_querysets(self, queryset, request) -> list:
+        self.ordering = self.get_ordering(queryset)
+        queryset = queryset.order_by(*self.ordering)
+
+        cursor = self.decode_cursor(request, queryset, self.ordering)
+        if cursor is None:
+            return [queryset]
+        return self.after_cursor(queryset, self.ordering, cursor)
+
+    def _make_page(self, items: list, request) -> list:
+        self.request = request
+        self.next_cursor = None
+        page_size = self.get_page_size()
+        if len(items) > page_size:
+            items = items[:page_size]
+            self.next_cursor = self.encode_cursor(items[-1], self.ordering)
+        return items
+
+    def paginate_queryset(self, queryset, request, view=None) -> list:
+        # Лишний элемент — признак следующей страницы
+        limit = self.get_page_size() + 1
+        items = []
+        for branch in self.get_page_querysets(queryset, request):
+            items.extend(branch[:limit - len(items)])
+            if len(items) == limit:
+                break
+        return self._make_page(items, request)
+
+    async def apaginate_queryset(self, queryset, request, view=None) -> list:
+        """paginate_queryset() для async-вьюх."""
+        limit = self.get_page_size() + 1
+        items = []
+        for branch in self.get_page_querysets(queryset, request):
+            items.extend([item async for item in branch[:limit - len(items)]])
+            if len(items) == limit:
+                break
+        return self._make_page(items, request)
+
+    def get_next_link(self) -> str | None:
+        if self.next_cursor is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), 'page')
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_data(self, data) -> dict:
+        return {
+            'next': self.get_next_link(),
+            'results': data,
+        }
+
+    def get_paginated_response(self, data) -> Response:
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema) -> dict:
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {
+                    'type': 'string',
+                    'nullable': True,
+                    'format': 'uri',
+                    'example': f'http://api.example.org/accounts/?{self.cursor_query_param}=WzAsIjIwMjYtMDEtMDEiLDFd',
+                },
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view) -> list[dict]:
+        return [{
+            'name': self.cursor_query_param,
+            'required': False,
+            'in': 'query',
+            'description': 'Курсор следующей страницы (из поля next)',
+            'schema': {'type': 'string'},
+        }]
@@ -0,0 +1,38 @@
+"""DRF renderers."""
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Типы, которые orjson не знает (Decimal, lazy-строки, timedelta, QuerySet и т.п.),
+# и datetime/date/time — кодируются так же, как в DRF
+_drf_default = JSONEncoder().default
+
+ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+)
+
+LINE_SEPARATOR = '\u2028'.encode()
+PARAGRAPH_SEPARATOR = '\u2029'.encode()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer на orjson.
+
+    Вывод совпадает с DRF JSONRenderer (компактный UTF-8, даты в формате
+    DRF, U+2028/U+2029 экранированы). Запрос с отступами
+    (Accept: application/json; indent=4) обрабатывается стандартным рендерером.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=_drf_default, option=ORJSON_OPTIONS)
+        # Как в DRF: разделители строк допустимы в JSON, но не в JS-литералах
+        return ret.replace(LINE_SEPARATOR, b'\\u2028').replace(PARAGRAPH_SEPARATOR, b'\\u2029')
@@ -0,0 +1,6 @@
+"""Core services."""
+from apps.core.services.cache_queue import CacheQueue
+
+__all__ = [
+    'CacheQueue',
+]
@@ -0,0 +1,96 @@
+"""Append-only queue on top of the Django cache (Redis)."""
+from django.core.cache import cache
+
+
+class CacheQueue:
+    """
+    Queue of JSON-serializable values stored in the default cache.
+
+    push() takes a sequence number with atomic incr() and stores the value
+    under its own key; the consumer reads what follows its pointer with
+    get_many() (at most max_read items per call) and acknowledges the
+    processed range.
+
+    A value may be missing for a moment between incr() and set() in a
+    concurrent push(). The consumer stops before such a gap and remembers
+    the last sequence number seen; on the next read every value still
+    missing up to that number is skipped at once — it was evicted or
+    expired, not in flight.
+
+    Only one consumer at a time is expected (see lock()).
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        item_timeout: int = 24 * 60 * 60,
+        max_read: int = 1000,
+        pointer_name: str = 'pointer',
+    ):
+        self.prefix = prefix
+        self.item_timeout = item_timeout
+        self.max_read = max_read
+        self.seq_key = f'{prefix}:seq'
+        self.pointer_key = f'{prefix}:{pointer_name}'
+        self.gap_key = f'{prefix}:gap'
+        self.lock_key = f'{prefix}:lock'
+
+    def _item_key(self, seq: int) -> str:
+        return f'{self.prefix}:item:{seq}'
+
+    def push(self, value) -> int:
+        """Append value, return its sequence number."""
+        cache.add(self.seq_key, 0, timeout=None)
+        seq = cache.incr(self.seq_key)
+        cache.set(self._item_key(seq), value, timeout=self.item_timeout)
+        return seq
+
+    async def apush(self, value) -> int:
+        """Append value (async cache API), return its sequence number."""
+        await cache.aadd(self.seq_key, 0, timeout=None)
+        seq = await cache.aincr(self.seq_key)
+        await cache.aset(self._item_key(seq), value, timeout=self.item_timeout)
+        return seq
+
+    def read(self) -> tuple[list, int]:
+        """
+        Read pending values without removing them.
+
+        Returns (values, pointer) — pass pointer to ack() once processed.
+        """
+        pointer = cache.get(self.pointer_key, 0)
+        last = cache.get(self.seq_key, 0)
+        if last <= pointer:
+            return [], pointer
+
+        seqs = range(pointer + 1, min(last, pointer + self.max_read) + 1)
+        found = cache.get_many([self._item_key(seq) for seq in seqs])
+        # Missing values up to this number were allocated before the previous read
+        stale_up_to = cache.get(self.gap_key, 0)
+
+        values = []
+        for seq in seqs:
+            value = found.get(self._item_key(seq))
+            if value is None and seq > stale_up_to:
+                cache.set(self.gap_key, last, timeout=self.item_timeout)
+                break
+            if value is not None:
+                values.append(value)
+            pointer = seq
+
+        return values, pointer
+
+    def ack(self, pointer: int) -> None:
+        """Mark everything up to pointer as processed and drop those values."""
+        previous = cache.get(self.pointer_key, 0)
+        if pointer <= previous:
+            return
+        cache.set(self.pointer_key, pointer, timeout=None)
+        cache.delete_many([self._item_key(seq) for seq in range(previous + 1, pointer + 1)])
+
+    def lock(self, timeout: int = 60) -> bool:
+        """Try to become the single consumer; release with unlock()."""
+        return cache.add(self.lock_key, 1, timeout=timeout)
+
+    def unlock(self) -> None:
+        cache.delete(self.lock_key)
@@ -0,0 +1,54 @@
+"""
+Tests for the cache-backed queue.
+"""
+from django.core.cache import cache
+
+from apps.core.services import CacheQueue
+
+
+class TestCacheQueue:
+    """Read/ack semantics and gap handling."""
+
+    def test_read_and_ack(self):
+        queue = CacheQueue('test:queue')
+        queue.push('a')
+        queue.push('b')
+
+        values, pointer = queue.read()
+        assert values == ['a', 'b']
+
+        queue.ack(pointer)
+        assert queue.read() == ([], 2)
+
+    def test_missing_values_skipped_on_next_read(self):
+        queue = CacheQueue('test:queue')
+        for value in 'abcd':
+            queue.push(value)
+        # Lost values (evicted/expired) in the middle of the queue
+        cache.delete_many([queue._item_key(2), queue._item_key(3)])
+
+        # First read stops before the gap: the value may still be in flight
+        values, pointer = queue.read()
+        assert (values, pointer) == (['a'], 1)
+        queue.ack(pointer)
+
+        # Next read skips every value missing since then at once
+        values, pointer = queue.read()
+        assert (values, pointer) == (['d'], 4)
+
+    def test_read_is_bounded(self):
+        queue = CacheQueue('test:queue', max_read=2)
+        for value in 'abc':
+            queue.push(value)
+
+        values, pointer = queue.read()
+        assert values == ['a', 'b']
+        queue.ack(pointer)
+        assert queue.read() == (['c'], 3)
+
+    def test_pointer_name(self):
+        queue = CacheQueue('test:queue', pointer_name='flushed')
+        cache.set('test:queue:seq', 5, timeout=None)
+        cache.set('test:queue:flushed', 5, timeout=None)
+
+        assert queue.read() == ([], 5)
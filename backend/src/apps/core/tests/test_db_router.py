@@ -0,0 +1,36 @@
+"""
+Tests for read-replica routing.
+"""
+from unittest import mock
+
+import pytest
+
+from apps.analytics.models import AnalyticsEvent, CustomerStats, DailyStats
+from apps.core.db_router import ReplicaRouter, get_reporting_db
+from apps.orders.models import Order
+from apps.products.models import Product
+from apps.users.models import User
+
+router = ReplicaRouter()
+
+
+@pytest.mark.parametrize('configured, expected', [(True, 'replica'), (False, 'default')])
+def test_reporting_models_read_from_replica(configured, expected):
+    with mock.patch('apps.core.db_router.replica_configured', return_value=configured):
+        assert get_reporting_db() == expected
+        for model in (AnalyticsEvent, DailyStats, CustomerStats):
+            assert router.db_for_read(model) == expected
+            assert router.db_for_write(model) == 'default'
+
+
+def test_orders_and_stock_pinned_to_primary():
+    with mock.patch('apps.core.db_router.replica_configured', return_value=True):
+        assert router.db_for_read(Order) == 'default'
+        assert router.db_for_read(Product) == 'default'
+        # Everything else keeps Django's default choice
+        assert router.db_for_read(User) is None
+
+
+def test_no_migrations_on_replica():
+    assert router.allow_migrate('default', 'orders')
+    assert not router.allow_migrate('replica', 'orders')
@@ -0,0 +1,28 @@
+"""
+Tests for the DB connection pool health check.
+"""
+from unittest import mock
+
+import pytest
+
+from apps.core.health import DatabasePoolHealthCheck
+
+
+def run_check(stats):
+    pool = mock.Mock(get_stats=mock.Mock(return_value=stats))
+    with mock.patch('apps.core.health.connections') as connections:
+        connections.__getitem__.return_value.pool = pool
+        check = DatabasePoolHealthCheck()
+        check.run_check()
+    return check
+
+
+@pytest.mark.parametrize('stats, healthy', [
+    ({'pool_max': 10, 'pool_size': 4, 'pool_available': 3}, True),
+    ({'pool_max': 10, 'pool_size': 10, 'pool_available': 0}, False),
+    ({'pool_max': 10, 'pool_size': 10, 'pool_available': 5, 'requests_waiting': 2}, False),
+])
+def test_pool_saturation(settings, stats, healthy):
+    settings.DB_POOL_SATURATION_WARNING = 0.9
+
+    assert (not run_check(stats).errors) == healthy
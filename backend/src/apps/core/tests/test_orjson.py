@@ -0,0 +1,49 @@
+"""
+Tests for orjson renderer and parser.
+"""
+import io
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.parsers import ORJSONParser
+from apps.core.renderers import ORJSONRenderer
+
+
+def test_output_matches_drf_renderer():
+    data = {
+        'price': Decimal('1500.50'),
+        'created_at': timezone.now(),
+        'date': date(2026, 1, 1),
+        'uid': uuid.uuid4(),
+        'detail': gettext_lazy('Invalid page.'),
+        'duration': timedelta(minutes=5),
+        1: 'int key',
+        'title': 'Букет',
+        'note': 'строка\u2028абзац\u2029конец',
+        'empty': None,
+    }
+
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_indent_falls_back_to_drf():
+    rendered = ORJSONRenderer().render({'a': 1}, 'application/json; indent=2')
+    assert rendered == b'{\n  "a": 1\n}'
+
+
+def test_parser():
+    parser = ORJSONParser()
+
+    assert parser.parse(io.BytesIO('{"title": "Розы", "qty": 2}'.encode())) == {
+        'title': 'Розы',
+        'qty': 2,
+    }
+    with pytest.raises(ParseError):
+        parser.parse(io.BytesIO(b'{"qty": NaN}'))
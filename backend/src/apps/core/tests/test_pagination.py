@@ -0,0 +1,105 @@
+"""
+Tests for keyset pagination.
+"""
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.orders.models import Order
+from apps.products.models import Category, FavoriteAction, FavoriteActionType, Product
+from apps.users.models import User
+
+
+def collect(client, path):
+    """All items following next links; returns (items, queries per page)."""
+    items, queries = [], []
+    while path:
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(path)
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == {'next', 'results'}
+        items.extend(data['results'])
+        queries.append([q['sql'] for q in ctx.captured_queries])
+        path = data['next']
+    return items, queries
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(username='buyer', telegram_id=42)
+
+
+@pytest.fixture
+def products(db):
+    category = Category.objects.create(title='Розы', slug='roses')
+    items = [
+        Product.objects.create(
+            title=f'Букет {n}',
+            slug=f'bouquet-{n}',
+            category=category,
+            price=(n % 4 + 1) * 10000,
+            sort_order=n % 3,
+        )
+        for n in range(45)
+    ]
+    # Одинаковые created_at: порядок внутри решает id
+    Product.objects.filter(pk__in=[p.pk for p in items[::2]]).update(created_at=timezone.now())
+    return items
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    """Pages cover the whole ordering exactly once, without COUNT/OFFSET."""
+
+    @pytest.mark.parametrize('ordering', ['', '?ordering=price', '?ordering=-price'])
+    def test_catalog(self, products, ordering):
+        items, queries = collect(APIClient(), f'/api/v1/products/{ordering}')
+
+        expected = Product.objects.order_by(*(
+            ['price', 'id'] if ordering == '?ordering=price'
+            else ['-price', 'id'] if ordering else ['sort_order', '-created_at', 'id']
+        ))
+        assert [item['id'] for item in items] == list(expected.values_list('id', flat=True))
+        assert len(queries) == 3
+        for page in queries:
+            assert not any('COUNT(' in sql or 'OFFSET' in sql for sql in page)
+
+    def test_orders(self, user):
+        created = timezone.now()
+        for n in range(25):
+            order = Order.objects.create(
+                user=user,
+                customer_name='Покупатель',
+                customer_phone='+79990000000',
+                delivery_address='Адрес',
+            )
+            Order.objects.filter(pk=order.pk).update(created_at=created - timedelta(minutes=n // 2))
+
+        client = APIClient()
+        client.force_authenticate(user)
+        items, _ = collect(client, '/api/v1/orders/')
+
+        expected = Order.objects.order_by('-created_at', 'id').values_list('id', flat=True)
+        assert [item['id'] for item in items] == list(expected)
+
+    def test_favorites_history(self, user, products):
+        for product in products[:30]:
+            FavoriteAction.objects.create(user=user, product=product, action=FavoriteActionType.ADDED)
+
+        client = APIClient()
+        client.force_authenticate(user)
+        items, queries = collect(client, '/api/v1/products/favorites/history/')
+
+        assert [item['id'] for item in items] == list(
+            FavoriteAction.objects.order_by('-created_at', 'id').values_list('id', flat=True)
+        )
+        assert len(queries) == 2
+
+    def test_invalid_cursor(self, products):
+        response = APIClient().get('/api/v1/products/?cursor=broken')
+        assert response.status_code == 404
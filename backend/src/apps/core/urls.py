@@ -1,10 +1,15 @@
 """Core URLs."""
+from django.conf import settings
 from django.urls import path
 
-from apps.core.views import PageContentView
+from apps.core.views import PageContentAsyncView, PageContentView
 
 app_name = 'core'
 
 urlpatterns = [
-    path('pages/<str:slug>/', PageContentView.as_view(), name='page-content'),
+    path(
+        'pages/<str:slug>/',
+        (PageContentAsyncView if settings.SERVER_MODE == 'asgi' else PageContentView).as_view(),
+        name='page-content',
+    ),
 ]
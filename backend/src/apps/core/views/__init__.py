@@ -6,6 +6,13 @@ from rest_framework.views import APIView
 
 from apps.core.models import PageContent
 from apps.core.serializers import PageContentSerializer
+from apps.core.views.base import AsyncReadView
+
+__all__ = [
+    'AsyncReadView',
+    'PageContentAsyncView',
+    'PageContentView',
+]
 
 
 class PageContentView(APIView):
@@ -25,3 +32,14 @@ class PageContentView(APIView):
 
         serializer = PageContentSerializer(page)
         return Response(serializer.data)
+
+
+class PageContentAsyncView(AsyncReadView):
+    """Получение контента страницы по slug (async, режим ASGI)."""
+
+    async def get(self, request, slug: str):
+        page = await PageContent.objects.filter(slug=slug, is_active=True).afirst()
+        if page is None:
+            return self.render({'detail': 'Страница не найдена'}, status=404)
+
+        return self.render(PageContentSerializer(page).data)
@@ -0,0 +1,84 @@
+"""Base for async read-only API views."""
+import inspect
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.views import View
+from rest_framework.exceptions import APIException, NotFound
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from apps.core.pagination import KeysetPagination
+
+
+class AsyncReadView(View):
+    """
+    Async GET-эндпоинт с ответами в формате DRF.
+
+    Используется в режиме ASGI (SERVER_MODE=asgi) для самых нагруженных
+    публичных списков: запросы к БД идут через async ORM, без перехода
+    в поток на весь запрос. Ответы, пагинация и фильтры совпадают
+    с соответствующими DRF-вьюхами, которые остаются в режиме WSGI.
+    """
+
+    http_method_names = ['get', 'head', 'options']
+    renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+    pagination_class = KeysetPagination
+
+    def render(self, data, status: int = 200) -> HttpResponse:
+        """JSON-ответ рендерером DRF по умолчанию."""
+        return HttpResponse(
+            self.renderer.render(data),
+            status=status,
+            content_type=self.renderer.media_type,
+        )
+
+    def drf_request(self, request) -> Request:
+        """Обёртка запроса для переиспользования DRF filter backends."""
+        return Request(request)
+
+    async def authenticate(self, request):
+        """
+        Пользователь по DRF-аутентификации (JWT, Telegram initData).
+
+        Аутентификаторы синхронные, поэтому выполняются в потоке.
+        Без заголовков — AnonymousUser; неверные учётные данные —
+        AuthenticationFailed, как у DRF-вьюх.
+        """
+        drf_request = Request(
+            request,
+            authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES],
+        )
+        return await sync_to_async(lambda: drf_request.user)()
+
+    def render_error(self, exc: APIException) -> HttpResponse:
+        """Ошибка DRF в формате ответа DRF-вьюх."""
+        detail = exc.detail if isinstance(exc.detail, list | dict) else {'detail': exc.detail}
+        return self.render(detail, status=exc.status_code)
+
+    def filter_queryset(self, request, queryset):
+        """Применить filter backends вьюхи (SearchFilter, OrderingFilter и т.п.)."""
+        drf_request = self.drf_request(request)
+        for backend in getattr(self, 'filter_backends', []):
+            queryset = backend().filter_queryset(drf_request, queryset, self)
+        return queryset
+
+    async def paginate(self, request, queryset, serialize) -> HttpResponse:
+        """
+        Страница в формате pagination_class: next/results.
+
+        Args:
+            request: Запрос
+            queryset: Queryset (в т.ч. values())
+            serialize: Функция элементы страницы -> results (может быть async)
+        """
+        paginator = self.pagination_class()
+        try:
+            items = await paginator.apaginate_queryset(queryset, request, self)
+        except NotFound as exc:
+            return self.render_error(exc)
+
+        results = serialize(items)
+        if inspect.isawaitable(results):
+            results = await results
+        return self.render(paginator.get_paginated_data(results))
@@ -1,11 +1,12 @@
 """Orders admin with Unfold."""
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.utils.html import format_html
 from unfold.admin import ModelAdmin, TabularInline
 from unfold.contrib.filters.admin import RangeDateFilter, DropdownFilter
 from unfold.decorators import display
 
 from apps.orders.models import Order, OrderItem, OrderStatus, PaymentMethod
+from apps.orders.services import bulk_update_status
 
 
 class StatusFilter(DropdownFilter):
@@ -21,6 +22,21 @@ class StatusFilter(DropdownFilter):
         return queryset
 
 
+def _make_status_action(status: str, label: str):
+    """Действие админки: массово перевести выбранные заказы в статус."""
+
+    def action(modeladmin, request, queryset):
+        changed = bulk_update_status(queryset, status)
+        modeladmin.message_user(
+            request,
+            f'Статус «{label}» установлен для заказов: {len(changed)}',
+            messages.SUCCESS,
+        )
+
+    action.__name__ = f'set_status_{status}'
+    return admin.action(description=f'Статус → {label}')(action)
+
+
 class OrderItemInline(TabularInline):
     """Позиции заказа."""
     model = OrderItem
@@ -93,6 +109,7 @@ class OrderAdmin(ModelAdmin):
     ordering = ['-created_at']
     list_per_page = 25
     date_hierarchy = 'created_at'
+    actions = [_make_status_action(value, label) for value, label in OrderStatus.choices]
 
     fieldsets = (
         ('Статус заказа', {
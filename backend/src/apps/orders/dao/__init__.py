@@ -0,0 +1,7 @@
+"""Orders DAO."""
+from apps.orders.dao.order import OrderDAO, order_dao
+
+__all__ = [
+    'OrderDAO',
+    'order_dao',
+]
@@ -0,0 +1,117 @@
+"""Order DAO."""
+from django.db.models import QuerySet
+
+from apps.core.dao.base import BaseDAO
+from apps.orders.dto import OrderDetailDTO, OrderItemDTO, OrderListDTO
+from apps.orders.models import Order, OrderItem, OrderStatus, PaymentMethod
+
+LIST_FIELDS = (
+    'id',
+    'uid',
+    'status',
+    'payment_method',
+    'total',
+    'items_count',
+    'customer_name',
+    'created_at',
+)
+
+DETAIL_FIELDS = (
+    'id',
+    'uid',
+    'status',
+    'payment_method',
+    'subtotal',
+    'delivery_fee',
+    'discount',
+    'total',
+    'customer_name',
+    'customer_phone',
+    'delivery_address',
+    'delivery_comment',
+    'delivery_date',
+    'delivery_time_from',
+    'delivery_time_to',
+    'created_at',
+    'updated_at',
+)
+
+ITEM_FIELDS = ('id', 'product_id', 'product_title', 'qty', 'unit_price', 'line_total', 'image_url')
+
+STATUS_LABELS = dict(OrderStatus.choices)
+PAYMENT_METHOD_LABELS = dict(PaymentMethod.choices)
+
+
+def _labels(row: dict) -> dict:
+    """Подписи статуса и способа оплаты, как get_FOO_display()."""
+    return {
+        'status_display': str(STATUS_LABELS.get(row['status'], row['status'])),
+        'payment_method_display': str(
+            PAYMENT_METHOD_LABELS.get(row['payment_method'], row['payment_method'])
+        ),
+    }
+
+
+class OrderDAO(BaseDAO[Order]):
+    """Чтение заказов в DTO без создания моделей."""
+
+    model = Order
+
+    def list_rows(self, queryset: QuerySet) -> QuerySet:
+        """values()-queryset для build_list() (queryset аннотирован items_count)."""
+        return queryset.prefetch_related(None).values(*LIST_FIELDS)
+
+    def build_list(self, rows: list[dict]) -> list[OrderListDTO]:
+        """DTO для списка из строк list_rows()."""
+        return [
+            OrderListDTO(
+                id=row['id'],
+                uid=row['uid'],
+                status=row['status'],
+                payment_method=row['payment_method'],
+                total=row['total'],
+                items_count=row['items_count'],
+                created_at=row['created_at'],
+                customer_name=row['customer_name'],
+                **_labels(row),
+            )
+            for row in rows
+        ]
+
+    def get_detail(self, queryset: QuerySet, pk) -> OrderDetailDTO | None:
+        """Заказ с позициями (None, если не найден в queryset)."""
+        try:
+            pk = int(pk)
+        except (TypeError, ValueError):
+            return None
+
+        row = queryset.prefetch_related(None).filter(pk=pk).values(*DETAIL_FIELDS).first()
+        if row is None:
+            return None
+
+        items = OrderItem.objects.filter(order_id=pk).order_by('id').values(*ITEM_FIELDS)
+
+        return OrderDetailDTO(
+            id=row['id'],
+            uid=row['uid'],
+            status=row['status'],
+            payment_method=row['payment_method'],
+            subtotal=row['subtotal'],
+            delivery_fee=row['delivery_fee'],
+            discount=row['discount'],
+            total=row['total'],
+            customer_name=row['customer_name'],
+            customer_phone=row['customer_phone'],
+            delivery_address=row['delivery_address'],
+            delivery_comment=row['delivery_comment'],
+            delivery_date=row['delivery_date'],
+            delivery_time_from=row['delivery_time_from'],
+            delivery_time_to=row['delivery_time_to'],
+            items=[OrderItemDTO(**item) for item in items],
+            created_at=row['created_at'],
+            updated_at=row['updated_at'],
+            **_labels(row),
+        )
+
+
+order_dao = OrderDAO()
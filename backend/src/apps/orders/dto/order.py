@@ -2,6 +2,8 @@
 from dataclasses import dataclass, field
 from datetime import date, datetime, time
 
+from apps.core.dto import format_datetime, format_iso, format_price
+
 
 @dataclass(frozen=True, slots=True)
 class OrderItemDTO:
@@ -14,6 +16,20 @@ class OrderItemDTO:
     line_total: int  # копейки
     image_url: str | None
 
+    def to_dict(self) -> dict:
+        """Ответ API (поля OrderItemSerializer)."""
+        return {
+            'id': self.id,
+            'product_id': self.product_id,
+            'product_title': self.product_title,
+            'qty': self.qty,
+            'unit_price': self.unit_price,
+            'unit_price_display': format_price(self.unit_price),
+            'line_total': self.line_total,
+            'line_total_display': format_price(self.line_total),
+            'image_url': self.image_url,
+        }
+
 
 @dataclass(frozen=True, slots=True)
 class OrderListDTO:
@@ -22,11 +38,29 @@ class OrderListDTO:
     uid: str
     status: str
     status_display: str
+    payment_method: str
+    payment_method_display: str
     total: int  # копейки
     items_count: int
     created_at: datetime
     customer_name: str
 
+    def to_dict(self) -> dict:
+        """Ответ API (поля OrderListSerializer)."""
+        return {
+            'id': self.id,
+            'uid': self.uid,
+            'status': self.status,
+            'status_display': self.status_display,
+            'payment_method': self.payment_method,
+            'payment_method_display': self.payment_method_display,
+            'total': self.total,
+            'total_display': format_price(self.total),
+            'items_count': self.items_count,
+            'customer_name': self.customer_name,
+            'created_at': format_datetime(self.created_at),
+        }
+
 
 @dataclass(frozen=True)
 class OrderDetailDTO:
@@ -35,6 +69,8 @@ class OrderDetailDTO:
     uid: str
     status: str
     status_display: str
+    payment_method: str
+    payment_method_display: str
 
     # Суммы (копейки)
     subtotal: int
@@ -60,6 +96,35 @@ class OrderDetailDTO:
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
+    def to_dict(self) -> dict:
+        """Ответ API (поля OrderDetailSerializer)."""
+        return {
+            'id': self.id,
+            'uid': self.uid,
+            'status': self.status,
+            'status_display': self.status_display,
+            'payment_method': self.payment_method,
+            'payment_method_display': self.payment_method_display,
+            'subtotal': self.subtotal,
+            'subtotal_display': format_price(self.subtotal),
+            'delivery_fee': self.delivery_fee,
+            'delivery_fee_display': format_price(self.delivery_fee),
+            'discount': self.discount,
+            'discount_display': format_price(self.discount),
+            'total': self.total,
+            'total_display': format_price(self.total),
+            'customer_name': self.customer_name,
+            'customer_phone': self.customer_phone,
+            'delivery_address': self.delivery_address,
+            'delivery_comment': self.delivery_comment,
+            'delivery_date': format_iso(self.delivery_date),
+            'delivery_time_from': format_iso(self.delivery_time_from),
+            'delivery_time_to': format_iso(self.delivery_time_to),
+            'items': [item.to_dict() for item in self.items],
+            'created_at': format_datetime(self.created_at),
+            'updated_at': format_datetime(self.updated_at),
+        }
+
 
 # === Input DTOs ===
 
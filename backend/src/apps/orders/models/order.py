@@ -3,6 +3,7 @@ import random
 
 from django.conf import settings
 from django.db import models
+from django.db.models import DEFERRED
 
 from apps.core.models import TimeStampedModel
 
@@ -128,10 +129,31 @@ class Order(TimeStampedModel):
         verbose_name = 'Заказ'
         verbose_name_plural = 'Заказы'
         ordering = ['-created_at']
+        indexes = [
+            # Ключ пагинации заказов пользователя (KeysetPagination)
+            models.Index(fields=['user', '-created_at', 'id']),
+        ]
 
     def __str__(self):
         return f"Заказ #{self.uid} - {self.customer_name}"
 
+    # Статус на момент загрузки из БД (None — заказ ещё не сохранён),
+    # обновляется в from_db, refresh_from_db и после сохранения.
+    # Сравнивается с текущим в post_save (apps.orders.signals) без лишнего SELECT.
+    _loaded_status = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_status = instance.__dict__.get('status', DEFERRED)
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        # Перечитанный статус — новая точка отсчёта для post_save
+        if 'status' in self.__dict__ and (fields is None or 'status' in fields):
+            self._loaded_status = self.status
+
     @property
     def total_display(self) -> str:
         """Итого для отображения."""
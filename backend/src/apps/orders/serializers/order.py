@@ -1,4 +1,5 @@
 """Order serializers."""
+from django.db import transaction
 from rest_framework import serializers
 
 from apps.orders.models import Order, OrderItem, OrderStatus, PaymentMethod
@@ -154,51 +155,58 @@ class OrderCreateSerializer(serializers.Serializer):
         return items
 
     def create(self, validated_data):
-        """Создаём заказ с позициями."""
+        """
+        Создаём заказ с позициями.
+
+        Заказ, позиции, остатки и задачи уведомлений пишутся в одной
+        транзакции; уведомления уходят в брокер после коммита (outbox).
+        """
         user = self.context['request'].user
         items_data = validated_data.pop('items')
 
-        # Получаем товары
-        product_ids = [item['product_id'] for item in items_data]
-        products = {p.id: p for p in Product.objects.filter(id__in=product_ids)}
-
-        # Создаём заказ
-        order = Order.objects.create(user=user, **validated_data)
-
-        # Создаём позиции со snapshot
-        order_items = []
-        for item_data in items_data:
-            product = products[item_data['product_id']]
-            main_image = product.images.filter(is_main=True).first() or product.images.first()
-
-            order_item = OrderItem.objects.create(
-                order=order,
-                product=product,
-                qty=item_data['qty'],
-                product_title=product.title,
-                unit_price=product.price,
-                line_total=product.price * item_data['qty'],
-                image_url=main_image.image.url if main_image else '',
-            )
-            order_items.append(order_item)
-
-            # Уменьшаем остаток
-            if not product.is_unlimited:
-                product.qty_available -= item_data['qty']
-                product.save(update_fields=['qty_available'])
-
-        # Пересчитываем итоги
-        order.calculate_totals()
-        order.save()
-
-        # Отправляем уведомление в Telegram
-        self._send_order_notification(user, order, order_items)
+        with transaction.atomic():
+            # Получаем товары
+            product_ids = [item['product_id'] for item in items_data]
+            products = {p.id: p for p in Product.objects.filter(id__in=product_ids)}
+
+            # Создаём заказ
+            order = Order.objects.create(user=user, **validated_data)
+
+            # Создаём позиции со snapshot
+            order_items = []
+            for item_data in items_data:
+                product = products[item_data['product_id']]
+                main_image = product.images.filter(is_main=True).first() or product.images.first()
+
+                order_item = OrderItem.objects.create(
+                    order=order,
+                    product=product,
+                    qty=item_data['qty'],
+                    product_title=product.title,
+                    unit_price=product.price,
+                    line_total=product.price * item_data['qty'],
+                    image_url=main_image.image.url if main_image else '',
+                )
+                order_items.append(order_item)
+
+                # Уменьшаем остаток
+                if not product.is_unlimited:
+                    product.qty_available -= item_data['qty']
+                    product.save(update_fields=['qty_available'])
+
+            # Пересчитываем итоги
+            order.calculate_totals()
+            order.save()
+
+            # Ставим уведомления в Telegram в outbox (в той же транзакции)
+            self._send_order_notification(user, order, order_items)
 
         return order
 
     def _send_order_notification(self, user, order, order_items):
-        """Отправить уведомление о заказе в Telegram."""
+        """Поставить уведомления о заказе в Telegram в outbox."""
         import logging
+        from apps.bot.services.outbox import enqueue_task
         from apps.bot.tasks import send_order_notification_task, send_admin_order_notification_task
 
         logger = logging.getLogger(__name__)
@@ -227,7 +235,8 @@ class OrderCreateSerializer(serializers.Serializer):
 
         # Уведомление клиенту
         if user.telegram_id:
-            send_order_notification_task.delay(
+            enqueue_task(
+                send_order_notification_task,
                 telegram_id=user.telegram_id,
                 order_uid=order.uid,
                 items=items,
@@ -249,7 +258,8 @@ class OrderCreateSerializer(serializers.Serializer):
             customer_name = order.customer_name
 
         # Уведомление админам
-        send_admin_order_notification_task.delay(
+        enqueue_task(
+            send_admin_order_notification_task,
             order_uid=order.uid,
             items=items,
             total=order.total,
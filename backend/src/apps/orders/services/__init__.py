@@ -0,0 +1,6 @@
+"""Orders services."""
+from apps.orders.services.status import bulk_update_status
+
+__all__ = [
+    'bulk_update_status',
+]
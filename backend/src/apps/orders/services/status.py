@@ -0,0 +1,55 @@
+"""Массовая смена статуса заказов."""
+import logging
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.orders.models import Order, OrderStatus
+
+logger = logging.getLogger(__name__)
+
+
+def bulk_update_status(queryset, new_status: str) -> list[int]:
+    """
+    Перевести заказы в новый статус одним UPDATE.
+
+    Сигналы post_save не вызываются: в той же транзакции в outbox
+    ставится одна задача с уведомлениями всем затронутым клиентам
+    и одна — на пересчёт сегментов аудитории.
+
+    Args:
+        queryset: Заказы для смены статуса
+        new_status: Значение OrderStatus
+
+    Returns:
+        ID заказов, у которых статус действительно изменился
+    """
+    from apps.bot.services.outbox import enqueue_task
+    from apps.bot.tasks import (
+        refresh_users_segments_task,
+        send_order_status_notifications_task,
+    )
+
+    with transaction.atomic():
+        changed = list(
+            queryset.exclude(status=new_status)
+            .select_for_update()
+            .values_list('id', 'user_id')
+        )
+        if not changed:
+            return []
+
+        order_ids = [order_id for order_id, _ in changed]
+        Order.objects.filter(id__in=order_ids).update(
+            status=new_status,
+            updated_at=timezone.now(),
+        )
+
+        user_ids = sorted({user_id for _, user_id in changed})
+        enqueue_task(refresh_users_segments_task, user_ids=user_ids)
+
+        if new_status != OrderStatus.NEW:
+            enqueue_task(send_order_status_notifications_task, order_ids=order_ids)
+
+    logger.info("Bulk order status update: status=%s orders=%d", new_status, len(order_ids))
+    return order_ids
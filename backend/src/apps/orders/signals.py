@@ -2,6 +2,8 @@
 Django signals for order status change notifications.
 """
 import logging
+
+from django.db.models import DEFERRED
 from django.db.models.signals import pre_save, post_save
 from django.dispatch import receiver
 
@@ -11,40 +13,50 @@ logger = logging.getLogger(__name__)
 
 
 @receiver(pre_save, sender=Order)
-def track_status_change(sender, instance, **kwargs):
+def load_deferred_status(sender, instance, **kwargs):
     """
-    Track the old status before saving.
+    Fetch the stored status only if it was deferred when loading.
+
+    The common case (status loaded in from_db) costs no query.
     """
-    if instance.pk:
-        old_status = Order.objects.filter(pk=instance.pk).values_list('status', flat=True).first()
-        instance._old_status = old_status
-    else:
-        instance._old_status = None
+    if instance._loaded_status is DEFERRED and instance.pk:
+        instance._loaded_status = (
+            Order.objects.filter(pk=instance.pk).values_list('status', flat=True).first()
+        )
 
 
 @receiver(post_save, sender=Order)
-def notify_status_change(sender, instance, created, **kwargs):
+def notify_status_change(sender, instance, created, update_fields=None, **kwargs):
     """
     Send notification when order status changes.
+
+    Compares with the status captured in Order.from_db and schedules
+    Celery tasks through the outbox (published after the transaction commits).
     """
-    if created:
+    if update_fields is not None and 'status' not in update_fields:
         return
 
-    old_status = getattr(instance, '_old_status', None)
-    if old_status is None:
+    old_status = instance._loaded_status
+    instance._loaded_status = instance.status
+
+    if created or old_status is None:
         return
 
     if old_status == instance.status:
         return
 
+    from apps.bot.services.outbox import enqueue_task
+    from apps.bot.tasks import refresh_user_segments_task, send_order_status_notification_task
+
+    # Order-based audience segments (customers, VIP) depend on status
+    enqueue_task(refresh_user_segments_task, user_id=instance.user_id)
+
     # Don't notify for transition to 'new' (only happens on creation)
     if instance.status == OrderStatus.NEW:
         return
 
-    # Send notification via Celery
-    from apps.bot.tasks import send_order_status_notification_task
-
-    send_order_status_notification_task.delay(order_id=instance.pk)
+    # Send notification via Celery once the new status is visible to workers
+    enqueue_task(send_order_status_notification_task, order_id=instance.pk)
 
     logger.info(
         "Order status notification queued: order=#%s status=%s->%s",
@@ -0,0 +1,79 @@
+"""
+Tests for bulk order status update.
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.bot.models import TaskOutbox
+from apps.orders.models import Order, OrderStatus
+from apps.orders.services import bulk_update_status
+from apps.users.models import User
+
+
+@pytest.fixture
+def orders(db):
+    user = User.objects.create_user(username='buyer', telegram_id=42)
+    return [
+        Order.objects.create(
+            user=user,
+            status=status,
+            customer_name='Покупатель',
+            customer_phone='+79990000000',
+            delivery_address='Адрес',
+        )
+        for status in (OrderStatus.NEW, OrderStatus.NEW, OrderStatus.CONFIRMED)
+    ]
+
+
+@pytest.mark.django_db
+class TestBulkUpdateStatus:
+    """Tests for bulk_update_status."""
+
+    def test_single_update_and_batched_task(self, orders):
+        """One UPDATE, one notification task for the changed orders only."""
+        with CaptureQueriesContext(connection) as ctx:
+            changed = bulk_update_status(Order.objects.all(), OrderStatus.CONFIRMED)
+
+        assert sorted(changed) == sorted(o.pk for o in orders[:2])
+        assert sum(q['sql'].startswith('UPDATE') for q in ctx.captured_queries) == 1
+        assert dict(TaskOutbox.objects.values_list('task_name', 'kwargs')) == {
+            'bot.refresh_users_segments': {'user_ids': [orders[0].user_id]},
+            'bot.send_order_status_notifications': {'order_ids': changed},
+        }
+        assert set(Order.objects.values_list('status', flat=True)) == {OrderStatus.CONFIRMED}
+
+    def test_nothing_to_change(self, orders):
+        """No task when statuses already match."""
+        assert bulk_update_status(Order.objects.filter(pk=orders[2].pk), OrderStatus.CONFIRMED) == []
+        assert not TaskOutbox.objects.exists()
+
+    @patch('apps.bot.services.telegram_client.requests.Session.post')
+    def test_notifications_task_sends_to_each_customer(self, mock_post, orders, settings):
+        """Batched task sends one message per order with a Telegram user."""
+        from apps.bot.tasks import send_order_status_notifications_task
+
+        settings.TELEGRAM_BOT_TOKEN = 'test-token'
+        mock_post.return_value = MagicMock(status_code=200)
+
+        assert send_order_status_notifications_task([o.pk for o in orders]) == 3
+        assert mock_post.call_count == 3
+
+    @patch('apps.bot.services.telegram_client.requests.Session.post')
+    def test_notifications_task_retries_failed_orders(self, mock_post, orders, settings):
+        """Only orders whose message failed are retried."""
+        from celery.exceptions import Retry
+
+        from apps.bot.tasks import send_order_status_notifications_task
+
+        settings.TELEGRAM_BOT_TOKEN = 'test-token'
+        ok, failed = MagicMock(status_code=200), MagicMock(status_code=500)
+        mock_post.side_effect = lambda url, json, **kwargs: failed if orders[1].uid in json['text'] else ok
+
+        with patch.object(send_order_status_notifications_task, 'retry', side_effect=Retry) as retry:
+            with pytest.raises(Retry):
+                send_order_status_notifications_task([o.pk for o in orders])
+
+        retry.assert_called_once_with(kwargs={'order_ids': [orders[1].pk]})
@@ -0,0 +1,95 @@
+"""
+Tests for the DTO read path of orders.
+
+DTO payloads must match the serializers, which stay as the API schema.
+"""
+from datetime import date, time
+
+import pytest
+from django.db.models import Count
+from rest_framework.test import APIClient
+
+from apps.orders.dao import order_dao
+from apps.orders.models import Order, OrderItem, OrderStatus
+from apps.orders.serializers import OrderDetailSerializer, OrderListSerializer
+from apps.users.models import User
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(username='buyer', telegram_id=42)
+
+
+@pytest.fixture
+def orders(user):
+    result = []
+    for n, status in enumerate((OrderStatus.NEW, OrderStatus.DONE)):
+        order = Order.objects.create(
+            user=user,
+            status=status,
+            customer_name='Покупатель',
+            customer_phone='+79990000000',
+            delivery_address='Адрес',
+            delivery_date=date(2026, 3, 8) if n else None,
+            delivery_time_from=time(10, 30) if n else None,
+            delivery_time_to=time(12) if n else None,
+            subtotal=1234500,
+            delivery_fee=30000,
+            total=1264500,
+        )
+        for qty in range(1, n + 3):
+            OrderItem.objects.create(
+                order=order,
+                product_title=f'Букет {qty}',
+                qty=qty,
+                unit_price=150000,
+                line_total=150000 * qty,
+                image_url='https://cdn.example.com/a.jpg' if qty == 1 else '',
+            )
+        result.append(order)
+    return result
+
+
+def user_orders(user):
+    return (
+        Order.objects
+        .filter(user=user)
+        .annotate(items_count=Count('items'))
+        .prefetch_related('items')
+        .order_by('-created_at')
+    )
+
+
+@pytest.mark.django_db
+class TestOrderDAO:
+    """DTO output equals serializer output."""
+
+    def test_list_matches_serializer(self, user, orders):
+        expected = OrderListSerializer(user_orders(user), many=True).data
+
+        data = [order.to_dict() for order in order_dao.build_list(order_dao.list_rows(user_orders(user)))]
+
+        assert data == [dict(item) for item in expected]
+
+    def test_detail_matches_serializer(self, user, orders):
+        for order in orders:
+            expected = OrderDetailSerializer(user_orders(user).get(pk=order.pk)).data
+            assert order_dao.get_detail(user_orders(user), order.pk).to_dict() == expected
+
+    def test_detail_of_other_user(self, orders):
+        other = User.objects.create_user(username='other', telegram_id=43)
+        assert order_dao.get_detail(user_orders(other), orders[0].pk) is None
+        assert order_dao.get_detail(user_orders(other), 'abc') is None
+
+    def test_api_uses_dto(self, user, orders):
+        client = APIClient()
+        client.force_authenticate(user)
+
+        response = client.get('/api/v1/orders/')
+        assert response.status_code == 200
+        assert [item['id'] for item in response.json()['results']] == [o.pk for o in reversed(orders)]
+
+        response = client.get(f'/api/v1/orders/{orders[1].pk}/')
+        assert response.status_code == 200
+        assert response.json()['delivery_time_from'] == '10:30:00'
+        assert len(response.json()['items']) == 3
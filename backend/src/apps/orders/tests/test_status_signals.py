@@ -0,0 +1,74 @@
+"""
+Tests for order status change detection.
+"""
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.bot.models import TaskOutbox
+from apps.orders.models import Order, OrderStatus
+from apps.users.models import User
+
+
+@pytest.fixture
+def order(db):
+    user = User.objects.create_user(username='buyer', telegram_id=42)
+    order = Order.objects.create(
+        user=user,
+        customer_name='Покупатель',
+        customer_phone='+79990000000',
+        delivery_address='Адрес',
+    )
+    return Order.objects.get(pk=order.pk)
+
+
+def _outbox():
+    return list(TaskOutbox.objects.values_list('task_name', 'kwargs'))
+
+
+@pytest.mark.django_db
+class TestOrderStatusSignals:
+    """Tests for notify_status_change."""
+
+    def test_status_change_without_extra_select(self, order):
+        """Saving a loaded order does not re-read its status."""
+        order.status = OrderStatus.CONFIRMED
+
+        with CaptureQueriesContext(connection) as ctx:
+            order.save()
+
+        assert not any(q['sql'].startswith('SELECT') for q in ctx.captured_queries)
+        assert _outbox() == [
+            ('bot.refresh_user_segments', {'user_id': order.user_id}),
+            ('bot.send_order_status_notification', {'order_id': order.pk}),
+        ]
+
+    def test_no_notification_without_change(self, order):
+        """Saving other fields does not notify; repeated save of same status neither."""
+        order.status = OrderStatus.CONFIRMED
+        order.save()
+        order.customer_name = 'Другое имя'
+        order.save()
+
+        assert TaskOutbox.objects.filter(task_name='bot.send_order_status_notification').count() == 1
+
+    def test_deferred_status_is_fetched(self, order):
+        """Order loaded without status still detects the change."""
+        deferred = Order.objects.only('id', 'uid', 'user').get(pk=order.pk)
+        deferred.status = OrderStatus.CANCELLED
+        deferred.save()
+
+        assert ('bot.send_order_status_notification', {'order_id': order.pk}) in _outbox()
+
+    def test_refresh_from_db_resets_loaded_status(self, order):
+        """Status changed elsewhere and re-read is not reported as a transition again."""
+        Order.objects.filter(pk=order.pk).update(status=OrderStatus.CONFIRMED)
+        order.refresh_from_db()
+        order.save()
+        assert _outbox() == []
+
+        # And a real transition from the refreshed status is reported
+        order.refresh_from_db(fields=['status'])
+        order.status = OrderStatus.NEW
+        order.save()
+        assert ('bot.refresh_user_segments', {'user_id': order.user_id}) in _outbox()
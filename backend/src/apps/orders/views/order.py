@@ -2,10 +2,13 @@
 import logging
 
 from django.db.models import Count
+from django.http import Http404
 from rest_framework import status, viewsets
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from apps.core.pagination import KeysetPagination
+from apps.orders.dao import order_dao
 from apps.orders.models import Order
 from apps.orders.serializers import (
     OrderCreateSerializer,
@@ -23,8 +26,12 @@ class OrderViewSet(viewsets.ModelViewSet):
     list: Список заказов текущего пользователя
     retrieve: Детали заказа
     create: Оформление заказа
+
+    Ответы собираются из DTO (values() + to_dict()), сериализаторы
+    вывода описывают схему для OpenAPI.
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
     http_method_names = ['get', 'post', 'head', 'options']
 
     def get_queryset(self):
@@ -43,6 +50,18 @@ class OrderViewSet(viewsets.ModelViewSet):
             return OrderDetailSerializer
         return OrderListSerializer
 
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = self.paginate_queryset(order_dao.list_rows(queryset))
+        data = [order.to_dict() for order in order_dao.build_list(rows)]
+        return self.get_paginated_response(data)
+
+    def retrieve(self, request, *args, **kwargs):
+        order = order_dao.get_detail(self.get_queryset(), kwargs[self.lookup_field])
+        if order is None:
+            raise Http404
+        return Response(order.to_dict())
+
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -57,5 +76,5 @@ class OrderViewSet(viewsets.ModelViewSet):
         )
 
         # Возвращаем созданный заказ
-        output_serializer = OrderDetailSerializer(order, context={'request': request})
-        return Response(output_serializer.data, status=status.HTTP_201_CREATED)
+        detail = order_dao.get_detail(self.get_queryset(), order.pk)
+        return Response(detail.to_dict(), status=status.HTTP_201_CREATED)
@@ -0,0 +1,7 @@
+"""Products DAO."""
+from apps.products.dao.product import ProductDAO, product_dao
+
+__all__ = [
+    'ProductDAO',
+    'product_dao',
+]
@@ -0,0 +1,180 @@
+"""Product DAO."""
+from collections.abc import Callable
+
+from django.db.models import QuerySet
+
+from apps.core.dao.base import BaseDAO
+from apps.products.dto import ProductDetailDTO, ProductImageDTO, ProductListDTO
+from apps.products.models import Product, ProductImage
+
+LIST_FIELDS = (
+    'id',
+    'title',
+    'slug',
+    'price',
+    'old_price',
+    'is_active',
+    'is_unlimited',
+    'qty_available',
+    'category__slug',
+    # Ключ пагинации (KeysetPagination)
+    'sort_order',
+    'created_at',
+)
+
+DETAIL_FIELDS = LIST_FIELDS + (
+    'description',
+    'category_id',
+    'category__title',
+)
+
+IMAGE_FIELDS = ('id', 'product_id', 'image', 'alt_text', 'is_main', 'sort_order')
+
+
+def _image_url(name: str) -> str:
+    """URL файла, как FieldFile.url ('' если файла нет)."""
+    if not name:
+        return ''
+    return ProductImage._meta.get_field('image').storage.url(name)
+
+
+def _is_available(row: dict) -> bool:
+    return row['is_active'] and (row['is_unlimited'] or row['qty_available'] > 0)
+
+
+class ProductDAO(BaseDAO[Product]):
+    """
+    Чтение товаров в DTO без создания моделей.
+
+    Строки берутся через values(), фото — одним запросом на страницу.
+    """
+
+    model = Product
+
+    def list_rows(self, queryset: QuerySet) -> QuerySet:
+        """
+        values()-queryset для build_list().
+
+        Фильтры, сортировка и аннотации (например, search_rank) сохраняются.
+        """
+        return (
+            queryset.select_related(None).prefetch_related(None)
+            .values(*LIST_FIELDS, *queryset.query.annotation_select)
+        )
+
+    def rows_by_ids_query(self, ids: list[int]) -> QuerySet:
+        """
+        Строки для build_list() по списку id.
+
+        Неактивные товары тоже возвращаются (is_available=False):
+        корзине нужно знать, что товар сняли с продажи.
+        """
+        return Product.objects.filter(id__in=ids).values(*LIST_FIELDS)
+
+    def rows_by_ids(self, ids: list[int]) -> list[dict]:
+        """rows_by_ids_query() в порядке ids (удалённых товаров нет)."""
+        rows = {row['id']: row for row in self.rows_by_ids_query(ids)}
+        return [rows[pk] for pk in ids if pk in rows]
+
+    async def arows_by_ids(self, ids: list[int]) -> list[dict]:
+        """rows_by_ids() для async-вьюх."""
+        rows = {row['id']: row async for row in self.rows_by_ids_query(ids)}
+        return [rows[pk] for pk in ids if pk in rows]
+
+    def main_images_query(self, product_ids: list[int]) -> QuerySet:
+        """Главное (или первое) фото каждого товара."""
+        return (
+            ProductImage.objects
+            .filter(product_id__in=product_ids)
+            .order_by('product_id', '-is_main', 'sort_order')
+            .distinct('product_id')
+            .values_list('product_id', 'image')
+        )
+
+    def build_list(
+        self,
+        rows: list[dict],
+        main_images: dict[int, str] | None = None,
+        image_url: Callable[[str], str] = _image_url,
+    ) -> list[ProductListDTO]:
+        """
+        DTO для списка из строк list_rows().
+
+        Args:
+            rows: Строки товаров
+            main_images: {product_id: имя файла}; если не передано — загружается
+            image_url: URL по имени файла ('' если файла нет); по умолчанию storage.url()
+        """
+        if main_images is None:
+            main_images = dict(self.main_images_query([row['id'] for row in rows])) if rows else {}
+
+        return [
+            ProductListDTO(
+                id=row['id'],
+                title=row['title'],
+                slug=row['slug'],
+                price=row['price'],
+                old_price=row['old_price'],
+                is_available=_is_available(row),
+                main_image_url=image_url(main_images.get(row['id'])) or None,
+                category_slug=row['category__slug'],
+            )
+            for row in rows
+        ]
+
+    async def abuild_list(self, rows: list[dict]) -> list[ProductListDTO]:
+        """build_list() для async-вьюх: фото загружаются через async ORM."""
+        main_images = {}
+        if rows:
+            main_images = {
+                product_id: image
+                async for product_id, image in self.main_images_query([row['id'] for row in rows])
+            }
+        return self.build_list(rows, main_images)
+
+    def get_detail(self, queryset: QuerySet, slug: str) -> ProductDetailDTO | None:
+        """Товар с категорией и всеми фото (None, если не найден в queryset)."""
+        row = (
+            queryset.select_related(None).prefetch_related(None)
+            .filter(slug=slug)
+            .values(*DETAIL_FIELDS)
+            .first()
+        )
+        if row is None:
+            return None
+
+        images = (
+            ProductImage.objects
+            .filter(product_id=row['id'])
+            .order_by('-is_main', 'sort_order')
+            .values(*IMAGE_FIELDS)
+        )
+
+        return ProductDetailDTO(
+            id=row['id'],
+            title=row['title'],
+            slug=row['slug'],
+            description=row['description'],
+            price=row['price'],
+            old_price=row['old_price'],
+            qty_available=row['qty_available'],
+            is_unlimited=row['is_unlimited'],
+            is_available=_is_available(row),
+            category_id=row['category_id'],
+            category_title=row['category__title'],
+            category_slug=row['category__slug'],
+            images=[
+                ProductImageDTO(
+                    id=image['id'],
+                    url=_image_url(image['image']),
+                    alt_text=image['alt_text'],
+                    is_main=image['is_main'],
+                    sort_order=image['sort_order'],
+                )
+                for image in images
+            ],
+            created_at=row['created_at'],
+        )
+
+
+product_dao = ProductDAO()
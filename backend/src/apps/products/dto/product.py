@@ -2,6 +2,19 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from apps.core.dto import format_datetime, format_price
+
+
+def _price_fields(price: int, old_price: int | None) -> dict:
+    """Цены и скидка в формате API."""
+    return {
+        'price': price,
+        'price_display': format_price(price),
+        'old_price': old_price,
+        'old_price_display': format_price(old_price) if old_price else None,
+        'has_discount': old_price is not None and old_price > price,
+    }
+
 
 @dataclass(frozen=True, slots=True)
 class ProductImageDTO:
@@ -12,6 +25,15 @@ class ProductImageDTO:
     is_main: bool
     sort_order: int
 
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'url': self.url,
+            'alt_text': self.alt_text,
+            'is_main': self.is_main,
+            'sort_order': self.sort_order,
+        }
+
 
 @dataclass(frozen=True, slots=True)
 class ProductListDTO:
@@ -25,6 +47,18 @@ class ProductListDTO:
     main_image_url: str | None
     category_slug: str
 
+    def to_dict(self) -> dict:
+        """Ответ API (поля ProductListSerializer)."""
+        return {
+            'id': self.id,
+            'title': self.title,
+            'slug': self.slug,
+            **_price_fields(self.price, self.old_price),
+            'is_available': self.is_available,
+            'main_image': self.main_image_url,
+            'category_slug': self.category_slug,
+        }
+
 
 @dataclass(frozen=True)
 class ProductDetailDTO:
@@ -44,6 +78,26 @@ class ProductDetailDTO:
     images: list[ProductImageDTO] = field(default_factory=list)
     created_at: datetime | None = None
 
+    def to_dict(self) -> dict:
+        """Ответ API (поля ProductDetailSerializer)."""
+        return {
+            'id': self.id,
+            'title': self.title,
+            'slug': self.slug,
+            'description': self.description,
+            **_price_fields(self.price, self.old_price),
+            'qty_available': self.qty_available,
+            'is_unlimited': self.is_unlimited,
+            'is_available': self.is_available,
+            'category': {
+                'id': self.category_id,
+                'title': self.category_title,
+                'slug': self.category_slug,
+            },
+            'images': [image.to_dict() for image in self.images],
+            'created_at': format_datetime(self.created_at),
+        }
+
 
 # === Input DTOs ===
 
@@ -0,0 +1,126 @@
+"""Product filters."""
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import models
+from django.db.models.functions import Cast
+from django_filters import rest_framework as filters
+from django_filters.constants import EMPTY_VALUES
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import SearchFilter
+from rest_framework.settings import api_settings
+
+from apps.products.models import Product
+
+# Товар можно купить: под заказ или есть остаток
+IN_STOCK = models.Q(is_unlimited=True) | models.Q(qty_available__gt=0)
+
+# Предел ?ids= (корзина + избранное с запасом)
+MAX_BULK_IDS = 300
+
+
+def parse_ids(value: str) -> list[int]:
+    """
+    ?ids=3,1,2 -> [3, 1, 2]: порядок сохраняется, повторы убираются.
+
+    Raises:
+        ValidationError: не числа или больше MAX_BULK_IDS
+    """
+    try:
+        ids = [int(part) for part in value.split(',') if part.strip()]
+    except ValueError as exc:
+        raise ValidationError({'ids': ['Ожидаются id через запятую.']}) from exc
+    ids = list(dict.fromkeys(ids))
+    if len(ids) > MAX_BULK_IDS:
+        raise ValidationError({'ids': [f'Не больше {MAX_BULK_IDS} id за запрос.']})
+    return ids
+
+
+class ProductFilter(filters.FilterSet):
+    """Фильтры для товаров."""
+    category = filters.CharFilter(field_name='category__slug')
+    min_price = filters.NumberFilter(field_name='price', lookup_expr='gte')
+    max_price = filters.NumberFilter(field_name='price', lookup_expr='lte')
+    in_stock = filters.BooleanFilter(method='filter_in_stock')
+
+    class Meta:
+        model = Product
+        fields = ['category']
+
+    def filter_in_stock(self, queryset, name, value):
+        if value:
+            return queryset.filter(IN_STOCK)
+        return queryset
+
+    def get_conditions(self) -> dict[str, models.Q]:
+        """
+        Заполненные фильтры как Q: {имя фильтра: условие}.
+
+        Для условной агрегации (фасеты), где каждое условие применяется
+        отдельно. Вызывается после is_valid().
+        """
+        conditions = {}
+        for name, value in self.form.cleaned_data.items():
+            if value in EMPTY_VALUES:
+                continue
+            if name == 'in_stock':
+                if value:
+                    conditions[name] = IN_STOCK
+                continue
+            field = self.filters[name]
+            conditions[name] = models.Q(**{f'{field.field_name}__{field.lookup_expr}': value})
+        return conditions
+
+
+class ProductSearchFilter(SearchFilter):
+    """
+    Полнотекстовый поиск по Product.search_vector (русская морфология).
+
+    Все слова запроса обязательны и ищутся по префиксу основы
+    ("тюльпаны" находит "тюльпанов", "хриз" — "хризантемы"),
+    результаты сортируются по релевантности (search_rank). Явная
+    сортировка (?ordering=price) сохраняется, поэтому бэкенд ставится
+    после OrderingFilter.
+    """
+
+    search_config = 'russian'
+
+    def get_search_query(self, request) -> SearchQuery | None:
+        # Только буквы и цифры: остальное — синтаксис tsquery. Слова через
+        # дефис и пунктуацию («иван-чай») ищутся частями, как их индексирует парсер
+        words = [
+            word
+            for term in self.get_search_terms(request)
+            for word in re.split(r'\W+', term)
+            if word
+        ]
+        if not words:
+            return None
+        return SearchQuery(
+            ' & '.join(f'{word}:*' for word in words),
+            config=self.search_config,
+            search_type='raw',
+        )
+
+    def filter_queryset(self, request, queryset, view):
+        query = self.get_search_query(request)
+        if query is None:
+            return queryset
+
+        # ts_rank() возвращает real; double precision точно переживает
+        # JSON в курсоре KeysetPagination
+        queryset = queryset.filter(search_vector=query).annotate(
+            search_rank=Cast(SearchRank(models.F('search_vector'), query), models.FloatField()),
+        )
+        if request.query_params.get(api_settings.ORDERING_PARAM):
+            return queryset
+        return queryset.order_by('-search_rank', *queryset.query.order_by)
+
+    def get_schema_operation_parameters(self, view):
+        return [{
+            'name': self.search_param,
+            'required': False,
+            'in': 'query',
+            'description': 'Поиск по названию и описанию (русская морфология)',
+            'schema': {'type': 'string'},
+        }]
@@ -0,0 +1,100 @@
+"""
+Django management command для замера поиска по каталогу.
+
+Создаёт синтетический каталог (по умолчанию 50 000 товаров) в транзакции,
+которая откатывается в конце, и сравнивает прежний поиск DRF SearchFilter
+(ILIKE '%q%' по title и description) с полнотекстовым ProductSearchFilter:
+время первой страницы и число найденных товаров.
+
+    python manage.py bench_search --products 50000 --query розы --query "белые тюльпаны"
+"""
+import random
+import statistics
+import time
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import RequestFactory
+from rest_framework.filters import SearchFilter
+from rest_framework.request import Request
+
+from apps.products.filters import ProductSearchFilter
+from apps.products.models import Category, Product
+
+FLOWERS = ['роз', 'тюльпанов', 'пионов', 'хризантем', 'гортензий', 'лилий', 'ромашек', 'эустом']
+COLORS = ['белых', 'красных', 'розовых', 'жёлтых', 'кремовых', 'сиреневых']
+WORDS = [
+    'букет', 'композиция', 'в', 'коробке', 'корзине', 'крафте', 'с', 'зеленью',
+    'лентой', 'для', 'мамы', 'свадьбы', 'свежие', 'цветы', 'доставка', 'сегодня',
+]
+DEFAULT_QUERIES = ['розы', 'белые тюльпаны', 'букет в коробке', 'пион']
+
+
+def _title(rng: random.Random) -> str:
+    return f"Букет из {rng.randint(5, 101)} {rng.choice(COLORS)} {rng.choice(FLOWERS)}"
+
+
+def _description(rng: random.Random) -> str:
+    words = rng.choices(WORDS + FLOWERS + COLORS, k=rng.randint(20, 60))
+    return ' '.join(words).capitalize() + '.'
+
+
+class Command(BaseCommand):
+    help = 'Замер поиска: ILIKE (SearchFilter) против полнотекстового поиска (ProductSearchFilter)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--products', type=int, default=50000, help='Товаров в синтетическом каталоге')
+        parser.add_argument('--query', action='append', dest='queries', help='Поисковый запрос (можно несколько)')
+        parser.add_argument('--repeat', type=int, default=20, help='Повторов на запрос')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self._fill(options['products'])
+            self._run(options['queries'] or DEFAULT_QUERIES, options['repeat'])
+            transaction.set_rollback(True)
+
+    def _fill(self, size: int) -> None:
+        rng = random.Random(42)
+        category = Category.objects.create(title='Бенчмарк', slug='bench-search')
+        started = time.perf_counter()
+        Product.objects.bulk_create(
+            (
+                Product(
+                    category=category,
+                    title=_title(rng),
+                    slug=f'bench-search-{n}',
+                    description=_description(rng),
+                    price=rng.randint(1000, 20000) * 100,
+                    sort_order=rng.randint(0, 5),
+                )
+                for n in range(size)
+            ),
+            batch_size=2000,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE products_product')
+        self.stdout.write(f"Каталог: {size} товаров за {time.perf_counter() - started:.1f} с")
+
+    def _run(self, queries: list[str], repeat: int) -> None:
+        backends = {
+            'ILIKE': SearchFilter(),
+            'full-text': ProductSearchFilter(),
+        }
+        view = SimpleNamespace(search_fields=['title', 'description'])
+        queryset = Product.objects.filter(is_active=True).order_by('sort_order', '-created_at', 'id')
+
+        for query in queries:
+            request = Request(RequestFactory().get('/', {'search': query}))
+            self.stdout.write(f'«{query}»')
+            for label, backend in backends.items():
+                results = backend.filter_queryset(request, queryset, view)
+                timings = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    list(results.values_list('id', flat=True)[:20])
+                    timings.append((time.perf_counter() - started) * 1000)
+                self.stdout.write(
+                    f"  {label:>10}: найдено {results.count():>6}, "
+                    f"страница p50={statistics.median(timings):.1f} мс max={max(timings):.1f} мс"
+                )
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.10 on 2026-10-19 05:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0002_favorite_action'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='favoriteaction',
+            name='products_fa_user_id_b54465_idx',
+        ),
+        migrations.AddIndex(
+            model_name='favoriteaction',
+            index=models.Index(fields=['user', '-created_at', 'id'], name='products_fa_user_id_82d91f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['sort_order', '-created_at', 'id'], name='product_catalog_keyset_idx'),
+        ),
+    ]
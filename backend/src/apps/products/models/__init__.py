@@ -1,10 +1,13 @@
 """Products models."""
 from apps.products.models.category import Category
+from apps.products.models.change import CatalogChange, CatalogChangeKind
 from apps.products.models.favorite import FavoriteAction, FavoriteActionType
 from apps.products.models.product import Product
 from apps.products.models.product_image import ProductImage
 
 __all__ = [
+    'CatalogChange',
+    'CatalogChangeKind',
     'Category',
     'FavoriteAction',
     'FavoriteActionType',
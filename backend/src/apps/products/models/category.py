@@ -1,4 +1,5 @@
 """Category model."""
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.utils.text import slugify
 
@@ -46,6 +47,10 @@ class Category(TimeStampedModel):
         verbose_name = 'Категория'
         verbose_name_plural = 'Категории'
         ordering = ['sort_order', 'title']
+        indexes = [
+            # Автодополнение с опечатками (pg_trgm)
+            GinIndex(fields=['title'], opclasses=['gin_trgm_ops'], name='category_title_trgm_idx'),
+        ]
 
     def __str__(self):
         return self.title
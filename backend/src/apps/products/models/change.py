@@ -0,0 +1,51 @@
+"""Catalog change log model."""
+from django.db import models
+from django.db.models.expressions import RawSQL
+
+
+class CatalogChangeKind(models.TextChoices):
+    """Что изменилось."""
+    PRODUCT = 'product', 'Товар'
+    CATEGORY = 'category', 'Категория'
+
+
+class CatalogChange(models.Model):
+    """
+    Журнал изменений каталога для дельта-синхронизации клиентов.
+
+    Запись добавляется сигналами на каждое сохранение/удаление товара,
+    его фото или категории (apps.products.signals). Версия каталога —
+    не id записи, а номер транзакции (txid): id выдаются до коммита
+    и могут стать видимыми не по порядку, а граница «все транзакции
+    до N завершены» (pg_snapshot_xmin) только растёт.
+    См. apps.products.services.changes.
+    """
+
+    kind = models.CharField(
+        max_length=10,
+        choices=CatalogChangeKind.choices,
+        verbose_name='Тип',
+    )
+    object_id = models.PositiveBigIntegerField(
+        verbose_name='ID объекта',
+    )
+    txid = models.BigIntegerField(
+        db_default=RawSQL('pg_current_xact_id()::text::bigint', []),
+        editable=False,
+        verbose_name='Транзакция',
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Создано',
+    )
+
+    class Meta:
+        verbose_name = 'Изменение каталога'
+        verbose_name_plural = 'Журнал изменений каталога'
+        ordering = ['txid', 'id']
+        indexes = [
+            models.Index(fields=['txid']),
+        ]
+
+    def __str__(self):
+        return f'{self.get_kind_display()} #{self.object_id} (txid {self.txid})'
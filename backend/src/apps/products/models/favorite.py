@@ -46,7 +46,8 @@ class FavoriteAction(TimeStampedModel):
         verbose_name_plural = 'История избранного'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['user', '-created_at']),
+            # Ключ пагинации истории (KeysetPagination)
+            models.Index(fields=['user', '-created_at', 'id']),
             models.Index(fields=['product', '-created_at']),
             models.Index(fields=['user', 'product', '-created_at']),
         ]
@@ -82,6 +83,39 @@ class FavoriteAction(TimeStampedModel):
             is_active=True,
         )
 
+    @classmethod
+    def latest_actions(cls, user, product_ids) -> models.QuerySet:
+        """
+        Последнее действие по каждому из товаров: (product_id, action).
+
+        Один запрос DISTINCT ON по индексу (user, product, -created_at).
+        """
+        return (
+            cls.objects
+            .filter(user=user, product_id__in=product_ids)
+            .order_by('product_id', '-created_at', '-id')
+            .distinct('product_id')
+            .values_list('product_id', 'action')
+        )
+
+    @classmethod
+    def get_favorite_ids(cls, user, product_ids) -> set[int]:
+        """Какие из product_ids в избранном у пользователя."""
+        return {
+            product_id
+            for product_id, action in cls.latest_actions(user, product_ids)
+            if action == FavoriteActionType.ADDED
+        }
+
+    @classmethod
+    async def aget_favorite_ids(cls, user, product_ids) -> set[int]:
+        """get_favorite_ids() для async-вьюх."""
+        return {
+            product_id
+            async for product_id, action in cls.latest_actions(user, product_ids)
+            if action == FavoriteActionType.ADDED
+        }
+
     @classmethod
     def add_to_favorites(cls, user, product) -> 'FavoriteAction':
         """Добавить товар в избранное."""
@@ -1,4 +1,6 @@
 """Product model."""
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from django.utils.text import slugify
 
@@ -69,6 +71,18 @@ class Product(TimeStampedModel):
         db_index=True,
     )
 
+    # === Полнотекстовый поиск ===
+    # Считается в БД (русская морфология), название весомее описания
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config='russian')
+            + SearchVector('description', weight='B', config='russian')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+        editable=False,
+    )
+
     class Meta:
         verbose_name = 'Товар'
         verbose_name_plural = 'Товары'
@@ -76,6 +90,15 @@ class Product(TimeStampedModel):
         indexes = [
             models.Index(fields=['category', 'is_active']),
             models.Index(fields=['is_active', 'sort_order']),
+            # Ключ пагинации каталога (KeysetPagination)
+            models.Index(
+                fields=['sort_order', '-created_at', 'id'],
+                condition=models.Q(is_active=True),
+                name='product_catalog_keyset_idx',
+            ),
+            GinIndex(fields=['search_vector'], name='product_search_vector_idx'),
+            # Автодополнение с опечатками (pg_trgm)
+            GinIndex(fields=['title'], opclasses=['gin_trgm_ops'], name='product_title_trgm_idx'),
         ]
 
     def __str__(self):
@@ -1,5 +1,17 @@
 """Products serializers."""
+from apps.products.serializers.autocomplete import (
+    AutocompleteItemSerializer,
+    AutocompleteQuerySerializer,
+    AutocompleteSerializer,
+)
+from apps.products.serializers.bootstrap import (
+    BootstrapProductsSerializer,
+    BootstrapSerializer,
+    BootstrapTokensSerializer,
+)
 from apps.products.serializers.category import CategorySerializer
+from apps.products.serializers.changes import CatalogChangesQuerySerializer, CatalogChangesSerializer
+from apps.products.serializers.facets import CategoryFacetSerializer, ProductFacetsSerializer
 from apps.products.serializers.favorite import (
     FavoriteActionSerializer,
     FavoriteBulkSerializer,
@@ -11,13 +23,25 @@ from apps.products.serializers.product import (
     ProductImageSerializer,
     ProductListSerializer,
 )
+from apps.products.serializers.snapshot import CatalogSnapshotSerializer
 
 __all__ = [
+    'AutocompleteItemSerializer',
+    'AutocompleteQuerySerializer',
+    'AutocompleteSerializer',
+    'BootstrapProductsSerializer',
+    'BootstrapSerializer',
+    'BootstrapTokensSerializer',
+    'CatalogChangesQuerySerializer',
+    'CatalogChangesSerializer',
+    'CatalogSnapshotSerializer',
+    'CategoryFacetSerializer',
     'CategorySerializer',
     'FavoriteActionSerializer',
     'FavoriteBulkSerializer',
     'FavoriteStatusSerializer',
     'FavoriteToggleSerializer',
+    'ProductFacetsSerializer',
     'ProductDetailSerializer',
     'ProductImageSerializer',
     'ProductListSerializer',
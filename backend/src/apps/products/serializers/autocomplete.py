@@ -0,0 +1,22 @@
+"""Autocomplete serializers."""
+from rest_framework import serializers
+
+
+class AutocompleteQuerySerializer(serializers.Serializer):
+    """Параметры автодополнения."""
+    q = serializers.CharField(allow_blank=True, trim_whitespace=True)
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=20)
+
+
+class AutocompleteItemSerializer(serializers.Serializer):
+    """Подсказка: товар или категория."""
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    slug = serializers.CharField()
+
+
+class AutocompleteSerializer(serializers.Serializer):
+    """Ответ автодополнения."""
+    query = serializers.CharField()
+    products = AutocompleteItemSerializer(many=True)
+    categories = AutocompleteItemSerializer(many=True)
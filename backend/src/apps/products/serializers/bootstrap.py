@@ -0,0 +1,28 @@
+"""App bootstrap serializers."""
+from rest_framework import serializers
+
+from apps.products.serializers.category import CategorySerializer
+from apps.products.serializers.product import ProductListSerializer
+from apps.users.serializers import UserSerializer
+
+
+class BootstrapProductsSerializer(serializers.Serializer):
+    """Первая страница каталога (как GET /products/)."""
+    next = serializers.URLField(allow_null=True)
+    results = ProductListSerializer(many=True)
+
+
+class BootstrapTokensSerializer(serializers.Serializer):
+    """JWT для запросов, авторизованных по X-Telegram-Init-Data."""
+    access = serializers.CharField()
+    refresh = serializers.CharField()
+
+
+class BootstrapSerializer(serializers.Serializer):
+    """Стартовые данные Mini App."""
+    user = UserSerializer(allow_null=True)
+    tokens = BootstrapTokensSerializer(allow_null=True)
+    categories = CategorySerializer(many=True)
+    products = BootstrapProductsSerializer()
+    favorites = serializers.ListField(child=serializers.IntegerField(), help_text='id товаров в избранном')
+    pages = serializers.ListField(child=serializers.CharField(), help_text='slug активных страниц')
@@ -0,0 +1,29 @@
+"""Catalog delta sync serializers."""
+from rest_framework import serializers
+
+from apps.products.serializers.category import CategorySerializer
+from apps.products.serializers.product import ProductListSerializer
+
+
+class CatalogChangesQuerySerializer(serializers.Serializer):
+    """Параметры запроса изменений каталога."""
+    since = serializers.IntegerField(
+        required=False,
+        min_value=0,
+        help_text='version из предыдущего ответа (или changes_version снимка)',
+    )
+
+
+class RemovedSerializer(serializers.Serializer):
+    """Удалённые или скрытые объекты."""
+    products = serializers.ListField(child=serializers.IntegerField())
+    categories = serializers.ListField(child=serializers.IntegerField())
+
+
+class CatalogChangesSerializer(serializers.Serializer):
+    """Изменения каталога с версии since."""
+    version = serializers.IntegerField(help_text='Передать как since в следующем запросе')
+    reset = serializers.BooleanField(help_text='История недоступна — загрузить каталог целиком')
+    products = ProductListSerializer(many=True)
+    categories = CategorySerializer(many=True)
+    removed = RemovedSerializer()
@@ -0,0 +1,19 @@
+"""Facets serializers."""
+from rest_framework import serializers
+
+
+class CategoryFacetSerializer(serializers.Serializer):
+    """Категория с количеством товаров при остальных фильтрах."""
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    slug = serializers.CharField()
+    count = serializers.IntegerField()
+
+
+class ProductFacetsSerializer(serializers.Serializer):
+    """Фасеты каталога для текущих фильтров."""
+    total = serializers.IntegerField(help_text='Товаров со всеми фильтрами')
+    in_stock = serializers.IntegerField(help_text='Из них в наличии (без учёта фильтра in_stock)')
+    min_price = serializers.IntegerField(allow_null=True, help_text='Копейки, без учёта фильтра цены')
+    max_price = serializers.IntegerField(allow_null=True, help_text='Копейки, без учёта фильтра цены')
+    categories = CategoryFacetSerializer(many=True)
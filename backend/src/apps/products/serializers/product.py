@@ -26,6 +26,8 @@ class ProductListSerializer(serializers.ModelSerializer):
     is_available = serializers.BooleanField(read_only=True)
     main_image = serializers.SerializerMethodField()
     category_slug = serializers.CharField(source='category.slug', read_only=True)
+    # Только для авторизованных (добавляется во вьюхе)
+    is_favorite = serializers.BooleanField(read_only=True, required=False)
 
     class Meta:
         model = Product
@@ -41,6 +43,7 @@ class ProductListSerializer(serializers.ModelSerializer):
             'is_available',
             'main_image',
             'category_slug',
+            'is_favorite',
         ]
 
     def get_price_display(self, obj) -> str:
@@ -56,11 +59,9 @@ class ProductListSerializer(serializers.ModelSerializer):
         return obj.old_price is not None and obj.old_price > obj.price
 
     def get_main_image(self, obj) -> str | None:
-        main = obj.images.filter(is_main=True).first()
-        if main and main.image:
-            return main.image.url
-        # Fallback на первое фото
-        first = obj.images.first()
+        # Главное фото идёт первым (ordering = ['-is_main', 'sort_order']),
+        # иначе — первое по порядку. all() использует prefetch из вьюхи
+        first = next(iter(obj.images.all()), None)
         if first and first.image:
             return first.image.url
         return None
@@ -74,6 +75,8 @@ class ProductDetailSerializer(serializers.ModelSerializer):
     is_available = serializers.BooleanField(read_only=True)
     images = ProductImageSerializer(many=True, read_only=True)
     category = serializers.SerializerMethodField()
+    # Только для авторизованных (добавляется во вьюхе)
+    is_favorite = serializers.BooleanField(read_only=True, required=False)
 
     class Meta:
         model = Product
@@ -93,6 +96,7 @@ class ProductDetailSerializer(serializers.ModelSerializer):
             'category',
             'images',
             'created_at',
+            'is_favorite',
         ]
 
     def get_price_display(self, obj) -> str:
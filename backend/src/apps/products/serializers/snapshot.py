@@ -0,0 +1,15 @@
+"""Catalog snapshot serializers."""
+from rest_framework import serializers
+
+
+class CatalogSnapshotSerializer(serializers.Serializer):
+    """Текущий снимок каталога в хранилище."""
+    version = serializers.IntegerField(help_text='Растёт с каждой публикацией')
+    changes_version = serializers.IntegerField(
+        required=False,
+        help_text='since для GET /products/changes/ после загрузки снимка',
+    )
+    url = serializers.CharField(help_text='JSON, сжатый gzip: {version, changes_version, built_at, categories, products}')
+    built_at = serializers.DateTimeField()
+    products_count = serializers.IntegerField()
+    size = serializers.IntegerField(help_text='Размер файла, байт')
@@ -0,0 +1,40 @@
+"""Products services."""
+from apps.products.services.autocomplete import (
+    get_suggestions,
+    invalidate_suggestions,
+    top_search_queries,
+    warm_suggestions,
+)
+from apps.products.services.bootstrap import get_favorite_ids, get_public_data, invalidate_bootstrap
+from apps.products.services.catalog import (
+    CATALOG_ORDERING,
+    active_categories,
+    catalog_queryset,
+    mark_favorites,
+)
+from apps.products.services.changes import current_version, get_changes, prune_changes, record_change
+from apps.products.services.facets import get_facets, invalidate_facets
+from apps.products.services.snapshot import get_current_snapshot, publish_snapshot, schedule_snapshot
+
+__all__ = [
+    'CATALOG_ORDERING',
+    'active_categories',
+    'catalog_queryset',
+    'current_version',
+    'get_changes',
+    'get_current_snapshot',
+    'get_facets',
+    'get_favorite_ids',
+    'get_public_data',
+    'get_suggestions',
+    'invalidate_bootstrap',
+    'invalidate_facets',
+    'invalidate_suggestions',
+    'mark_favorites',
+    'prune_changes',
+    'publish_snapshot',
+    'record_change',
+    'schedule_snapshot',
+    'top_search_queries',
+    'warm_suggestions',
+]
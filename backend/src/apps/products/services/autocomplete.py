@@ -0,0 +1,161 @@
+"""
+Автодополнение поиска по каталогу (pg_trgm).
+
+Подсказки — названия товаров и категорий, ближайшие к введённому тексту
+по word_similarity: опечатки и незаконченные слова тоже находятся.
+Поиск идёт по GIN-индексам gin_trgm_ops, ответы кэшируются по
+нормализованному запросу. Популярные запросы из аналитики (и их
+префиксы) прогреваются задачей products.warm_autocomplete_cache.
+"""
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.postgres.search import TrigramSimilarity, TrigramWordSimilarity
+from django.core.cache import cache
+from django.db import connections, router, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from apps.analytics.models import AnalyticsEvent, EventType
+from apps.core.db_router import get_reporting_db
+from apps.products.models import Category, Product
+
+logger = logging.getLogger(__name__)
+
+AUTOCOMPLETE_VERSION_KEY = 'products:autocomplete:version'
+AUTOCOMPLETE_KEY = 'products:autocomplete:v{version}:{limit}:{query}'
+
+MIN_QUERY_LENGTH = 2
+MAX_QUERY_LENGTH = 64
+
+
+def normalize_query(query: str) -> str:
+    """Нижний регистр, одиночные пробелы, не длиннее MAX_QUERY_LENGTH."""
+    return ' '.join(query.lower().split())[:MAX_QUERY_LENGTH]
+
+
+def _similar(queryset, query: str, fields: tuple[str, ...], limit: int) -> list[dict]:
+    # При равной близости к слову выше названия, близкие целиком (короче, с него начинаются)
+    return list(
+        queryset
+        .filter(title__trigram_word_similar=query)
+        .annotate(
+            word_similarity=TrigramWordSimilarity(query, 'title'),
+            similarity=TrigramSimilarity('title', query),
+        )
+        .order_by('-word_similarity', '-similarity', 'sort_order', 'title')
+        .values(*fields)[:limit]
+    )
+
+
+def compute_suggestions(query: str, limit: int) -> dict:
+    """Подсказки из БД (без кэша) для нормализованного запроса."""
+    if len(query) < MIN_QUERY_LENGTH:
+        return {'products': [], 'categories': []}
+
+    db = router.db_for_read(Product)
+    with transaction.atomic(using=db), connections[db].cursor() as cursor:
+        # Порог оператора <% (по умолчанию 0.6) — только для этой транзакции
+        cursor.execute(
+            'SET LOCAL pg_trgm.word_similarity_threshold = %s',
+            [settings.AUTOCOMPLETE_SIMILARITY_THRESHOLD],
+        )
+        return {
+            'products': _similar(
+                Product.objects.using(db).filter(is_active=True),
+                query, ('id', 'title', 'slug'), limit,
+            ),
+            'categories': _similar(
+                Category.objects.using(db).filter(is_active=True),
+                query, ('id', 'title', 'slug'), limit,
+            ),
+        }
+
+
+def _version() -> int:
+    version = cache.get(AUTOCOMPLETE_VERSION_KEY)
+    if version is None:
+        version = time.time_ns()
+        cache.add(AUTOCOMPLETE_VERSION_KEY, version, timeout=None)
+        version = cache.get(AUTOCOMPLETE_VERSION_KEY, version)
+    return version
+
+
+def _cache_key(version: int, query: str, limit: int) -> str:
+    return AUTOCOMPLETE_KEY.format(version=version, limit=limit, query=query)
+
+
+def get_suggestions(query: str, limit: int | None = None) -> dict:
+    """
+    Подсказки для введённого текста (из кэша, при промахе — из БД).
+
+    Returns:
+        {'query': ..., 'products': [{id, title, slug}], 'categories': [...]}
+    """
+    query = normalize_query(query)
+    limit = limit or settings.AUTOCOMPLETE_LIMIT
+
+    key = _cache_key(_version(), query, limit)
+    suggestions = cache.get(key)
+    if suggestions is None:
+        suggestions = compute_suggestions(query, limit)
+        cache.set(key, suggestions, timeout=settings.AUTOCOMPLETE_CACHE_TTL)
+
+    return {'query': query, **suggestions}
+
+
+def invalidate_suggestions() -> None:
+    """Сбросить кэш подсказок (изменились товары или категории)."""
+    try:
+        cache.incr(AUTOCOMPLETE_VERSION_KEY)
+    except ValueError:
+        cache.set(AUTOCOMPLETE_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def top_search_queries(days: int, limit: int) -> list[str]:
+    """Самые частые нормализованные поисковые запросы за days дней."""
+    since = timezone.now().date() - timedelta(days=days)
+    rows = (
+        AnalyticsEvent.objects.using(get_reporting_db())
+        .filter(event_type=EventType.SEARCH, event_date__gte=since)
+        .exclude(Q(search_query='') | Q(search_query__isnull=True))
+        .values('search_query')
+        .annotate(count=Count('id'))
+        .order_by('-count')[:limit * 3]
+    )
+
+    # Запросы, отличающиеся регистром и пробелами, объединяются
+    totals: dict[str, int] = {}
+    for row in rows:
+        query = normalize_query(row['search_query'])
+        if len(query) >= MIN_QUERY_LENGTH:
+            totals[query] = totals.get(query, 0) + row['count']
+    return sorted(totals, key=totals.get, reverse=True)[:limit]
+
+
+def warm_suggestions(queries: list[str]) -> int:
+    """
+    Положить в кэш подсказки для запросов и всех их префиксов.
+
+    Префиксы — то, что приходит с клавиатуры по мере набора: «бу», «бук», ...
+
+    Returns:
+        Сколько записей кэша заполнено
+    """
+    version = _version()
+    limit = settings.AUTOCOMPLETE_LIMIT
+
+    prefixes = {
+        query[:length]
+        for query in queries
+        for length in range(MIN_QUERY_LENGTH, len(query) + 1)
+    }
+    prefixes = {prefix.rstrip() for prefix in prefixes}
+
+    cache.set_many(
+        {_cache_key(version, prefix, limit): compute_suggestions(prefix, limit) for prefix in prefixes},
+        timeout=settings.AUTOCOMPLETE_CACHE_TTL,
+    )
+    return len(prefixes)
@@ -0,0 +1,81 @@
+"""
+Стартовые данные Mini App одним ответом (GET /api/v1/bootstrap/).
+
+Публичная часть — категории, первая страница каталога и активные
+страницы — одна на всех и кэшируется целиком; кэш сбрасывают сигналы
+товаров, категорий и страниц. Пользовательская часть считается
+на каждый запрос: профиль уже загружен аутентификацией, избранное —
+один запрос, флаги is_favorite первой страницы берутся из него же.
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.core.models import PageContent
+from apps.core.pagination import KeysetPagination
+from apps.products.dao import product_dao
+from apps.products.models import FavoriteAction
+from apps.products.serializers import CategorySerializer
+from apps.products.services.catalog import CATALOG_ORDERING, active_categories, catalog_queryset
+
+BOOTSTRAP_VERSION_KEY = 'products:bootstrap:version'
+BOOTSTRAP_KEY = 'products:bootstrap:v{version}'
+
+
+def build_public_data() -> dict:
+    """
+    Общая для всех часть ответа (без кэша).
+
+    Returns:
+        {'categories': [...], 'products': {'cursor', 'results'}, 'pages': [slug, ...]}
+    """
+    paginator = KeysetPagination()
+    queryset = catalog_queryset().order_by(*CATALOG_ORDERING)
+    ordering = paginator.get_ordering(queryset)
+    page_size = paginator.get_page_size()
+
+    # Первая страница каталога, как у GET /products/ без параметров
+    rows = list(product_dao.list_rows(queryset.order_by(*ordering))[:page_size + 1])
+    cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        cursor = paginator.encode_cursor(rows[-1], ordering)
+
+    return {
+        'categories': [dict(category) for category in CategorySerializer(active_categories(), many=True).data],
+        'products': {
+            'cursor': cursor,
+            'results': [product.to_dict() for product in product_dao.build_list(rows)],
+        },
+        'pages': list(
+            PageContent.objects.filter(is_active=True).order_by('slug').values_list('slug', flat=True)
+        ),
+    }
+
+
+def _version() -> int:
+    return cache.get_or_set(BOOTSTRAP_VERSION_KEY, time.time_ns, timeout=None)
+
+
+def get_public_data() -> dict:
+    """Общая часть ответа из кэша, при промахе — из БД."""
+    key = BOOTSTRAP_KEY.format(version=_version())
+    data = cache.get(key)
+    if data is None:
+        data = build_public_data()
+        cache.set(key, data, timeout=settings.BOOTSTRAP_CACHE_TTL)
+    return data
+
+
+def get_favorite_ids(user) -> list[int]:
+    """id активных товаров в избранном пользователя (один запрос)."""
+    return list(FavoriteAction.get_user_favorites(user).order_by('id').values_list('id', flat=True))
+
+
+def invalidate_bootstrap() -> None:
+    """Сбросить кэш общей части (изменились товары, категории или страницы)."""
+    try:
+        cache.incr(BOOTSTRAP_VERSION_KEY)
+    except ValueError:
+        cache.set(BOOTSTRAP_VERSION_KEY, time.time_ns(), timeout=None)
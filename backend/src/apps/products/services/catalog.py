@@ -0,0 +1,64 @@
+"""
+Общие выборки каталога.
+
+Используются вьюхами товаров и категорий, а также сборными ответами
+(bootstrap), которым нужны те же данные без вьюх.
+"""
+from django.db import models
+from django.db.models import Count, Prefetch
+
+from apps.products.models import Category, FavoriteAction, Product, ProductImage
+
+# Сортировка каталога по умолчанию
+CATALOG_ORDERING = ['sort_order', '-created_at']
+
+
+def catalog_queryset():
+    """Активные товары с категорией и фото (главное фото первым)."""
+    return (
+        Product.objects
+        .filter(is_active=True)
+        .select_related('category')
+        .prefetch_related(
+            Prefetch(
+                'images',
+                queryset=ProductImage.objects.order_by('-is_main', 'sort_order')
+            )
+        )
+    )
+
+
+def active_categories():
+    """Активные категории с количеством активных товаров."""
+    return (
+        Category.objects
+        .filter(is_active=True)
+        .annotate(
+            products_count=Count(
+                'products',
+                filter=models.Q(products__is_active=True)
+            )
+        )
+        .order_by('sort_order', 'title')
+    )
+
+
+def mark_favorites(user, items: list[dict], favorites: set[int] | None = None) -> list[dict]:
+    """
+    Добавить is_favorite товарам страницы (ответам to_dict()).
+
+    Избранное загружается одним запросом на страницу; анонимам поля
+    нет и запроса тоже.
+
+    Args:
+        user: Пользователь запроса
+        items: Товары (dict с id)
+        favorites: id избранных товаров, если уже загружены (async-вьюхи, bootstrap)
+    """
+    if not user.is_authenticated:
+        return items
+    if favorites is None:
+        favorites = FavoriteAction.get_favorite_ids(user, [item['id'] for item in items]) if items else set()
+    for item in items:
+        item['is_favorite'] = item['id'] in favorites
+    return items
@@ -0,0 +1,125 @@
+"""
+Дельта-синхронизация каталога: что изменилось с версии N.
+
+Версия каталога — граница видимости транзакций PostgreSQL
+(pg_snapshot_xmin): все транзакции с номером меньше неё завершены.
+Граница только растёт, поэтому окно [since, version) журнала
+CatalogChange отдаётся каждому изменению ровно один раз — даже если
+транзакции коммитятся не в том порядке, в каком начинались.
+
+Клиент сохраняет version из ответа и в следующий раз передаёт её как
+since. Если история уже очищена или изменений слишком много, ответ
+содержит reset=true — каталог нужно загрузить целиком (снимок или
+GET /products/).
+"""
+from datetime import timedelta
+
+from django.db import connections, router
+from django.utils import timezone
+
+from apps.products.dao import product_dao
+from apps.products.models import CatalogChange, CatalogChangeKind
+from apps.products.serializers import CategorySerializer
+from apps.products.services.catalog import active_categories
+
+# Больше изменённых объектов — дешевле перезагрузить каталог целиком
+MAX_CHANGES = 500
+
+
+def current_version() -> int:
+    """Текущая версия каталога (граница завершённых транзакций)."""
+    db = router.db_for_read(CatalogChange)
+    with connections[db].cursor() as cursor:
+        cursor.execute('SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint')
+        return cursor.fetchone()[0]
+
+
+def record_change(kind: str, object_id: int) -> None:
+    """Записать изменение объекта каталога (в транзакции изменения)."""
+    CatalogChange.objects.create(kind=kind, object_id=object_id)
+
+
+def _empty(version: int, reset: bool) -> dict:
+    return {
+        'version': version,
+        'reset': reset,
+        'products': [],
+        'categories': [],
+        'removed': {'products': [], 'categories': []},
+    }
+
+
+def get_changes(since: int | None) -> dict:
+    """
+    Изменения каталога с версии since.
+
+    Returns:
+        {
+            'version': новая версия для следующего запроса,
+            'reset': каталог нужно загрузить целиком,
+            'products': изменённые активные товары (формат списка каталога),
+            'categories': изменённые активные категории,
+            'removed': {'products': [id], 'categories': [id]} — удалённые или скрытые,
+        }
+    """
+    version = current_version()
+    if since is None or since > version:
+        return _empty(version, reset=True)
+
+    # История до самой старой записи могла быть очищена (prune_changes)
+    oldest = CatalogChange.objects.order_by('txid').values_list('txid', flat=True).first()
+    if oldest is not None and since < oldest:
+        return _empty(version, reset=True)
+
+    changed = list(
+        CatalogChange.objects
+        .filter(txid__gte=since, txid__lt=version)
+        .order_by()
+        .values_list('kind', 'object_id')
+        .distinct()[:MAX_CHANGES + 1]
+    )
+    if len(changed) > MAX_CHANGES:
+        return _empty(version, reset=True)
+
+    product_ids = [pk for kind, pk in changed if kind == CatalogChangeKind.PRODUCT]
+    category_ids = [pk for kind, pk in changed if kind == CatalogChangeKind.CATEGORY]
+    result = _empty(version, reset=False)
+
+    if product_ids:
+        rows = product_dao.rows_by_ids(product_ids)
+        active = [row for row in rows if row['is_active']]
+        active_ids = {row['id'] for row in active}
+        result['products'] = [product.to_dict() for product in product_dao.build_list(active)]
+        result['removed']['products'] = sorted(set(product_ids) - active_ids)
+
+    if category_ids:
+        categories = CategorySerializer(active_categories().filter(id__in=category_ids), many=True).data
+        result['categories'] = [dict(category) for category in categories]
+        result['removed']['categories'] = sorted(set(category_ids) - {category['id'] for category in categories})
+
+    return result
+
+
+def prune_changes(days: int) -> int:
+    """
+    Удалить записи журнала старше days дней.
+
+    Удаление идёт по границе txid, чтобы проверка reset в get_changes()
+    (since < самой старой записи) оставалась верной. Записи последней
+    транзакции сохраняются всегда.
+
+    Returns:
+        Сколько записей удалено
+    """
+    cutoff = timezone.now() - timedelta(days=days)
+    recent = CatalogChange.objects.filter(created_at__gte=cutoff).order_by('txid').values_list('txid', flat=True)
+    newest = CatalogChange.objects.order_by('-txid').values_list('txid', flat=True)
+
+    horizon = recent.first()
+    if horizon is None:
+        horizon = newest.first()
+    if horizon is None:
+        return 0
+
+    deleted, _ = CatalogChange.objects.filter(txid__lt=horizon).delete()
+    return deleted
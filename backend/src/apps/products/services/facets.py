@@ -0,0 +1,119 @@
+"""
+Фасеты каталога: количество по категориям, диапазон цен, «в наличии».
+
+Все фасеты считаются одним запросом — группировкой по категории
+с условной агрегацией (COUNT/MIN/MAX ... FILTER (WHERE ...)). Каждый
+фасет учитывает все фильтры, кроме своего: количество по категориям —
+без фильтра категории, диапазон цен — без min_price/max_price, «в наличии» —
+без in_stock. Так в интерфейсе видно, что изменится при смене фильтра.
+
+Ответы кэшируются по набору фильтров; изменение товаров и категорий
+сбрасывает кэш (сигналы apps.products.signals).
+"""
+import hashlib
+import json
+import time
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max, Min, Q, QuerySet
+
+from apps.products.filters import IN_STOCK
+
+FACETS_VERSION_KEY = 'products:facets:version'
+FACETS_KEY = 'products:facets:v{version}:{digest}'
+
+PRICE_FILTERS = ('min_price', 'max_price')
+
+
+def _where(conditions: dict[str, Q], *exclude: str) -> Q | None:
+    """Условия всех фильтров, кроме exclude (None — без условий)."""
+    return Q(*[condition for name, condition in conditions.items() if name not in exclude]) or None
+
+
+def compute_facets(queryset: QuerySet, conditions: dict[str, Q]) -> dict:
+    """
+    Фасеты товаров queryset (без кэша).
+
+    Args:
+        queryset: Товары до фильтров (активные, после поиска)
+        conditions: Фильтры {имя: Q} — ProductFilter.get_conditions()
+    """
+    in_stock = _where(conditions, 'in_stock')
+    rows = (
+        queryset
+        .order_by()
+        .values('category_id', 'category__title', 'category__slug', 'category__sort_order', 'category__is_active')
+        .annotate(
+            count=Count('id', filter=_where(conditions, 'category')),
+            matched=Count('id', filter=_where(conditions)),
+            in_stock=Count('id', filter=in_stock & IN_STOCK if in_stock else IN_STOCK),
+            min_price=Min('price', filter=_where(conditions, *PRICE_FILTERS)),
+            max_price=Max('price', filter=_where(conditions, *PRICE_FILTERS)),
+        )
+    )
+
+    rows = list(rows)
+    prices = [row['min_price'] for row in rows if row['min_price'] is not None]
+    max_prices = [row['max_price'] for row in rows if row['max_price'] is not None]
+    categories = sorted(
+        (row for row in rows if row['category__is_active']),
+        key=lambda row: (row['category__sort_order'], row['category__title']),
+    )
+
+    return {
+        'total': sum(row['matched'] for row in rows),
+        'in_stock': sum(row['in_stock'] for row in rows),
+        'min_price': min(prices, default=None),
+        'max_price': max(max_prices, default=None),
+        'categories': [
+            {
+                'id': row['category_id'],
+                'title': row['category__title'],
+                'slug': row['category__slug'],
+                'count': row['count'],
+            }
+            for row in categories
+        ],
+    }
+
+
+def _version() -> int:
+    return cache.get_or_set(FACETS_VERSION_KEY, time.time_ns, timeout=None)
+
+
+def facets_cache_key(params: dict) -> str:
+    """Ключ кэша по значениям фильтров (порядок и пустые значения не важны)."""
+    items = sorted(
+        (name, str(value.normalize() if isinstance(value, Decimal) else value))
+        for name, value in params.items()
+        if value not in (None, '', [])
+    )
+    digest = hashlib.md5(json.dumps(items, ensure_ascii=False).encode()).hexdigest()
+    return FACETS_KEY.format(version=_version(), digest=digest)
+
+
+def get_facets(queryset: QuerySet, conditions: dict[str, Q], params: dict) -> dict:
+    """
+    Фасеты из кэша, при промахе — из БД.
+
+    Args:
+        queryset: Товары до фильтров (см. compute_facets())
+        conditions: Фильтры {имя: Q}
+        params: Значения фильтров и поиска — ключ кэша
+    """
+    key = facets_cache_key(params)
+    facets = cache.get(key)
+    if facets is None:
+        facets = compute_facets(queryset, conditions)
+        cache.set(key, facets, timeout=settings.FACETS_CACHE_TTL)
+    return facets
+
+
+def invalidate_facets() -> None:
+    """Сбросить кэш фасетов (изменились товары или категории)."""
+    try:
+        cache.incr(FACETS_VERSION_KEY)
+    except ValueError:
+        cache.set(FACETS_VERSION_KEY, time.time_ns(), timeout=None)
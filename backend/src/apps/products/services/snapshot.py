@@ -0,0 +1,183 @@
+"""
+Статический снимок каталога в хранилище (STORAGES['default']).
+
+Весь активный каталог — категории и товары с URL главных фото —
+собирается в JSON, сжимается gzip и публикуется как новый файл
+catalog/snapshots/catalog-<version>.json.gz (файловая система или S3).
+Клиенты узнают URL и версию через GET /products/snapshot/ и дальше
+читают каталог из хранилища/CDN, не обращаясь к Django.
+
+URL файлов (снимка и фото внутри него) строятся от постоянного
+CATALOG_SNAPSHOT_MEDIA_URL, а не storage.url(): presigned URL S3 истекают,
+а фото с новой подписью меняли бы хэш содержимого при каждой сборке.
+В текущем снимке хранится имя файла, URL вычисляется при чтении.
+
+Изменения товаров, фото и категорий планируют пересборку с задержкой
+(debounce): серия правок в админке даёт одну публикацию. Снимок
+с тем же содержимым повторно не публикуется.
+"""
+import contextlib
+import gzip
+import hashlib
+import logging
+import time
+
+import orjson
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+from django.utils.encoding import filepath_to_uri
+
+from apps.products.dao import product_dao
+from apps.products.serializers import CategorySerializer
+from apps.products.services.catalog import CATALOG_ORDERING, active_categories, catalog_queryset
+from apps.products.services.changes import current_version
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = 'catalog/snapshots'
+SNAPSHOT_NAME = SNAPSHOT_DIR + '/catalog-{version}.json.gz'
+# Текущий снимок: в кэше и (на случай очистки кэша) файлом в хранилище
+SNAPSHOT_CURRENT_KEY = 'products:snapshot:current'
+SNAPSHOT_CURRENT_NAME = SNAPSHOT_DIR + '/current.json'
+SNAPSHOT_SCHEDULED_KEY = 'products:snapshot:scheduled'
+
+
+def public_url(name: str) -> str:
+    """Постоянный URL файла хранилища ('' если файла нет)."""
+    if not name:
+        return ''
+    if settings.CATALOG_SNAPSHOT_MEDIA_URL:
+        return settings.CATALOG_SNAPSHOT_MEDIA_URL + filepath_to_uri(name)
+    return default_storage.url(name)
+
+
+def build_catalog() -> dict:
+    """Активный каталог в формате API: категории и товары (как в списке каталога)."""
+    rows = list(product_dao.list_rows(catalog_queryset().order_by(*CATALOG_ORDERING, 'id')))
+    return {
+        'categories': [dict(category) for category in CategorySerializer(active_categories(), many=True).data],
+        'products': [product.to_dict() for product in product_dao.build_list(rows, image_url=public_url)],
+    }
+
+
+def get_current_snapshot() -> dict | None:
+    """
+    Опубликованный снимок: {version, changes_version, name, url, hash, built_at, products_count, size, files}.
+
+    None, если снимок ещё не публиковался.
+    """
+    current = cache.get(SNAPSHOT_CURRENT_KEY)
+    if current is None:
+        try:
+            with default_storage.open(SNAPSHOT_CURRENT_NAME) as file:
+                current = orjson.loads(file.read())
+        except (FileNotFoundError, OSError):
+            return None
+        cache.set(SNAPSHOT_CURRENT_KEY, current, timeout=None)
+    return {**current, 'url': public_url(current['name'])}
+
+
+def _json_file(content: bytes) -> ContentFile:
+    """
+    Файл с Content-Type: application/json.
+
+    Content-Encoding: gzip для .json.gz S3Storage берёт из расширения
+    (mimetypes.guess_type), поэтому браузер и CDN распакуют снимок сами.
+    """
+    file = ContentFile(content)
+    file.content_type = 'application/json'
+    return file
+
+
+def publish_snapshot(force: bool = False) -> dict:
+    """
+    Собрать каталог и опубликовать новую версию снимка.
+
+    Args:
+        force: Публиковать, даже если содержимое не изменилось
+
+    Returns:
+        Текущий снимок (новый или прежний) и published: опубликован ли новый
+    """
+    # Версия журнала берётся до сборки: изменения во время сборки
+    # клиент получит повторно через /products/changes/, но не потеряет
+    changes_version = current_version()
+    catalog = build_catalog()
+    body = orjson.dumps(catalog)
+    content_hash = hashlib.sha256(body).hexdigest()
+
+    current = get_current_snapshot()
+    if current and current['hash'] == content_hash and not force:
+        return {**current, 'published': False}
+
+    # Версия монотонна: время сборки в мс, но не меньше предыдущей + 1
+    version = max(time.time_ns() // 1_000_000, current['version'] + 1 if current else 0)
+    built_at = timezone.now().isoformat()
+    payload = gzip.compress(
+        orjson.dumps({'version': version, 'changes_version': changes_version, 'built_at': built_at, **catalog}),
+        compresslevel=9,
+    )
+
+    name = default_storage.save(SNAPSHOT_NAME.format(version=version), _json_file(payload))
+    files = [name, *(current['files'] if current else [])]
+    snapshot = {
+        'version': version,
+        'changes_version': changes_version,
+        'name': name,
+        'hash': content_hash,
+        'built_at': built_at,
+        'products_count': len(catalog['products']),
+        'size': len(payload),
+        'files': files[:settings.CATALOG_SNAPSHOT_KEEP],
+    }
+
+    if default_storage.exists(SNAPSHOT_CURRENT_NAME):
+        default_storage.delete(SNAPSHOT_CURRENT_NAME)
+    default_storage.save(SNAPSHOT_CURRENT_NAME, _json_file(orjson.dumps(snapshot)))
+    cache.set(SNAPSHOT_CURRENT_KEY, snapshot, timeout=None)
+
+    # Старые версии удаляются не сразу: клиенты могли получить их URL только что
+    for old in files[settings.CATALOG_SNAPSHOT_KEEP:]:
+        default_storage.delete(old)
+
+    logger.info(
+        "Catalog snapshot published: version=%s products=%d size=%d",
+        version, snapshot['products_count'], snapshot['size'],
+    )
+    return {**snapshot, 'url': public_url(name), 'published': True}
+
+
+def schedule_snapshot() -> None:
+    """
+    Запланировать пересборку снимка через CATALOG_SNAPSHOT_DEBOUNCE секунд.
+
+    Пока пересборка запланирована, новые вызовы ничего не делают.
+    Задача ставится после коммита транзакции, чтобы собрать уже
+    сохранённые изменения (при откате — не ставится).
+    """
+    delay = settings.CATALOG_SNAPSHOT_DEBOUNCE
+
+    def enqueue():
+        from apps.products.tasks import publish_catalog_snapshot
+
+        # Выполняется после коммита: ошибки кэша/брокера не должны ронять запрос,
+        # снимок всё равно пересоберётся по расписанию
+        try:
+            if not cache.add(SNAPSHOT_SCHEDULED_KEY, 1, timeout=delay * 2 + 60):
+                return
+            publish_catalog_snapshot.apply_async(countdown=delay)
+        except Exception as e:
+            logger.warning("Failed to schedule catalog snapshot: %s", e)
+            with contextlib.suppress(Exception):
+                cache.delete(SNAPSHOT_SCHEDULED_KEY)
+
+    transaction.on_commit(enqueue)
+
+
+def clear_schedule() -> None:
+    """Снять отметку о запланированной пересборке (в начале задачи)."""
+    cache.delete(SNAPSHOT_SCHEDULED_KEY)
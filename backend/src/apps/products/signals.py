@@ -0,0 +1,91 @@
+"""
+Django signals of the products app.
+"""
+import logging
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.core.models import PageContent
+from apps.products.models import CatalogChangeKind, Category, Product, ProductImage
+from apps.products.services import (
+    invalidate_bootstrap,
+    invalidate_facets,
+    invalidate_suggestions,
+    record_change,
+    schedule_snapshot,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Списание остатка при оформлении заказа (product.save(update_fields=['qty_available']))
+STOCK_FIELDS = frozenset({'qty_available'})
+
+
+def invalidate_after_commit(*invalidators) -> None:
+    """
+    Сбросить кэши после коммита транзакции.
+
+    Раньше коммита другой процесс успел бы заполнить новую версию кэша
+    ещё не закоммиченными (старыми) данными. Недоступный кэш не должен
+    мешать сохранению: ответы устареют до TTL.
+    """
+    def run():
+        for invalidate in invalidators:
+            try:
+                invalidate()
+            except Exception:
+                logger.warning("Catalog cache invalidation failed: %s", invalidate.__name__, exc_info=True)
+
+    transaction.on_commit(run)
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_catalog_caches(sender, update_fields=None, **kwargs):
+    """Товары и категории влияют на подсказки, фасеты, bootstrap и снимок каталога."""
+    invalidators = [invalidate_facets, invalidate_bootstrap, schedule_snapshot]
+    # Остаток на подсказки не влияет: оформление заказа не сбрасывает их кэш
+    if not (update_fields and update_fields <= STOCK_FIELDS):
+        invalidators.insert(0, invalidate_suggestions)
+    invalidate_after_commit(*invalidators)
+
+
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+def invalidate_catalog_images(sender, **kwargs):
+    """Главное фото — часть первой страницы каталога в bootstrap и снимка каталога."""
+    invalidate_after_commit(invalidate_bootstrap, schedule_snapshot)
+
+
+@receiver(post_save, sender=PageContent)
+@receiver(post_delete, sender=PageContent)
+def invalidate_pages_cache(sender, **kwargs):
+    """Список активных страниц входит в bootstrap."""
+    invalidate_after_commit(invalidate_bootstrap)
+
+
+# === Журнал изменений (дельта-синхронизация) ===
+# Пишется в той же транзакции, что и изменение, поэтому ошибки не глушатся
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def log_product_change(sender, instance, **kwargs):
+    record_change(CatalogChangeKind.PRODUCT, instance.pk)
+
+
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+def log_product_image_change(sender, instance, **kwargs):
+    # Фото входят в товар (main_image)
+    record_change(CatalogChangeKind.PRODUCT, instance.product_id)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def log_category_change(sender, instance, **kwargs):
+    record_change(CatalogChangeKind.CATEGORY, instance.pk)
@@ -1,6 +1,11 @@
 """Products tasks."""
-from apps.products.tasks.cleanup import cleanup_old_favorite_actions
+from apps.products.tasks.autocomplete import warm_autocomplete_cache
+from apps.products.tasks.cleanup import cleanup_old_favorite_actions, prune_catalog_changes
+from apps.products.tasks.snapshot import publish_catalog_snapshot
 
 __all__ = [
     'cleanup_old_favorite_actions',
+    'prune_catalog_changes',
+    'publish_catalog_snapshot',
+    'warm_autocomplete_cache',
 ]
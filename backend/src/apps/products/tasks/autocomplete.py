@@ -0,0 +1,31 @@
+"""Autocomplete cache tasks."""
+import logging
+
+from celery import shared_task
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name='products.warm_autocomplete_cache')
+def warm_autocomplete_cache(days: int | None = None, top: int | None = None) -> dict:
+    """
+    Прогревает кэш автодополнения популярными запросами.
+
+    Args:
+        days: За сколько дней брать поисковые запросы из аналитики
+        top: Сколько самых частых запросов прогревать (с префиксами)
+
+    Returns:
+        Словарь с числом запросов и заполненных записей кэша
+    """
+    from apps.products.services import top_search_queries, warm_suggestions
+
+    queries = top_search_queries(
+        days=days or settings.AUTOCOMPLETE_WARM_DAYS,
+        limit=top or settings.AUTOCOMPLETE_WARM_QUERIES,
+    )
+    warmed = warm_suggestions(queries)
+
+    logger.info("Autocomplete cache warmed: queries=%d entries=%d", len(queries), warmed)
+    return {'queries': len(queries), 'entries': warmed}
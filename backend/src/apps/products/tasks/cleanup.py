@@ -41,3 +41,31 @@ def cleanup_old_favorite_actions(self, days: int = 90) -> dict:
         'cutoff_date': cutoff_date.isoformat(),
         'days': days,
     }
+
+
+@shared_task(
+    name='products.prune_catalog_changes',
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_kwargs={'max_retries': 3},
+)
+def prune_catalog_changes(self, days: int = 30) -> dict:
+    """
+    Удаляет старые записи журнала изменений каталога.
+
+    Клиенты с версией старше оставшейся истории получат reset
+    и загрузят каталог целиком.
+
+    Args:
+        days: Сколько дней истории хранить (по умолчанию 30)
+
+    Returns:
+        Словарь с количеством удалённых записей
+    """
+    from apps.products.services import prune_changes
+
+    deleted_count = prune_changes(days)
+
+    logger.info("Catalog changes pruned: deleted=%d days=%d", deleted_count, days)
+    return {'deleted_count': deleted_count, 'days': days}
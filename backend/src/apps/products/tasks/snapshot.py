@@ -0,0 +1,34 @@
+"""Catalog snapshot tasks."""
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    name='products.publish_catalog_snapshot',
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_kwargs={'max_retries': 3},
+)
+def publish_catalog_snapshot(self, force: bool = False) -> dict:
+    """
+    Публикует снимок каталога в хранилище, если каталог изменился.
+
+    Ставится сигналами изменений каталога (с задержкой) и периодически
+    по расписанию — на случай изменений в обход сигналов (update()).
+
+    Args:
+        force: Публиковать, даже если содержимое не изменилось
+
+    Returns:
+        Версия и URL текущего снимка, published — опубликован ли новый
+    """
+    from apps.products.services.snapshot import clear_schedule, publish_snapshot
+
+    # Изменения во время сборки запланируют следующую пересборку
+    clear_schedule()
+    snapshot = publish_snapshot(force=force)
+    return {key: snapshot[key] for key in ('version', 'url', 'published')}
@@ -0,0 +1,87 @@
+"""
+Tests for async catalog views (ASGI mode).
+
+Responses must match the DRF views they replace.
+"""
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+
+from apps.core.models import PageContent
+from apps.core.views import PageContentAsyncView
+from apps.products.models import Category, Product
+from apps.products.views import CategoryListAsyncView, ProductListAsyncView
+
+
+def call_async_view(view_class, path, **kwargs):
+    request = RequestFactory().get(path)
+    response = async_to_sync(view_class.as_view())(request, **kwargs)
+    return response.status_code, json.loads(response.content)
+
+
+@pytest.fixture
+def catalog(db):
+    roses = Category.objects.create(title='Розы', slug='roses')
+    tulips = Category.objects.create(title='Тюльпаны', slug='tulips', sort_order=1)
+    for n in range(25):
+        Product.objects.create(
+            title=f'Букет {n}',
+            slug=f'bouquet-{n}',
+            category=roses if n % 2 else tulips,
+            price=(n + 1) * 10000,
+            qty_available=n % 3,
+        )
+    return roses, tulips
+
+
+@pytest.mark.django_db
+class TestAsyncCatalogViews:
+    """Async views return the same payloads as DRF views."""
+
+    @pytest.mark.parametrize('query', [
+        '',
+        '?category=roses&in_stock=true',
+        '?ordering=-price&min_price=50000',
+        '?search=Букет 1',
+    ])
+    def test_product_list_matches_drf(self, catalog, query):
+        path = f'/api/v1/products/{query}'
+        expected = APIClient().get(path)
+
+        status, data = call_async_view(ProductListAsyncView, path)
+
+        assert status == expected.status_code == 200
+        assert data == expected.json()
+
+    def test_product_list_next_pages_match_drf(self, catalog):
+        path = '/api/v1/products/?ordering=price'
+        while path:
+            expected = APIClient().get(path).json()
+            status, data = call_async_view(ProductListAsyncView, path)
+            assert (status, data) == (200, expected)
+            path = data['next']
+
+    def test_product_list_invalid_cursor(self, catalog):
+        status, _ = call_async_view(ProductListAsyncView, '/api/v1/products/?cursor=broken')
+        assert status == 404
+
+    def test_categories_match_drf(self, catalog):
+        expected = APIClient().get('/api/v1/products/categories/')
+
+        status, data = call_async_view(CategoryListAsyncView, '/api/v1/products/categories/')
+
+        assert status == 200
+        assert data == expected.json()
+
+    def test_page_content(self, db):
+        PageContent.objects.create(slug='about', title='О нас', content='<p>Текст</p>')
+        expected = APIClient().get('/api/v1/pages/about/')
+
+        status, data = call_async_view(PageContentAsyncView, '/api/v1/pages/about/', slug='about')
+        assert (status, data) == (200, expected.json())
+
+        status, _ = call_async_view(PageContentAsyncView, '/api/v1/pages/delivery/', slug='delivery')
+        assert status == 404
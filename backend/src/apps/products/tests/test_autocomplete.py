@@ -0,0 +1,110 @@
+"""
+Tests for trigram autocomplete.
+"""
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.analytics.models import AnalyticsEvent, EventType
+from apps.products.models import Category, Product
+from apps.products.services import get_suggestions
+from apps.products.services.autocomplete import AUTOCOMPLETE_VERSION_KEY
+from apps.products.tasks import warm_autocomplete_cache
+
+
+@pytest.fixture
+def catalog(db):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT similarity('Розы', 'розы') = 1")
+        if not cursor.fetchone()[0]:
+            pytest.skip('database locale does not fold Cyrillic case')
+
+    roses = Category.objects.create(title='Розы', slug='roses')
+    tulips = Category.objects.create(title='Тюльпаны', slug='tulips')
+    for n, (title, category) in enumerate([
+        ('Розы красные', roses),
+        ('Букет из 25 роз', roses),
+        ('Белые тюльпаны', tulips),
+        ('Хризантемы', tulips),
+    ]):
+        Product.objects.create(title=title, slug=f'p-{n}', category=category, price=100000)
+    return roses, tulips
+
+
+def titles(items):
+    return [item['title'] for item in items]
+
+
+@pytest.mark.django_db
+class TestAutocomplete:
+    """Typo-tolerant suggestions, cached by normalized query."""
+
+    def test_typo_and_prefix(self, catalog):
+        result = get_suggestions('  РОЗВ ')
+        assert result['query'] == 'розв'
+        assert titles(result['products'])[0] == 'Розы красные'
+        assert titles(result['categories']) == ['Розы']
+
+        assert titles(get_suggestions('тюльп')['products']) == ['Белые тюльпаны']
+        assert titles(get_suggestions('хризантнмы')['products']) == ['Хризантемы']
+
+    def test_short_query(self, catalog):
+        with CaptureQueriesContext(connection) as ctx:
+            assert get_suggestions('р') == {'query': 'р', 'products': [], 'categories': []}
+        assert not [q for q in ctx.captured_queries if 'products_' in q['sql']]
+
+    def test_cached_and_invalidated(self, catalog, django_capture_on_commit_callbacks):
+        get_suggestions('хриз')
+        with CaptureQueriesContext(connection) as ctx:
+            assert titles(get_suggestions('Хриз')['products']) == ['Хризантемы']
+        assert len(ctx.captured_queries) == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Product.objects.create(title='Хризантемы кустовые', slug='p-new', category=catalog[1], price=1)
+        assert 'Хризантемы кустовые' in titles(get_suggestions('хриз')['products'])
+
+    def test_warm_from_search_analytics(self, catalog):
+        for query, times in [('Розы', 3), ('розы ', 2), ('тюльпаны', 1), ('', 5)]:
+            for _ in range(times):
+                AnalyticsEvent.objects.create(event_type=EventType.SEARCH, search_query=query)
+
+        assert warm_autocomplete_cache(top=1) == {'queries': 1, 'entries': 3}
+
+        with CaptureQueriesContext(connection) as ctx:
+            for prefix in ('ро', 'роз', 'розы'):
+                assert get_suggestions(prefix)['products']
+        assert len(ctx.captured_queries) == 0
+
+    def test_api(self, catalog):
+        client = APIClient()
+
+        response = client.get('/api/v1/products/autocomplete/', {'q': 'розы', 'limit': 1})
+        assert response.status_code == 200
+        assert [item['slug'] for item in response.json()['products']] == ['p-0']
+
+        response = client.get('/api/v1/products/autocomplete/', {'q': 'розы', 'limit': 100})
+        assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_stock_update_keeps_suggestions(django_capture_on_commit_callbacks):
+    category = Category.objects.create(title='Розы', slug='roses')
+    product = Product.objects.create(
+        title='Розы', slug='p-stock', category=category, price=100000, qty_available=5,
+    )
+    cache.set(AUTOCOMPLETE_VERSION_KEY, 1, timeout=None)
+
+    product.qty_available = 4
+    with django_capture_on_commit_callbacks(execute=True):
+        product.save(update_fields=['qty_available'])
+    assert cache.get(AUTOCOMPLETE_VERSION_KEY) == 1
+
+    product.title = 'Розы красные'
+    product.save(update_fields=['title'])
+    assert cache.get(AUTOCOMPLETE_VERSION_KEY) == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        product.save(update_fields=['title'])
+    assert cache.get(AUTOCOMPLETE_VERSION_KEY) != 1
@@ -0,0 +1,87 @@
+"""
+Tests for the app bootstrap endpoint.
+"""
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.core.models import PageContent
+from apps.products.models import Category, FavoriteAction, Product
+
+User = get_user_model()
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(username='buyer', telegram_id=42, first_name='Анна')
+
+
+@pytest.fixture
+def catalog(db):
+    roses = Category.objects.create(title='Розы', slug='roses')
+    Category.objects.create(title='Архив', slug='archive', is_active=False)
+    products = [
+        Product.objects.create(title=f'Букет {n}', slug=f'bouquet-{n}', category=roses, price=100000, sort_order=n)
+        for n in range(25)
+    ]
+    PageContent.objects.create(slug='about', title='О нас', content='...')
+    PageContent.objects.create(slug='delivery', title='Доставка', content='...', is_active=False)
+    return products
+
+
+def bootstrap(client=None):
+    response = (client or APIClient()).get('/api/v1/bootstrap/')
+    assert response.status_code == 200, response.content
+    return response.json()
+
+
+@pytest.mark.django_db
+class TestBootstrap:
+    """Startup data in one response; public part shared and cached."""
+
+    def test_anonymous(self, catalog):
+        data = bootstrap()
+
+        assert data['user'] is None
+        assert data['tokens'] is None
+        assert data['favorites'] == []
+        assert [category['slug'] for category in data['categories']] == ['roses']
+        assert data['pages'] == ['about']
+        assert len(data['products']['results']) == 20
+        assert 'is_favorite' not in data['products']['results'][0]
+
+        # next ведёт на обычный каталог и отдаёт продолжение
+        response = APIClient().get(data['products']['next'])
+        assert [item['slug'] for item in response.json()['results']] == [f'bouquet-{n}' for n in range(20, 25)]
+
+    def test_user_part(self, user, catalog):
+        FavoriteAction.add_to_favorites(user, catalog[0])
+        FavoriteAction.add_to_favorites(user, catalog[21])
+        client = APIClient()
+        client.force_authenticate(user)
+
+        bootstrap()  # прогрев общей части
+        with CaptureQueriesContext(connection) as ctx:
+            data = bootstrap(client)
+
+        assert data['user']['telegram_id'] == 42
+        assert data['favorites'] == [catalog[0].id, catalog[21].id]
+        flags = [item['is_favorite'] for item in data['products']['results']]
+        assert flags == [True] + [False] * 19
+        # Только избранное: общая часть из кэша
+        assert len(ctx.captured_queries) == 1
+
+    def test_invalidated_on_catalog_change(self, catalog, django_capture_on_commit_callbacks):
+        assert bootstrap()['products']['results'][0]['title'] == 'Букет 0'
+        catalog[0].title = 'Новый букет'
+        with django_capture_on_commit_callbacks(execute=True):
+            catalog[0].save()
+        assert bootstrap()['products']['results'][0]['title'] == 'Новый букет'
+
+        page = PageContent.objects.get(slug='delivery')
+        page.is_active = True
+        with django_capture_on_commit_callbacks(execute=True):
+            page.save()
+        assert bootstrap()['pages'] == ['about', 'delivery']
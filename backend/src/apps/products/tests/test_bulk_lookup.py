@@ -0,0 +1,83 @@
+"""
+Tests for the ?ids= bulk product lookup.
+"""
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.products.filters import MAX_BULK_IDS
+from apps.products.models import Category, Product, ProductImage
+from apps.products.views import ProductListAsyncView
+
+
+@pytest.fixture
+def products(db):
+    category = Category.objects.create(title='Розы', slug='roses')
+    items = [
+        Product.objects.create(
+            title=f'Букет {n}', slug=f'bouquet-{n}', category=category,
+            price=(n + 1) * 10000, qty_available=n % 2,
+        )
+        for n in range(30)
+    ]
+    for product in items[:3]:
+        ProductImage.objects.create(product=product, image=f'products/{product.slug}.jpg', is_main=True)
+    return items
+
+
+def lookup(ids):
+    response = APIClient().get('/api/v1/products/', {'ids': ids})
+    return response.status_code, response.json()
+
+
+@pytest.mark.django_db
+class TestBulkLookup:
+    """Many products by id in one round trip, in the requested order."""
+
+    def test_order_and_shape(self, products):
+        ids = [products[5].id, products[0].id, products[29].id, products[5].id]
+        status, data = lookup(','.join(map(str, ids)))
+
+        assert status == 200
+        assert data['next'] is None
+        assert [item['id'] for item in data['results']] == ids[:3]
+        first = data['results'][1]
+        assert first['price'] == 10000
+        assert first['is_available'] is False
+        assert first['main_image'].endswith('products/bouquet-0.jpg')
+        assert data['results'][0]['is_available'] is True
+
+    def test_inactive_and_missing(self, products):
+        products[1].is_active = False
+        products[1].save()
+
+        status, data = lookup(f'{products[1].id},999999')
+        assert status == 200
+        assert [(item['id'], item['is_available']) for item in data['results']] == [(products[1].id, False)]
+
+    def test_queries_do_not_grow(self, products):
+        with CaptureQueriesContext(connection) as ctx:
+            status, data = lookup(','.join(str(product.id) for product in products))
+        assert status == 200
+        assert len(data['results']) == 30
+        # Товары + главные фото
+        assert len(ctx.captured_queries) == 2
+
+    @pytest.mark.parametrize('ids', ['1,x', ','.join(map(str, range(1, MAX_BULK_IDS + 2)))])
+    def test_invalid(self, products, ids):
+        status, data = lookup(ids)
+        assert status == 400
+        assert 'ids' in data
+
+    def test_async_view_matches_drf(self, products):
+        ids = f'{products[2].id},{products[1].id}'
+        request = RequestFactory().get('/api/v1/products/', {'ids': ids})
+        response = async_to_sync(ProductListAsyncView.as_view())(request)
+
+        assert response.status_code == 200
+        assert json.loads(response.content) == lookup(ids)[1]
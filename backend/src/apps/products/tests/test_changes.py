@@ -0,0 +1,109 @@
+"""
+Tests for the catalog delta sync API.
+"""
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.products.models import CatalogChange, Category, Product, ProductImage
+from apps.products.services import current_version, prune_changes
+
+# Версии — номера транзакций, поэтому изменения должны реально коммититься
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture(autouse=True)
+def no_broker():
+    # Коммиты здесь настоящие — on_commit ставил бы пересборку снимка в Celery
+    with mock.patch('apps.products.tasks.publish_catalog_snapshot.apply_async'):
+        yield
+
+
+@pytest.fixture
+def catalog():
+    roses = Category.objects.create(title='Розы', slug='roses')
+    return [
+        Product.objects.create(title=f'Букет {n}', slug=f'bouquet-{n}', category=roses, price=100000)
+        for n in range(3)
+    ]
+
+
+def changes(since=None):
+    params = {} if since is None else {'since': since}
+    response = APIClient().get('/api/v1/products/changes/', params)
+    assert response.status_code == 200, response.content
+    return response.json()
+
+
+class TestCatalogChanges:
+    """Changes since a version; each change delivered once."""
+
+    def test_reset_without_since(self, catalog):
+        data = changes()
+        assert data['reset'] is True
+        assert data['products'] == []
+        assert changes(data['version'])['reset'] is False
+
+    def test_updates_and_removals(self, catalog):
+        version = current_version()
+
+        catalog[0].price = 200000
+        catalog[0].save()
+        catalog[1].is_active = False
+        catalog[1].save()
+        deleted_id = catalog[2].id
+        catalog[2].delete()
+        ProductImage.objects.create(product=Product.objects.create(
+            title='Новый', slug='new', category=catalog[0].category, price=100000,
+        ), image='products/a.jpg', is_main=True)
+        hidden = Category.objects.create(title='Архив', slug='archive', is_active=False)
+
+        data = changes(version)
+        assert data['reset'] is False
+        assert {product['slug']: product['price'] for product in data['products']} == {
+            'bouquet-0': 200000,
+            'new': 100000,
+        }
+        assert next(p for p in data['products'] if p['slug'] == 'new')['main_image'].endswith('products/a.jpg')
+        assert data['removed']['products'] == sorted([catalog[1].id, deleted_id])
+        assert data['categories'] == []
+        assert data['removed']['categories'] == [hidden.id]
+
+    def test_windows_do_not_overlap(self, catalog):
+        first = changes(current_version())
+        assert first['products'] == []
+
+        catalog[0].title = 'Изменён'
+        catalog[0].save()
+        second = changes(first['version'])
+        third = changes(second['version'])
+
+        assert [product['title'] for product in second['products']] == ['Изменён']
+        assert third['products'] == []
+        assert second['version'] <= third['version']
+
+    def test_invalid_since(self):
+        response = APIClient().get('/api/v1/products/changes/', {'since': -1})
+        assert response.status_code == 400
+        assert changes(current_version() + 10**6)['reset'] is True
+
+    def test_prune(self, catalog):
+        old_version = current_version()
+        catalog[0].save()
+        CatalogChange.objects.update(created_at=timezone.now() - timedelta(days=40))
+        catalog[1].save()
+        catalog[2].save()
+
+        # Категория и три товара из фикстуры + первое сохранение
+        assert prune_changes(days=30) == 5
+        assert CatalogChange.objects.count() == 2
+        # История до old_version очищена — клиенту нужна полная загрузка
+        assert changes(old_version)['reset'] is True
+
+        # Последняя транзакция сохраняется, даже если она старая
+        CatalogChange.objects.update(created_at=timezone.now() - timedelta(days=40))
+        assert prune_changes(days=30) == 1
+        assert CatalogChange.objects.count() == 1
@@ -0,0 +1,87 @@
+"""
+Tests for catalog facets.
+"""
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.products.models import Category, Product
+
+
+@pytest.fixture
+def catalog(db):
+    roses = Category.objects.create(title='Розы', slug='roses', sort_order=1)
+    tulips = Category.objects.create(title='Тюльпаны', slug='tulips', sort_order=2)
+    hidden = Category.objects.create(title='Архив', slug='archive', is_active=False)
+
+    def create(slug, category, price, qty=0, **kwargs):
+        return Product.objects.create(
+            slug=slug, title=slug, category=category, price=price, qty_available=qty, **kwargs,
+        )
+
+    create('roses-1', roses, 100000, qty=3)
+    create('roses-2', roses, 250000)
+    create('roses-3', roses, 400000, is_unlimited=True)
+    create('tulips-1', tulips, 150000, qty=1)
+    create('tulips-2', tulips, 500000, is_active=False)
+    create('archive-1', hidden, 90000, qty=1)
+    return roses, tulips
+
+
+def facets(**params):
+    response = APIClient().get('/api/v1/products/facets/', params)
+    assert response.status_code == 200, response.content
+    return response.json()
+
+
+def counts(data):
+    return {category['slug']: category['count'] for category in data['categories']}
+
+
+@pytest.mark.django_db
+class TestFacets:
+    """All facets in one query; each facet ignores its own filter."""
+
+    def test_no_filters(self, catalog):
+        data = facets()
+        assert data['total'] == 5
+        assert data['in_stock'] == 4
+        assert (data['min_price'], data['max_price']) == (90000, 400000)
+        assert counts(data) == {'roses': 3, 'tulips': 1}
+        assert [category['slug'] for category in data['categories']] == ['roses', 'tulips']
+
+    def test_each_facet_ignores_own_filter(self, catalog):
+        data = facets(category='roses', min_price=200000, in_stock='true')
+        # roses-3: в категории, дороже 2000 ₽ и под заказ
+        assert data['total'] == 1
+        # Категории — без фильтра категории: tulips-1 дешевле 2000 ₽
+        assert counts(data) == {'roses': 1, 'tulips': 0}
+        # Цены — без фильтра цены: розы в наличии
+        assert (data['min_price'], data['max_price']) == (100000, 400000)
+        # «В наличии» — без фильтра in_stock
+        assert data['in_stock'] == 1
+
+    def test_single_query_and_cache(self, catalog):
+        with CaptureQueriesContext(connection) as ctx:
+            facets(category='tulips')
+        assert len(ctx.captured_queries) == 1
+
+        with CaptureQueriesContext(connection) as ctx:
+            assert facets(category='tulips')['total'] == 1
+        assert len(ctx.captured_queries) == 0
+
+    def test_invalidated_on_change(self, catalog, django_capture_on_commit_callbacks):
+        assert facets(category='tulips')['total'] == 1
+        product = Product.objects.get(slug='tulips-2')
+        product.is_active = True
+        product.save()
+        assert facets(category='tulips')['total'] == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            product.save()
+        assert facets(category='tulips')['total'] == 2
+
+    def test_invalid_filter(self, catalog):
+        response = APIClient().get('/api/v1/products/facets/', {'min_price': 'abc'})
+        assert response.status_code == 400
@@ -0,0 +1,86 @@
+"""
+Tests for is_favorite flags inlined into catalog responses.
+"""
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.products.models import Category, FavoriteAction, Product
+from apps.products.views import ProductListAsyncView
+
+User = get_user_model()
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(username='buyer', telegram_id=42)
+
+
+@pytest.fixture
+def products(user):
+    category = Category.objects.create(title='Розы', slug='roses')
+    items = [
+        Product.objects.create(title=f'Букет {n}', slug=f'bouquet-{n}', category=category, price=100000, sort_order=n)
+        for n in range(4)
+    ]
+    FavoriteAction.add_to_favorites(user, items[0])
+    FavoriteAction.add_to_favorites(user, items[1])
+    FavoriteAction.remove_from_favorites(user, items[1])
+    FavoriteAction.add_to_favorites(user, items[2])
+    # Чужое избранное не влияет
+    other = User.objects.create_user(username='other', telegram_id=43)
+    FavoriteAction.add_to_favorites(other, items[3])
+    return items
+
+
+def flags(results):
+    return {item['slug']: item.get('is_favorite') for item in results}
+
+
+@pytest.mark.django_db
+class TestFavoriteFlags:
+    """One favorites lookup per page for users, nothing for anonymous."""
+
+    expected = {'bouquet-0': True, 'bouquet-1': False, 'bouquet-2': True, 'bouquet-3': False}
+
+    def test_list_for_user(self, user, products):
+        client = APIClient()
+        client.force_authenticate(user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get('/api/v1/products/')
+        assert flags(response.json()['results']) == self.expected
+        assert len([q for q in ctx.captured_queries if 'products_favoriteaction' in q['sql']]) == 1
+
+    def test_anonymous_skipped(self, products):
+        with CaptureQueriesContext(connection) as ctx:
+            response = APIClient().get('/api/v1/products/')
+        assert all('is_favorite' not in item for item in response.json()['results'])
+        assert not [q for q in ctx.captured_queries if 'products_favoriteaction' in q['sql']]
+
+    def test_retrieve_and_bulk(self, user, products):
+        client = APIClient()
+        client.force_authenticate(user)
+
+        assert client.get('/api/v1/products/bouquet-2/').json()['is_favorite'] is True
+        assert client.get('/api/v1/products/bouquet-1/').json()['is_favorite'] is False
+
+        response = client.get('/api/v1/products/', {'ids': f'{products[1].id},{products[0].id}'})
+        assert flags(response.json()['results']) == {'bouquet-1': False, 'bouquet-0': True}
+
+    def test_async_view_matches_drf(self, user, products):
+        token = str(AccessToken.for_user(user))
+        request = RequestFactory().get('/api/v1/products/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        response = async_to_sync(ProductListAsyncView.as_view())(request)
+        assert flags(json.loads(response.content)['results']) == self.expected
+
+        request = RequestFactory().get('/api/v1/products/', HTTP_AUTHORIZATION='Bearer broken')
+        response = async_to_sync(ProductListAsyncView.as_view())(request)
+        assert response.status_code == 401
@@ -0,0 +1,65 @@
+"""
+Tests for the DTO read path of products.
+
+DTO payloads must match the serializers, which stay as the API schema.
+"""
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.products.dao import product_dao
+from apps.products.models import Category, Product, ProductImage
+from apps.products.serializers import ProductDetailSerializer, ProductListSerializer
+from apps.products.views.product import catalog_queryset
+
+
+@pytest.fixture
+def products(db):
+    category = Category.objects.create(title='Розы', slug='roses')
+    items = [
+        Product.objects.create(
+            title=f'Букет {n}',
+            slug=f'bouquet-{n}',
+            description='Описание',
+            category=category,
+            price=(n + 1) * 123400,
+            old_price=(n + 2) * 123400 if n % 2 else None,
+            qty_available=n % 3,
+            is_unlimited=n == 4,
+            sort_order=n,
+        )
+        for n in range(6)
+    ]
+    # Главное фото не первое по sort_order, у второго товара главного нет
+    ProductImage.objects.create(product=items[0], image='products/a.jpg', sort_order=0)
+    ProductImage.objects.create(product=items[0], image='products/b.jpg', is_main=True, sort_order=1)
+    ProductImage.objects.create(product=items[1], image='products/c.jpg', alt_text='Фото', sort_order=2)
+    ProductImage.objects.create(product=items[1], image='products/d.jpg', sort_order=1)
+    return items
+
+
+@pytest.mark.django_db
+class TestProductDAO:
+    """DTO output equals serializer output."""
+
+    def test_list_matches_serializer(self, products):
+        queryset = catalog_queryset().order_by('sort_order')
+        expected = ProductListSerializer(queryset, many=True).data
+
+        rows = list(product_dao.list_rows(queryset))
+        with CaptureQueriesContext(connection) as ctx:
+            data = [product.to_dict() for product in product_dao.build_list(rows)]
+
+        assert data == [dict(item) for item in expected]
+        assert len(ctx.captured_queries) == 1
+
+    def test_detail_matches_serializer(self, products):
+        for product in products[:3]:
+            expected = ProductDetailSerializer(catalog_queryset().get(pk=product.pk)).data
+            dto = product_dao.get_detail(catalog_queryset(), product.slug)
+            assert dto.to_dict() == expected
+
+    def test_detail_not_found(self, products):
+        Product.objects.filter(pk=products[0].pk).update(is_active=False)
+        assert product_dao.get_detail(catalog_queryset(), products[0].slug) is None
+        assert product_dao.get_detail(catalog_queryset(), 'missing') is None
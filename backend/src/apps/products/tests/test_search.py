@@ -0,0 +1,117 @@
+"""
+Tests for full-text product search.
+"""
+from urllib.parse import urlencode
+
+import pytest
+from django.db import connection
+from rest_framework.test import APIClient
+
+from apps.products.models import Category, Product
+
+
+@pytest.fixture
+def russian_fts(db):
+    """Stemming needs a UTF-8 database with a locale that folds Cyrillic case."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_tsvector('russian', 'Розы') @@ to_tsquery('russian', 'роза')")
+        if not cursor.fetchone()[0]:
+            pytest.skip('database locale does not support Russian full-text search')
+
+
+@pytest.fixture
+def catalog(russian_fts):
+    roses = Category.objects.create(title='Розы', slug='roses')
+    mixed = Category.objects.create(title='Букеты', slug='mixed')
+
+    def create(slug, title, description='', category=roses, price=100000):
+        return Product.objects.create(
+            slug=slug, title=title, description=description, category=category, price=price,
+        )
+
+    return {
+        'title': create('roses-25', 'Букет из 25 роз', price=300000),
+        'description': create('spring', 'Весенний букет', 'Тюльпаны и розы в крафте', category=mixed),
+        'other': create('tulips', 'Тюльпаны', 'Нежные весенние цветы'),
+    }
+
+
+def search(query):
+    response = APIClient().get('/api/v1/products/', {'search': query})
+    assert response.status_code == 200
+    return [item['slug'] for item in response.json()['results']]
+
+
+@pytest.mark.django_db
+class TestProductSearch:
+    """Russian stemming, ranking, filters."""
+
+    def test_word_forms_and_rank(self, catalog):
+        # «розы» находит «роз», совпадение в названии выше описания
+        assert search('розы') == ['roses-25', 'spring']
+
+    def test_prefix_and_all_words(self, catalog):
+        # «тюльпаны» и «тюльпанов» стеммер сводит к разным основам
+        Product.objects.create(
+            slug='white-tulips', title='Букет из 15 белых тюльпанов',
+            category=catalog['other'].category, price=100000,
+        )
+        assert search('белые тюльпаны') == ['white-tulips']
+        assert search('тюльп') == ['white-tulips', 'tulips', 'spring']
+        assert search('(розы) & !') == ['roses-25', 'spring']
+
+    def test_hyphenated_words(self, catalog):
+        Product.objects.create(
+            slug='ivan-chai', title='Иван-чай и розово-белые пионы',
+            category=catalog['other'].category, price=100000,
+        )
+        assert search('иван-чай') == ['ivan-chai']
+        assert search('розово-белый') == ['ivan-chai']
+
+    def test_no_matches(self, catalog):
+        assert search('пионы') == []
+
+    def test_filters_and_ordering_kept(self, catalog):
+        client = APIClient()
+
+        response = client.get('/api/v1/products/', {'search': 'розы', 'category': 'mixed'})
+        assert [item['slug'] for item in response.json()['results']] == ['spring']
+
+        response = client.get('/api/v1/products/', {'search': 'розы', 'ordering': 'price'})
+        assert [item['slug'] for item in response.json()['results']] == ['spring', 'roses-25']
+
+    def test_ranked_pages(self, catalog):
+        category = catalog['other'].category
+        for n in range(25):
+            Product.objects.create(
+                slug=f'bouquet-{n}',
+                title='Розы' if n % 2 else f'Букет {n}',
+                description='' if n % 2 else 'С розами',
+                category=category,
+                price=100000,
+            )
+
+        client = APIClient()
+        slugs, path = [], '/api/v1/products/?' + urlencode({'search': 'роза'})
+        while path:
+            data = client.get(path).json()
+            slugs.extend(item['slug'] for item in data['results'])
+            path = data['next']
+
+        expected = {'roses-25', 'spring'} | {f'bouquet-{n}' for n in range(25)}
+        assert len(slugs) == len(expected) and set(slugs) == expected
+        # Совпадения в названии идут раньше совпадений в описании
+        title_matches = {'roses-25'} | {f'bouquet-{n}' for n in range(1, 25, 2)}
+        assert set(slugs[:len(title_matches)]) == title_matches
+
+
+def test_search_query_splits_punctuation(rf):
+    """Hyphens and punctuation split terms into separate prefix words."""
+    from django.contrib.postgres.search import SearchQuery
+    from rest_framework.request import Request
+
+    from apps.products.filters import ProductSearchFilter
+
+    request = Request(rf.get('/', {'search': 'иван-чай, (розы) &'}))
+    query = ProductSearchFilter().get_search_query(request)
+    assert query == SearchQuery('иван:* & чай:* & розы:*', config='russian', search_type='raw')
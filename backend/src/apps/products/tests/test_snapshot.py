@@ -0,0 +1,113 @@
+"""
+Tests for the static catalog snapshot.
+"""
+import gzip
+from unittest import mock
+
+import orjson
+import pytest
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from rest_framework.test import APIClient
+
+from apps.products.models import Category, Product, ProductImage
+from apps.products.services import publish_snapshot
+from apps.products.services.snapshot import SNAPSHOT_CURRENT_KEY
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    settings.CATALOG_SNAPSHOT_KEEP = 2
+    return tmp_path
+
+
+@pytest.fixture
+def catalog(db):
+    roses = Category.objects.create(title='Розы', slug='roses')
+    products = [
+        Product.objects.create(title=f'Букет {n}', slug=f'bouquet-{n}', category=roses, price=100000, sort_order=n)
+        for n in range(3)
+    ]
+    Product.objects.create(title='Снят', slug='hidden', category=roses, price=100000, is_active=False)
+    ProductImage.objects.create(product=products[0], image='products/a.jpg', is_main=True)
+    return products
+
+
+def read(snapshot):
+    with default_storage.open(snapshot['files'][0]) as file:
+        return orjson.loads(gzip.decompress(file.read()))
+
+
+@pytest.mark.django_db
+class TestCatalogSnapshot:
+    """Versioned gzipped catalog in default storage."""
+
+    def test_publish(self, catalog):
+        snapshot = publish_snapshot()
+        assert snapshot['published'] is True
+        assert snapshot['products_count'] == 3
+
+        data = read(snapshot)
+        assert data['version'] == snapshot['version']
+        assert data['changes_version'] == snapshot['changes_version']
+        assert [category['slug'] for category in data['categories']] == ['roses']
+        assert [product['slug'] for product in data['products']] == ['bouquet-0', 'bouquet-1', 'bouquet-2']
+        assert data['products'][0]['main_image'].endswith('products/a.jpg')
+
+    def test_versions(self, catalog):
+        first = publish_snapshot()
+        assert publish_snapshot()['published'] is False
+
+        catalog[1].price = 200000
+        catalog[1].save()
+        second = publish_snapshot()
+        third = publish_snapshot(force=True)
+
+        assert first['version'] < second['version'] < third['version']
+        assert read(second)['products'][1]['price'] == 200000
+        # Хранятся CATALOG_SNAPSHOT_KEEP последних версий
+        assert third['files'] == [third['files'][0], second['files'][0]]
+        assert not default_storage.exists(first['files'][0])
+
+    def test_endpoint(self, catalog):
+        client = APIClient()
+        with mock.patch('apps.products.services.snapshot.transaction.on_commit'):
+            assert client.get('/api/v1/products/snapshot/').status_code == 404
+
+        snapshot = publish_snapshot()
+        # Кэш очищен — текущий снимок читается из хранилища
+        cache.delete(SNAPSHOT_CURRENT_KEY)
+        response = client.get('/api/v1/products/snapshot/')
+
+        assert response.status_code == 200
+        assert response.json()['version'] == snapshot['version']
+        assert response.json()['url'] == snapshot['url']
+        assert 'max-age=60' in response['Cache-Control']
+
+    def test_stable_urls(self, catalog, settings):
+        settings.CATALOG_SNAPSHOT_MEDIA_URL = 'https://cdn.example.com/media/'
+        with mock.patch.object(default_storage, 'url', side_effect=AssertionError('presigned')):
+            with mock.patch.object(default_storage, 'save', wraps=default_storage.save) as save:
+                snapshot = publish_snapshot()
+            assert publish_snapshot()['published'] is False
+
+        assert read(snapshot)['products'][0]['main_image'] == 'https://cdn.example.com/media/products/a.jpg'
+        assert snapshot['url'] == 'https://cdn.example.com/media/' + snapshot['name']
+        assert all(call.args[1].content_type == 'application/json' for call in save.call_args_list)
+
+        # Хранится имя файла, URL вычисляется при чтении
+        assert 'url' not in cache.get(SNAPSHOT_CURRENT_KEY)
+        settings.CATALOG_SNAPSHOT_MEDIA_URL = 'https://static.example.com/'
+        response = APIClient().get('/api/v1/products/snapshot/')
+        assert response.json()['url'] == 'https://static.example.com/' + snapshot['name']
+
+    def test_changes_debounced(self, catalog, django_capture_on_commit_callbacks):
+        with mock.patch('apps.products.tasks.publish_catalog_snapshot.apply_async') as apply_async:
+            with django_capture_on_commit_callbacks(execute=True):
+                for product in catalog:
+                    product.title += ' новый'
+                    product.save()
+                ProductImage.objects.create(product=catalog[1], image='products/b.jpg')
+
+        apply_async.assert_called_once_with(countdown=60)
@@ -1,8 +1,18 @@
 """Product URLs."""
+from django.conf import settings
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from apps.products.views import CategoryViewSet, FavoriteViewSet, ProductViewSet
+from apps.products.views import (
+    AutocompleteView,
+    CatalogChangesView,
+    CatalogSnapshotView,
+    CategoryListAsyncView,
+    CategoryViewSet,
+    FavoriteViewSet,
+    ProductListAsyncView,
+    ProductViewSet,
+)
 
 app_name = 'products'
 
@@ -12,5 +22,18 @@ router.register('favorites', FavoriteViewSet, basename='favorite')
 router.register('', ProductViewSet, basename='product')
 
 urlpatterns = [
+    path('autocomplete/', AutocompleteView.as_view(), name='autocomplete'),
+    path('changes/', CatalogChangesView.as_view(), name='catalog-changes'),
+    path('snapshot/', CatalogSnapshotView.as_view(), name='catalog-snapshot'),
+]
+
+# В режиме ASGI самые нагруженные списки обслуживают async-вьюхи
+if settings.SERVER_MODE == 'asgi':
+    urlpatterns += [
+        path('', ProductListAsyncView.as_view(), name='product-list-async'),
+        path('categories/', CategoryListAsyncView.as_view(), name='category-list-async'),
+    ]
+
+urlpatterns += [
     path('', include(router.urls)),
 ]
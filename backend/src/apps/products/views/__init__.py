@@ -1,10 +1,20 @@
 """Products views."""
-from apps.products.views.category import CategoryViewSet
+from apps.products.views.autocomplete import AutocompleteView
+from apps.products.views.bootstrap import BootstrapView
+from apps.products.views.category import CategoryListAsyncView, CategoryViewSet
+from apps.products.views.changes import CatalogChangesView
 from apps.products.views.favorite import FavoriteViewSet
-from apps.products.views.product import ProductViewSet
+from apps.products.views.product import ProductListAsyncView, ProductViewSet
+from apps.products.views.snapshot import CatalogSnapshotView
 
 __all__ = [
+    'AutocompleteView',
+    'BootstrapView',
+    'CatalogChangesView',
+    'CatalogSnapshotView',
+    'CategoryListAsyncView',
     'CategoryViewSet',
     'FavoriteViewSet',
+    'ProductListAsyncView',
     'ProductViewSet',
 ]
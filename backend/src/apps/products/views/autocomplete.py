@@ -0,0 +1,24 @@
+"""Autocomplete views."""
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.products.serializers import AutocompleteQuerySerializer, AutocompleteSerializer
+from apps.products.services import get_suggestions
+
+
+class AutocompleteView(APIView):
+    """
+    Подсказки поиска по мере ввода.
+
+    GET /products/autocomplete/?q=розв&limit=8 — товары и категории,
+    ближайшие к тексту (с учётом опечаток). Ответы кэшируются.
+    """
+    permission_classes = [AllowAny]
+
+    @extend_schema(parameters=[AutocompleteQuerySerializer], responses=AutocompleteSerializer)
+    def get(self, request):
+        params = AutocompleteQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        return Response(get_suggestions(params.validated_data['q'], params.validated_data.get('limit')))
@@ -0,0 +1,64 @@
+"""Bootstrap view."""
+from django.urls import reverse
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.products.serializers import BootstrapSerializer
+from apps.products.services import get_favorite_ids, get_public_data, mark_favorites
+from apps.users.serializers import UserSerializer
+
+
+class BootstrapView(APIView):
+    """
+    Всё для первого экрана Mini App одним запросом.
+
+    GET /api/v1/bootstrap/ — пользователь, категории, первая страница
+    каталога, id избранного и slug активных страниц. Заменяет цепочку
+    /auth/telegram/ -> /products/categories/ -> /products/ -> /favorites/ -> /pages/...
+
+    Аутентификация как у остальных эндпоинтов: Bearer JWT или
+    X-Telegram-Init-Data. Во втором случае в ответе есть tokens —
+    дальше клиент работает по JWT. Анонимам: user, tokens = null,
+    favorites = [].
+    """
+    permission_classes = [AllowAny]
+
+    @extend_schema(responses=BootstrapSerializer)
+    def get(self, request):
+        public = get_public_data()
+        user = request.user
+
+        favorites = get_favorite_ids(user) if user.is_authenticated else []
+        products = mark_favorites(
+            user,
+            [dict(product) for product in public['products']['results']],
+            set(favorites),
+        )
+
+        next_url = None
+        if public['products']['cursor']:
+            next_url = replace_query_param(
+                request.build_absolute_uri(reverse('products:product-list')),
+                'cursor',
+                public['products']['cursor'],
+            )
+
+        return Response({
+            'user': UserSerializer(user).data if user.is_authenticated else None,
+            'tokens': self.get_tokens(request),
+            'categories': public['categories'],
+            'products': {'next': next_url, 'results': products},
+            'favorites': favorites,
+            'pages': public['pages'],
+        })
+
+    def get_tokens(self, request) -> dict | None:
+        """JWT, если запрос авторизован по initData (вместо отдельного /auth/telegram/)."""
+        if not isinstance(request.auth, dict) or request.auth.get('auth_method') != 'telegram_init_data':
+            return None
+        refresh = RefreshToken.for_user(request.user)
+        return {'access': str(refresh.access_token), 'refresh': str(refresh)}
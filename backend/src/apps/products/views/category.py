@@ -1,11 +1,10 @@
 """Category views."""
-from django.db import models
-from django.db.models import Count
 from rest_framework import viewsets
 from rest_framework.permissions import AllowAny
 
-from apps.products.models import Category
+from apps.core.views import AsyncReadView
 from apps.products.serializers import CategorySerializer
+from apps.products.services import active_categories
 
 
 class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
@@ -21,14 +20,12 @@ class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
     pagination_class = None  # Категорий мало, пагинация не нужна
 
     def get_queryset(self):
-        return (
-            Category.objects
-            .filter(is_active=True)
-            .annotate(
-                products_count=Count(
-                    'products',
-                    filter=models.Q(products__is_active=True)
-                )
-            )
-            .order_by('sort_order', 'title')
-        )
+        return active_categories()
+
+
+class CategoryListAsyncView(AsyncReadView):
+    """Список активных категорий (async, режим ASGI)."""
+
+    async def get(self, request):
+        categories = [category async for category in active_categories()]
+        return self.render(CategorySerializer(categories, many=True).data)
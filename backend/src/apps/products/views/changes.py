@@ -0,0 +1,27 @@
+"""Catalog delta sync views."""
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.products.serializers import CatalogChangesQuerySerializer, CatalogChangesSerializer
+from apps.products.services import get_changes
+
+
+class CatalogChangesView(APIView):
+    """
+    Изменения каталога с версии since.
+
+    GET /products/changes/?since=<version> — изменённые товары и категории
+    и id удалённых. Клиент применяет их к локальному кэшу и сохраняет
+    version из ответа. Без since или при reset=true каталог загружается
+    целиком (GET /products/snapshot/ или GET /products/).
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    @extend_schema(parameters=[CatalogChangesQuerySerializer], responses=CatalogChangesSerializer)
+    def get(self, request):
+        params = CatalogChangesQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        return Response(get_changes(params.validated_data.get('since')))
@@ -7,12 +7,13 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from apps.core.pagination import KeysetPagination
+from apps.products.dao import product_dao
 from apps.products.models import FavoriteAction, FavoriteActionType, Product, ProductImage
 from apps.products.serializers import (
     FavoriteActionSerializer,
     FavoriteBulkSerializer,
     FavoriteToggleSerializer,
-    ProductListSerializer,
 )
 
 logger = logging.getLogger(__name__)
@@ -26,7 +27,7 @@ class FavoriteViewSet(viewsets.ViewSet):
     - GET /favorites/ — список товаров в избранном
     - POST /favorites/ — добавить товар в избранное
     - DELETE /favorites/{product_id}/ — удалить товар из избранного
-    - GET /favorites/history/ — история действий с избранным
+    - GET /favorites/history/ — история действий с избранным (постранично)
     - POST /favorites/sync/ — синхронизация избранного (для миграции из localStorage)
     - POST /favorites/check/ — проверить статусы товаров
     """
@@ -35,14 +36,8 @@ class FavoriteViewSet(viewsets.ViewSet):
     def list(self, request):
         """Получить текущее избранное."""
         products = FavoriteAction.get_user_favorites(request.user)
-        products = products.select_related('category').prefetch_related(
-            Prefetch(
-                'images',
-                queryset=ProductImage.objects.order_by('-is_main', 'sort_order')
-            )
-        )
-        serializer = ProductListSerializer(products, many=True)
-        return Response(serializer.data)
+        rows = list(product_dao.list_rows(products))
+        return Response([product.to_dict() for product in product_dao.build_list(rows)])
 
     def create(self, request):
         """Добавить товар в избранное."""
@@ -90,7 +85,7 @@ class FavoriteViewSet(viewsets.ViewSet):
 
     @action(detail=False, methods=['get'])
     def history(self, request):
-        """История действий с избранным."""
+        """История действий с избранным (постранично, курсор в next)."""
         actions = FavoriteAction.objects.filter(
             user=request.user
         ).select_related(
@@ -100,10 +95,12 @@ class FavoriteViewSet(viewsets.ViewSet):
                 'product__images',
                 queryset=ProductImage.objects.order_by('-is_main', 'sort_order')
             )
-        )[:100]  # Лимит 100 последних действий
+        )
 
-        serializer = FavoriteActionSerializer(actions, many=True)
-        return Response(serializer.data)
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(actions, request, view=self)
+        serializer = FavoriteActionSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
     @action(detail=False, methods=['post'])
     def sync(self, request):
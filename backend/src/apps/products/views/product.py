@@ -1,65 +1,143 @@
 """Product views."""
 import logging
 
-from django.db import models
-from django.db.models import Prefetch
-from django_filters import rest_framework as filters
+from django.http import Http404
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import filters as drf_filters
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import APIException, ValidationError
 from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
 
-from apps.products.models import Product, ProductImage
-from apps.products.serializers import ProductDetailSerializer, ProductListSerializer
+from apps.core.pagination import KeysetPagination
+from apps.core.views import AsyncReadView
+from apps.products.dao import product_dao
+from apps.products.filters import MAX_BULK_IDS, ProductFilter, ProductSearchFilter, parse_ids
+from apps.products.models import FavoriteAction, Product
+from apps.products.serializers import ProductDetailSerializer, ProductFacetsSerializer, ProductListSerializer
+from apps.products.services import CATALOG_ORDERING, catalog_queryset, get_facets, mark_favorites
 
 logger = logging.getLogger(__name__)
 
-
-class ProductFilter(filters.FilterSet):
-    """Фильтры для товаров."""
-    category = filters.CharFilter(field_name='category__slug')
-    min_price = filters.NumberFilter(field_name='price', lookup_expr='gte')
-    max_price = filters.NumberFilter(field_name='price', lookup_expr='lte')
-    in_stock = filters.BooleanFilter(method='filter_in_stock')
-
-    class Meta:
-        model = Product
-        fields = ['category']
-
-    def filter_in_stock(self, queryset, name, value):
-        if value:
-            return queryset.filter(
-                models.Q(is_unlimited=True) | models.Q(qty_available__gt=0)
-            )
-        return queryset
+IDS_PARAMETER = OpenApiParameter(
+    'ids',
+    str,
+    description=(
+        f'Товары по id через запятую (до {MAX_BULK_IDS}), в том же порядке, '
+        'включая снятые с продажи. Остальные фильтры и пагинация не применяются'
+    ),
+)
 
 
 class ProductViewSet(viewsets.ReadOnlyModelViewSet):
     """
     Товары.
 
-    list: Каталог товаров (с фильтрацией по категории)
+    list: Каталог товаров (с фильтрацией по категории); ?ids=1,2,3 — товары
+          по списку id одним ответом (корзина, избранное)
     retrieve: Детали товара по slug
+    facets: Количество по категориям, диапазон цен и «в наличии» для фильтров
+
+    Ответы собираются из DTO (values() + to_dict()), сериализаторы
+    описывают схему для OpenAPI. Авторизованным добавляется is_favorite.
     """
     permission_classes = [AllowAny]
+    pagination_class = KeysetPagination
     lookup_field = 'slug'
+    filter_backends = [DjangoFilterBackend, drf_filters.OrderingFilter, ProductSearchFilter]
     filterset_class = ProductFilter
-    search_fields = ['title', 'description']
     ordering_fields = ['price', 'created_at', 'sort_order']
-    ordering = ['sort_order', '-created_at']
+    ordering = CATALOG_ORDERING
 
     def get_queryset(self):
-        return (
-            Product.objects
-            .filter(is_active=True)
-            .select_related('category')
-            .prefetch_related(
-                Prefetch(
-                    'images',
-                    queryset=ProductImage.objects.order_by('-is_main', 'sort_order')
-                )
-            )
-        )
+        return catalog_queryset()
 
     def get_serializer_class(self):
         if self.action == 'retrieve':
             return ProductDetailSerializer
         return ProductListSerializer
+
+    @extend_schema(parameters=[IDS_PARAMETER])
+    def list(self, request, *args, **kwargs):
+        if 'ids' in request.query_params:
+            rows = product_dao.rows_by_ids(parse_ids(request.query_params['ids']))
+            products = product_dao.build_list(rows)
+            results = mark_favorites(request.user, [product.to_dict() for product in products])
+            return Response({'next': None, 'results': results})
+
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = self.paginate_queryset(product_dao.list_rows(queryset))
+        products = product_dao.build_list(rows)
+        return self.get_paginated_response(
+            mark_favorites(request.user, [product.to_dict() for product in products])
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        product = product_dao.get_detail(self.get_queryset(), kwargs[self.lookup_field])
+        if product is None:
+            raise Http404
+        return Response(mark_favorites(request.user, [product.to_dict()])[0])
+
+    @extend_schema(responses=ProductFacetsSerializer, filters=True)
+    @action(detail=False, methods=['get'], pagination_class=None)
+    def facets(self, request):
+        """
+        Фасеты для текущих фильтров и поиска.
+
+        GET /products/facets/?category=roses&min_price=100000&search=розы
+        Фильтры не отсекают строки, а применяются внутри агрегатов
+        (см. apps.products.services.facets).
+        """
+        filterset = ProductFilter(request.query_params, queryset=Product.objects.none(), request=request)
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+
+        search = ProductSearchFilter()
+        queryset = search.filter_queryset(request, Product.objects.filter(is_active=True), self)
+        params = {
+            **filterset.form.cleaned_data,
+            'search': ' '.join(search.get_search_terms(request)).lower(),
+        }
+        return Response(get_facets(queryset, filterset.get_conditions(), params))
+
+
+class ProductListAsyncView(AsyncReadView):
+    """
+    Каталог товаров (async, режим ASGI).
+
+    Те же фильтры, поиск, сортировка, пагинация и is_favorite,
+    что у ProductViewSet.list.
+    """
+    filter_backends = [drf_filters.OrderingFilter, ProductSearchFilter]
+    ordering_fields = ProductViewSet.ordering_fields
+    ordering = ProductViewSet.ordering
+
+    async def get(self, request):
+        try:
+            self.user = await self.authenticate(request)
+        except APIException as exc:
+            return self.render_error(exc)
+
+        if 'ids' in request.GET:
+            try:
+                ids = parse_ids(request.GET['ids'])
+            except ValidationError as exc:
+                return self.render_error(exc)
+            rows = await product_dao.arows_by_ids(ids)
+            return self.render({'next': None, 'results': await self.serialize(rows)})
+
+        filterset = ProductFilter(request.GET, queryset=catalog_queryset(), request=request)
+        if not filterset.is_valid():
+            return self.render(filterset.errors, status=400)
+
+        queryset = self.filter_queryset(request, filterset.qs)
+        return await self.paginate(request, product_dao.list_rows(queryset), self.serialize)
+
+    async def serialize(self, rows: list[dict]) -> list[dict]:
+        items = [product.to_dict() for product in await product_dao.abuild_list(rows)]
+        favorites = None
+        if self.user.is_authenticated and items:
+            favorites = await FavoriteAction.aget_favorite_ids(self.user, [item['id'] for item in items])
+        return mark_favorites(self.user, items, favorites)
@@ -0,0 +1,37 @@
+"""Catalog snapshot views."""
+from django.utils.cache import patch_cache_control
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.products.serializers import CatalogSnapshotSerializer
+from apps.products.services import get_current_snapshot, schedule_snapshot
+
+
+class CatalogSnapshotView(APIView):
+    """
+    URL и версия статического снимка каталога.
+
+    GET /products/snapshot/ — клиент сравнивает version с сохранённой
+    и при изменении скачивает файл по url (из хранилища/CDN, мимо Django).
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    # Ответ крошечный и меняется не чаще пересборки снимка
+    max_age = 60
+
+    @extend_schema(responses=CatalogSnapshotSerializer)
+    def get(self, request):
+        snapshot = get_current_snapshot()
+        if snapshot is None:
+            schedule_snapshot()
+            return Response(
+                {'detail': 'Снимок каталога ещё не опубликован'},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        response = Response(CatalogSnapshotSerializer(snapshot).data)
+        patch_cache_control(response, public=True, max_age=self.max_age)
+        return response
@@ -1,6 +1,7 @@
 """User model placeholder."""
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Lower
 
 
 class User(AbstractUser):
@@ -37,3 +38,7 @@ class User(AbstractUser):
     class Meta:
         verbose_name = 'Пользователь'
         verbose_name_plural = 'Пользователи'
+        indexes = [
+            # Поиск получателей рассылки по списку @username (IN по lower())
+            models.Index(Lower('username'), name='users_user_username_lower_idx'),
+        ]
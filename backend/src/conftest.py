@@ -0,0 +1,18 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    """Use in-process cache in tests instead of Redis."""
+    from django.core.cache import cache
+
+    settings.CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+    # Re-check cached BotAdmin snapshot version on every call
+    settings.BOT_ADMIN_CACHE_LOCAL_TTL = 0
+    cache.clear()
+    yield
+    cache.clear()
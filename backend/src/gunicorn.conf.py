@@ -0,0 +1,20 @@
+"""
+Gunicorn config (loaded automatically from the working directory).
+
+SERVER_MODE=wsgi — sync workers, wsgi:application (default)
+SERVER_MODE=asgi — uvicorn workers, asgi:application: async views and the
+                   bot webhook run natively in the event loop
+"""
+import os
+
+server_mode = os.environ.get('SERVER_MODE', 'wsgi')
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('WEB_CONCURRENCY', 4))
+
+if server_mode == 'asgi':
+    wsgi_app = 'asgi:application'
+    worker_class = 'uvicorn.workers.UvicornWorker'
+else:
+    wsgi_app = 'wsgi:application'
+    worker_class = 'sync'
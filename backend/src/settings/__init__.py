@@ -7,6 +7,7 @@ from settings.celery import *  # noqa: F401, F403
 from settings.cors import *  # noqa: F401, F403
 from settings.databases import *  # noqa: F401, F403
 from settings.environment import *  # noqa: F401, F403
+from settings.environment import env
 from settings.logging import *  # noqa: F401, F403
 from settings.rest_framework import *  # noqa: F401, F403
 from settings.storage import *  # noqa: F401, F403
@@ -21,6 +22,10 @@ ROOT_URLCONF = 'urls'
 WSGI_APPLICATION = 'wsgi.application'
 ASGI_APPLICATION = 'asgi.application'
 
+# Режим сервера: wsgi (gunicorn, sync workers) или asgi (uvicorn workers), см. gunicorn.conf.py
+# В режиме asgi каталог, категории и страницы обслуживаются async-вьюхами
+SERVER_MODE = env('SERVER_MODE', default='wsgi')
+
 # Security
 SECRET_KEY = env('SECRET_KEY', default='django-insecure-change-me-in-production')
 DEBUG = env.bool('DEBUG', default=False)
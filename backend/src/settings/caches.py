@@ -12,3 +12,19 @@ CACHES = {
 # Session backend
 SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
 SESSION_CACHE_ALIAS = 'default'
+
+# Автодополнение поиска (apps.products.services.autocomplete)
+AUTOCOMPLETE_LIMIT = env.int('AUTOCOMPLETE_LIMIT', default=8)
+# Порог word_similarity: ниже — больше подсказок при опечатках, но и больше шума
+AUTOCOMPLETE_SIMILARITY_THRESHOLD = env.float('AUTOCOMPLETE_SIMILARITY_THRESHOLD', default=0.4)
+# Сколько живёт ответ в кэше; изменение товаров и категорий сбрасывает кэш сразу
+AUTOCOMPLETE_CACHE_TTL = env.int('AUTOCOMPLETE_CACHE_TTL', default=2 * 60 * 60)
+# Прогрев: самые частые запросы из аналитики за последние дни (и их префиксы)
+AUTOCOMPLETE_WARM_QUERIES = env.int('AUTOCOMPLETE_WARM_QUERIES', default=50)
+AUTOCOMPLETE_WARM_DAYS = env.int('AUTOCOMPLETE_WARM_DAYS', default=7)
+
+# Фасеты каталога (apps.products.services.facets); изменение товаров сбрасывает кэш сразу
+FACETS_CACHE_TTL = env.int('FACETS_CACHE_TTL', default=30 * 60)
+
+# Общая часть GET /bootstrap/ (apps.products.services.bootstrap); изменения каталога и страниц сбрасывают кэш сразу
+BOOTSTRAP_CACHE_TTL = env.int('BOOTSTRAP_CACHE_TTL', default=10 * 60)
@@ -1,6 +1,7 @@
 from celery.schedules import crontab
 
 from settings.environment import env
+from settings.telegram import ADMIN_ORDER_DIGEST_WINDOW
 
 # Celery Configuration
 CELERY_BROKER_URL = env('CELERY_BROKER_URL', default='redis://localhost:6379/1')
@@ -27,11 +28,48 @@ CELERY_BEAT_SCHEDULE = {
         'schedule': crontab(hour=4, minute=0, day_of_week='sunday'),
         'kwargs': {'days': 90},
     },
+    # Очистка журнала изменений каталога (дельта-синхронизация) каждый день в 4:30 ночи
+    'prune-catalog-changes': {
+        'task': 'products.prune_catalog_changes',
+        'schedule': crontab(hour=4, minute=30),
+        'kwargs': {'days': 30},
+    },
+    # Прогрев кэша автодополнения популярными запросами каждый час
+    'warm-autocomplete-cache': {
+        'task': 'products.warm_autocomplete_cache',
+        'schedule': crontab(minute=15),
+    },
+    # Снимок каталога в хранилище каждый час (страховка к пересборке по сигналам)
+    'publish-catalog-snapshot': {
+        'task': 'products.publish_catalog_snapshot',
+        'schedule': crontab(minute=45),
+    },
     # Агрегация дневной статистики каждый день в 1:00 ночи
     'aggregate-daily-stats': {
         'task': 'analytics.aggregate_daily_stats',
         'schedule': crontab(hour=1, minute=0),
     },
+    # Пересчёт сегментов аудитории рассылок (новые/неактивные) каждый день в 2:00 ночи
+    'refresh-audience-segments': {
+        'task': 'bot.refresh_audience_segments',
+        'schedule': crontab(hour=2, minute=0),
+    },
+    # Отправка задач из outbox в брокер (уведомления о заказах) каждые 2 секунды.
+    # Relay — единственный, кто публикует: запрос не ждёт ни Redis, ни брокер
+    'relay-task-outbox': {
+        'task': 'bot.relay_task_outbox',
+        'schedule': env.float('TASK_OUTBOX_RELAY_INTERVAL', default=2.0),
+    },
+    # Запись состояний диалогов бота из кэша в БД каждые 5 секунд
+    'flush-conversation-states': {
+        'task': 'bot.flush_conversation_states',
+        'schedule': 5.0,
+    },
+    # Сводка новых заказов для админов (режим дайджеста, ADMIN_ORDER_DIGEST_WINDOW > 0)
+    'flush-admin-order-digest': {
+        'task': 'bot.flush_admin_order_digest',
+        'schedule': ADMIN_ORDER_DIGEST_WINDOW or 30,
+    },
     # Очистка старых событий аналитики каждое воскресенье в 3:00 ночи
     'cleanup-old-analytics-events': {
         'task': 'analytics.cleanup_old_events',
@@ -14,3 +14,41 @@ DATABASES = {
         },
     }
 }
+
+# Пул соединений psycopg3 (Django 5.1+): соединения переиспользуются внутри
+# процесса и не открываются заново после рестарта/ротации воркеров.
+# С пулом CONN_MAX_AGE должен быть 0 (постоянные соединения не поддерживаются).
+DB_POOL = env.bool('DB_POOL', default=False)
+# Бюджет соединений на контейнер делится между процессами (воркерами gunicorn/celery)
+DB_POOL_MAX_CONNECTIONS = env.int('DB_POOL_MAX_CONNECTIONS', default=40)
+DB_POOL_PROCESSES = env.int('DB_POOL_PROCESSES', default=env.int('WEB_CONCURRENCY', default=4))
+# Сколько секунд ждать свободное соединение, прежде чем вернуть ошибку
+DB_POOL_TIMEOUT = env.float('DB_POOL_TIMEOUT', default=10.0)
+# Доля занятых соединений, при которой health check сообщает о насыщении пула
+DB_POOL_SATURATION_WARNING = env.float('DB_POOL_SATURATION_WARNING', default=0.9)
+
+if DB_POOL:
+    _pool_max_size = max(2, DB_POOL_MAX_CONNECTIONS // max(1, DB_POOL_PROCESSES))
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': min(2, _pool_max_size),
+        'max_size': _pool_max_size,
+        'timeout': DB_POOL_TIMEOUT,
+    }
+
+# Реплика только для чтения (отчёты админки, аналитика, размеры аудиторий рассылок).
+# Без DB_REPLICA_HOST всё читается из основной БД. См. apps.core.db_router
+DB_REPLICA_HOST = env('DB_REPLICA_HOST', default='')
+
+if DB_REPLICA_HOST:
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': DB_REPLICA_HOST,
+        'PORT': env.int('DB_REPLICA_PORT', default=DATABASES['default']['PORT']),
+        'USER': env('DB_REPLICA_USER', default=DATABASES['default']['USER']),
+        'PASSWORD': env('DB_REPLICA_PASSWORD', default=DATABASES['default']['PASSWORD']),
+        'OPTIONS': {**DATABASES['default']['OPTIONS']},
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['apps.core.db_router.ReplicaRouter']
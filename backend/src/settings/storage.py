@@ -24,6 +24,16 @@ if USE_S3:
     if env('AWS_LOCATION', default=''):
         _s3_options['location'] = env('AWS_LOCATION')
 
+    # Публичный (неподписанный) адрес файлов бакета: объекты загружаются с default_acl
+    if 'custom_domain' in _s3_options:
+        _public_media_url = f"https://{_s3_options['custom_domain']}/"
+    elif 'endpoint_url' in _s3_options:
+        _public_media_url = f"{_s3_options['endpoint_url'].rstrip('/')}/{_s3_options['bucket_name']}/"
+    else:
+        _public_media_url = f"https://{_s3_options['bucket_name']}.s3.{_s3_options['region_name']}.amazonaws.com/"
+    if 'location' in _s3_options:
+        _public_media_url += _s3_options['location'].strip('/') + '/'
+
     STORAGES = {
         'default': {
             'BACKEND': 'storages.backends.s3boto3.S3Boto3Storage',
@@ -34,6 +44,9 @@ if USE_S3:
         },
     }
 else:
+    # FileSystemStorage.url() и так постоянный (MEDIA_URL + имя)
+    _public_media_url = ''
+
     STORAGES = {
         'default': {
             'BACKEND': 'django.core.files.storage.FileSystemStorage',
@@ -43,6 +56,15 @@ else:
         },
     }
 
+# Снимок каталога (apps.products.services.snapshot)
+# Задержка пересборки после изменения каталога: серия правок — одна публикация
+CATALOG_SNAPSHOT_DEBOUNCE = env.int('CATALOG_SNAPSHOT_DEBOUNCE', default=60)
+# Сколько последних версий хранить (старые URL ещё могут быть у клиентов)
+CATALOG_SNAPSHOT_KEEP = env.int('CATALOG_SNAPSHOT_KEEP', default=3)
+# Базовый URL файлов в снимке и в ответе GET /products/snapshot/ (CDN перед бакетом).
+# Не storage.url(): у S3 без custom_domain это presigned URL, который истекает через час
+CATALOG_SNAPSHOT_MEDIA_URL = env('CATALOG_SNAPSHOT_MEDIA_URL', default='') or _public_media_url
+
 # Image settings
 MAX_UPLOAD_SIZE = env.int('MAX_UPLOAD_SIZE', default=10 * 1024 * 1024)  # 10MB
 ALLOWED_IMAGE_TYPES = ['image/jpeg', 'image/png', 'image/webp']
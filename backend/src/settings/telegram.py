@@ -14,3 +14,30 @@ TELEGRAM_AUTH_TIMEOUT = env.int('TELEGRAM_AUTH_TIMEOUT', default=86400)  # 24 ho
 # Set to True to allow access only from Telegram Mini App
 # Set to False to allow access from any browser (useful for development)
 ENFORCE_TELEGRAM_ONLY = env.bool('ENFORCE_TELEGRAM_ONLY', default=False)
+
+# Bot API client used by Celery workers (keep-alive connection pool)
+# Connect/read timeouts in seconds; POOL_SIZE is also the fan-out concurrency
+TELEGRAM_API_CONNECT_TIMEOUT = env.float('TELEGRAM_API_CONNECT_TIMEOUT', default=3.05)
+TELEGRAM_API_READ_TIMEOUT = env.float('TELEGRAM_API_READ_TIMEOUT', default=10.0)
+TELEGRAM_API_POOL_SIZE = env.int('TELEGRAM_API_POOL_SIZE', default=10)
+
+# Broadcast wizard audience counts cache
+# TTL — after this many seconds counts are refreshed in background (stale value is served meanwhile)
+# MAX_AGE — hard expiry, after which counts are recomputed inline
+BROADCAST_AUDIENCE_COUNTS_TTL = env.int('BROADCAST_AUDIENCE_COUNTS_TTL', default=60)
+BROADCAST_AUDIENCE_COUNTS_MAX_AGE = env.int('BROADCAST_AUDIENCE_COUNTS_MAX_AGE', default=3600)
+
+# Admin new-order digest: orders arriving within this many seconds of each other
+# are sent to admins as one consolidated message by a periodic task.
+# 0 = disabled (one message per order)
+ADMIN_ORDER_DIGEST_WINDOW = env.int('ADMIN_ORDER_DIGEST_WINDOW', default=0)
+
+# Bot conversation state (broadcast wizard) is kept in cache and written to the DB in batches
+# TTL of cached states in seconds, including "no state" entries for ordinary users
+CONVERSATION_STATE_CACHE_TTL = env.int('CONVERSATION_STATE_CACHE_TTL', default=7 * 24 * 60 * 60)
+
+# Active bot admins snapshot (admin checks and notification targets without DB queries)
+# Invalidated on every BotAdmin save/delete; TTL is a safety net for the Redis copy,
+# LOCAL_TTL is how long a process trusts its own copy before re-checking the version
+BOT_ADMIN_CACHE_TTL = env.int('BOT_ADMIN_CACHE_TTL', default=24 * 60 * 60)
+BOT_ADMIN_CACHE_LOCAL_TTL = env.float('BOT_ADMIN_CACHE_LOCAL_TTL', default=5.0)
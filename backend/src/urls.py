@@ -9,6 +9,8 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
 )
 
+from apps.products.views import BootstrapView
+
 
 # Декоратор для проверки прав администратора
 def is_staff_user(user):
@@ -27,6 +29,7 @@ urlpatterns = [
         path('orders/', include('apps.orders.urls')),
         path('payments/', include('apps.payments.urls')),
         path('analytics/', include('apps.analytics.urls')),
+        path('bootstrap/', BootstrapView.as_view(), name='bootstrap'),
         path('', include('apps.core.urls')),
     ])),
 
@@ -50,18 +50,16 @@ export function useProducts(filters?: ProductsFilter) {
 }
 
 /**
- * Извлечь номер страницы из URL пагинации Django
+ * Извлечь курсор следующей страницы из URL пагинации
  */
-function getPageFromUrl(url: string | null): number | undefined {
+function getCursorFromUrl(url: string | null): string | undefined {
   if (!url) return undefined;
   try {
-    const urlObj = new URL(url);
-    const page = urlObj.searchParams.get('page');
-    return page ? parseInt(page, 10) : undefined;
+    return new URL(url).searchParams.get('cursor') ?? undefined;
   } catch {
     // Если URL относительный, парсим по-другому
-    const match = url.match(/[?&]page=(\d+)/);
-    return match ? parseInt(match[1], 10) : undefined;
+    const match = url.match(/[?&]cursor=([^&]+)/);
+    return match ? decodeURIComponent(match[1]) : undefined;
   }
 }
 
@@ -69,18 +67,18 @@ function getPageFromUrl(url: string | null): number | undefined {
  * Infinite scroll для списка товаров
  *
  * Использует useInfiniteQuery для подгрузки страниц при скролле.
- * Автоматически определяет следующую страницу из Django pagination.
+ * Следующая страница — по курсору из поля next (keyset-пагинация API).
  */
-export function useInfiniteProducts(filters?: Omit<ProductsFilter, 'page'>) {
+export function useInfiniteProducts(filters?: Omit<ProductsFilter, 'cursor'>) {
   return useInfiniteQuery<PaginatedResponse<Product>, Error>({
     queryKey: [...productKeys.lists(), 'infinite', filters] as const,
     queryFn: async ({ pageParam }) => {
-      return productsApi.getProducts({ ...filters, page: pageParam as number });
+      return productsApi.getProducts({ ...filters, cursor: pageParam as string | undefined });
     },
-    initialPageParam: 1,
+    initialPageParam: undefined as string | undefined,
     getNextPageParam: (lastPage) => {
-      // Django REST Framework возвращает URL следующей страницы или null
-      return getPageFromUrl(lastPage.next);
+      // API возвращает URL следующей страницы или null
+      return getCursorFromUrl(lastPage.next);
     },
     staleTime: 2 * 60 * 1000, // 2 минуты
   });
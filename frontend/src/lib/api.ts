@@ -9,12 +9,16 @@
  */
 
 import type {
+  Bootstrap,
+  CatalogChanges,
+  CatalogSnapshot,
   Category,
   CheckoutData,
   Order,
   OrderDetail,
   PaginatedResponse,
   Product,
+  ProductFacets,
   ProductsFilter,
 } from '@/types/shop';
 import { useAuthStore, initAuth } from '@/stores/authStore';
@@ -203,6 +207,18 @@ async function request<T>(
 
 // ============ Products API ============
 
+function productFilterParams(filters?: ProductsFilter): URLSearchParams {
+  const params = new URLSearchParams();
+
+  if (filters?.category) params.append('category', filters.category);
+  if (filters?.search) params.append('search', filters.search);
+  if (filters?.min_price) params.append('min_price', String(filters.min_price));
+  if (filters?.max_price) params.append('max_price', String(filters.max_price));
+  if (filters?.in_stock) params.append('in_stock', 'true');
+
+  return params;
+}
+
 export const productsApi = {
   /**
    * Получить список категорий
@@ -220,20 +236,41 @@ export const productsApi = {
    * Получить список товаров
    */
   getProducts: (filters?: ProductsFilter) => {
-    const params = new URLSearchParams();
+    const params = productFilterParams(filters);
 
-    if (filters?.category) params.append('category', filters.category);
-    if (filters?.search) params.append('search', filters.search);
-    if (filters?.min_price) params.append('min_price', String(filters.min_price));
-    if (filters?.max_price) params.append('max_price', String(filters.max_price));
-    if (filters?.in_stock) params.append('in_stock', 'true');
     if (filters?.ordering) params.append('ordering', filters.ordering);
-    if (filters?.page) params.append('page', String(filters.page));
+    if (filters?.cursor) params.append('cursor', filters.cursor);
 
     const query = params.toString();
     return request<PaginatedResponse<Product>>(`/products/${query ? `?${query}` : ''}`);
   },
 
+  /**
+   * Товары по списку id (корзина, избранное) — актуальные цены и наличие
+   */
+  getProductsByIds: (ids: number[]) =>
+    request<PaginatedResponse<Product>>(`/products/?ids=${ids.join(',')}`),
+
+  /**
+   * URL и версия статического снимка каталога
+   */
+  getSnapshot: () =>
+    request<CatalogSnapshot>('/products/snapshot/'),
+
+  /**
+   * Изменения каталога с версии since (без since — reset)
+   */
+  getChanges: (since?: number) =>
+    request<CatalogChanges>(since === undefined ? '/products/changes/' : `/products/changes/?since=${since}`),
+
+  /**
+   * Фасеты для фильтров: количество по категориям, диапазон цен, в наличии
+   */
+  getFacets: (filters?: ProductsFilter) => {
+    const query = productFilterParams(filters).toString();
+    return request<ProductFacets>(`/products/facets/${query ? `?${query}` : ''}`);
+  },
+
   /**
    * Получить товар по slug
    */
@@ -313,14 +350,14 @@ export const favoritesApi = {
   /**
    * Получить историю действий с избранным
    */
-  getHistory: () =>
-    request<{
+  getHistory: (cursor?: string) =>
+    request<PaginatedResponse<{
       id: number;
       product: Product;
       action: 'added' | 'removed';
       action_display: string;
       created_at: string;
-    }[]>('/products/favorites/history/'),
+    }>>(`/products/favorites/history/${cursor ? `?cursor=${encodeURIComponent(cursor)}` : ''}`),
 };
 
 // ============ Auth API ============
@@ -370,12 +407,23 @@ export const pagesApi = {
     request<PageContent>(`/pages/${slug}/`),
 };
 
+// ============ Bootstrap API ============
+
+export const bootstrapApi = {
+  /**
+   * Пользователь, категории, первая страница каталога, избранное и страницы
+   */
+  get: () =>
+    request<Bootstrap>('/bootstrap/'),
+};
+
 // ============ Export ============
 
 export const api = {
   products: productsApi,
   orders: ordersApi,
   auth: authApi,
+  bootstrap: bootstrapApi,
   favorites: favoritesApi,
   pages: pagesApi,
 };
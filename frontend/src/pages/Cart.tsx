@@ -1,4 +1,4 @@
-import { useState } from 'react';
+import { useEffect, useState } from 'react';
 import { Link } from 'react-router-dom';
 import { ShoppingBag, Tag, X } from 'lucide-react';
 import { Button } from '@/components/ui/button';
@@ -8,6 +8,7 @@ import { BottomNav } from '@/components/shop/BottomNav';
 import { CartItemComponent } from '@/components/shop/CartItem';
 import { EmptyState } from '@/components/shop/EmptyState';
 import { useCartStore } from '@/stores/cartStore';
+import { productsApi } from '@/lib/api';
 import { hapticFeedback } from '@/lib/telegram';
 import { toast } from 'sonner';
 import { formatPrice } from '@/lib/utils';
@@ -29,8 +30,19 @@ export default function CartPage() {
     removePromo,
     getSubtotal,
     getDiscount,
-    getTotal 
+    getTotal,
+    syncProducts
   } = useCartStore();
+
+  // Одним запросом сверяем цены и наличие товаров корзины
+  const productIds = items.map(item => item.product_id).join(',');
+  useEffect(() => {
+    if (!productIds) return;
+    productsApi
+      .getProductsByIds(productIds.split(',').map(Number))
+      .then(({ results }) => syncProducts(results))
+      .catch(() => undefined);
+  }, [productIds, syncProducts]);
   
   const handleApplyPromo = async () => {
     if (!promoInput.trim()) return;
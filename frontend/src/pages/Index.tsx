@@ -41,7 +41,6 @@ const Index = () => {
 
   // Собираем все товары из всех загруженных страниц
   const products = productsData?.pages.flatMap(page => page.results) || [];
-  const totalCount = productsData?.pages[0]?.count || 0;
 
   // IntersectionObserver для автоматической подгрузки
   const handleObserver = useCallback(
@@ -175,7 +174,7 @@ const Index = () => {
               {/* Показываем счётчик только когда загружены не все товары */}
               {!hasNextPage && products.length > 0 && (
                 <div className="mt-6 text-center text-sm text-muted-foreground">
-                  Показаны все {totalCount} товаров
+                  Показаны все {products.length} товаров
                 </div>
               )}
             </>
@@ -32,15 +32,17 @@ const Profile = () => {
   const { data: ordersData } = useOrders();
   const telegramUser = getTelegramUser();
 
-  const ordersCount = ordersData?.count || 0;
+  // Первая страница заказов; если есть следующая — показываем «20+»
+  const ordersCount = ordersData?.results.length || 0;
+  const ordersLabel = ordersData?.next ? `${ordersCount}+` : `${ordersCount}`;
 
   const menuItems: MenuItem[] = [
     {
       icon: Package,
       label: 'Мои заказы',
       link: '/orders',
-      badge: ordersCount > 0 ? ordersCount : undefined,
-      description: ordersCount > 0 ? `${ordersCount} заказов` : 'Нет заказов'
+      badge: ordersCount > 0 ? ordersLabel : undefined,
+      description: ordersCount > 0 ? `${ordersLabel} заказов` : 'Нет заказов'
     },
     {
       icon: Heart,
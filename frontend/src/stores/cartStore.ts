@@ -11,6 +11,7 @@ interface CartState {
   removeItem: (productId: number) => void;
   updateQuantity: (productId: number, quantity: number) => void;
   clearCart: () => void;
+  syncProducts: (products: Product[]) => void;
   applyPromo: (promo: PromoCode) => void;
   removePromo: () => void;
   
@@ -84,6 +85,17 @@ export const useCartStore = create<CartState>()(
         set({ items: [], promoCode: null });
       },
       
+      syncProducts: (products: Product[]) => {
+        // Актуальные цены и наличие с сервера поверх сохранённых в localStorage
+        const fresh = new Map(products.map(product => [product.id, product]));
+        set((state) => ({
+          items: state.items.map(item => {
+            const product = fresh.get(item.product_id);
+            return product ? { ...item, product: { ...item.product, ...product } } : item;
+          }),
+        }));
+      },
+      
       applyPromo: (promo: PromoCode) => {
         set({ promoCode: promo });
       },
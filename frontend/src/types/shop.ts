@@ -8,6 +8,22 @@ export interface Category {
   products_count?: number;
 }
 
+// Фасеты каталога: каждый считается без своего фильтра
+export interface CategoryFacet {
+  id: number;
+  title: string;
+  slug: string;
+  count: number;
+}
+
+export interface ProductFacets {
+  total: number;
+  in_stock: number;
+  min_price: number | null;  // копейки
+  max_price: number | null;
+  categories: CategoryFacet[];
+}
+
 export interface ProductImage {
   id: number;
   url: string;
@@ -38,6 +54,7 @@ export interface Product {
     slug: string;
   };
   created_at?: string;
+  is_favorite?: boolean;  // только для авторизованных
 }
 
 export interface CartItem {
@@ -109,6 +126,35 @@ export interface User {
   username?: string;
 }
 
+// GET /products/snapshot/ — статический снимок каталога в хранилище
+export interface CatalogSnapshot {
+  version: number;
+  changes_version?: number;  // since для /products/changes/ после загрузки снимка
+  url: string;  // JSON, сжатый gzip: { version, changes_version, built_at, categories, products }
+  built_at: string;
+  products_count: number;
+  size: number;
+}
+
+// GET /products/changes/?since= — изменения каталога с версии since
+export interface CatalogChanges {
+  version: number;  // since для следующего запроса
+  reset: boolean;   // история недоступна — загрузить каталог целиком
+  products: Product[];
+  categories: Category[];
+  removed: { products: number[]; categories: number[] };
+}
+
+// GET /bootstrap/ — стартовые данные одним запросом
+export interface Bootstrap {
+  user: User | null;
+  tokens: { access: string; refresh: string } | null;  // если авторизовались по initData
+  categories: Category[];
+  products: PaginatedResponse<Product>;
+  favorites: number[];  // id товаров
+  pages: string[];  // slug активных страниц
+}
+
 // API Request types
 export interface ProductsFilter {
   category?: string;  // slug
@@ -117,7 +163,7 @@ export interface ProductsFilter {
   max_price?: number;
   in_stock?: boolean;
   ordering?: string;
-  page?: number;
+  cursor?: string;  // из next предыдущей страницы
 }
 
 export interface CheckoutData {
@@ -133,9 +179,8 @@ export interface CheckoutData {
 }
 
 // API Response types
+// Keyset-пагинация: следующая страница — по ссылке next (с параметром cursor)
 export interface PaginatedResponse<T> {
-  count: number;
   next: string | null;
-  previous: string | null;
   results: T[];
 }